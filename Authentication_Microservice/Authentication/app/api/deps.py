@@ -1,30 +1,34 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError
-from sqlalchemy.orm import Session
+from redis import RedisError
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import verify_access_token
-from app.core.db import get_db
-from app.crud import get_user_by_email
+from app.core.config import settings
+from app.core.security import verify_access_token, TOKEN_CLAIMS_VERSION
+from app.core.db import get_async_db
+from app.crud import get_user_by_email_async
+from app.models import TokenUser
+from app.services.token_versions import get_token_version_async
 
 # OAuth2 Password Bearer for extracting the token from headers
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
 
 
-# General dependency to get the current user
-def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db),
-):
+async def _authenticate(token: str, db: AsyncSession, fresh: bool):
     """
-    Dependency to get the current logged-in user from the provided JWT token.
-    
+    Resolve the user identified by a JWT token.
+
     Args:
         token (str): The JWT token passed in the Authorization header.
-        db (Session): The database session.
+        db (AsyncSession): The async database session.
+        fresh (bool): Always load the user row, even when the token carries the user's claims.
 
     Returns:
-        User object if the token is valid and the user exists, else raises HTTPException.
+        TokenUser built from the token claims in stateless mode, otherwise the IndividualUser row.
+
+    Raises:
+        HTTPException: If the token is invalid or revoked, or the user does not exist.
     """
     try:
         # Decode the JWT token and verify the payload
@@ -43,17 +47,38 @@ def get_current_user(
                 detail="Invalid token: missing email information",
                 headers={"WWW-Authenticate": "Bearer"},
             )
+
+        # Tokens issued before the token version field existed count as version 0
+        token_version = payload.get("tv", 0)
+
+        # The signature proves the claims, so skip the database when the token carries them
+        # and Redis confirms its token version is still current
+        if not fresh and settings.JWT_STATELESS_AUTH and payload.get("ver") == TOKEN_CLAIMS_VERSION:
+            try:
+                if token_version >= await get_token_version_async(email):
+                    return TokenUser.from_claims(payload)
+            except RedisError:
+                pass  # Check the version against the user row instead
         
         # Retrieve user from the database
-        user = get_user_by_email(email=email, db=db)
+        user = await get_user_by_email_async(email=email, db=db)
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User not found",
             )
 
+        if token_version != user.token_version:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Token has been revoked",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+
         return user
     
+    except HTTPException:
+        raise
     except JWTError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -68,19 +93,59 @@ def get_current_user(
         )
 
 
+# General dependency to get the current user
+async def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Dependency to get the current logged-in user from the provided JWT token.
+
+    With `JWT_STATELESS_AUTH` enabled, tokens that carry the user's claims are trusted
+    as-is and no database query is made; use `get_current_user_fresh` for endpoints
+    that need the current user row.
+    
+    Args:
+        token (str): The JWT token passed in the Authorization header.
+        db (AsyncSession): The async database session.
+
+    Returns:
+        TokenUser or User object if the token is valid and the user exists, else raises HTTPException.
+    """
+    return await _authenticate(token, db, fresh=False)
+
+
+# Dependency that always loads the user from the database
+async def get_current_user_fresh(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Dependency to get the current logged-in user's database row from the provided JWT token.
+
+    Args:
+        token (str): The JWT token passed in the Authorization header.
+        db (AsyncSession): The async database session.
+
+    Returns:
+        User object if the token is valid and the user exists, else raises HTTPException.
+    """
+    return await _authenticate(token, db, fresh=True)
+
+
 # Dependency for specific individual user type
-def get_current_individual_user(
+async def get_current_individual_user(
     token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Dependency to get the current individual user based on the provided token.
     
     Args:
         token (str): The JWT token passed in the Authorization header.
-        db (Session): The database session.
+        db (AsyncSession): The async database session.
 
     Returns:
-        IndividualUser object if the token is valid and the user exists, else raises HTTPException.
+        TokenUser or IndividualUser object if the token is valid and the user exists, else raises HTTPException.
     """
-    return get_current_user(token=token, db=db)
+    return await get_current_user(token=token, db=db)
@@ -1,27 +1,28 @@
 from fastapi import APIRouter, Depends, HTTPException
 
-from app.models import IndividualUser
+from app.models import IndividualUser, TokenUser
 from app.api.deps import get_current_individual_user
 
 router = APIRouter()
 
 
 @router.get("/dashboard", response_model=dict)
-def get_individual_dashboard(
-    current_user: IndividualUser = Depends(get_current_individual_user)
+async def get_individual_dashboard(
+    current_user: IndividualUser | TokenUser = Depends(get_current_individual_user)
 ):
     """
     Endpoint to get the individual user's dashboard.
 
     Args:
-        current_user (IndividualUser): The current authenticated user.
+        current_user (IndividualUser | TokenUser): The current authenticated user; in stateless
+            JWT mode this comes straight from the token claims without a database query.
 
     Returns:
         dict: A dictionary containing the user's dashboard data.
     """
 
     # Check if the user is an individual user
-    if not isinstance(current_user, IndividualUser):
+    if not isinstance(current_user, (IndividualUser, TokenUser)):
         raise HTTPException(status_code=403, detail="Access forbidden")
     
     # Ensure the user exists and has necessary attributes
@@ -1,13 +1,17 @@
-from fastapi import Depends, HTTPException, APIRouter, Request
+from fastapi import BackgroundTasks, Depends, HTTPException, APIRouter, Request
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import timedelta
 import logging
 
-from app.core.db import get_db
+from app.core.db import get_db, get_async_db
 from app.models import IndividualSignUp, UserLogin
-from app.crud import create_user, get_user_by_email
+from app.crud import create_user_async, get_user_by_email, get_user_by_email_async, mark_user_verified, update_user_password_hash_async
 from app.utils import *
-from app.core.security import hash_password, verify_password, create_access_token
+from app.core.security import hash_password_async, verify_and_update_password_async, create_access_token, build_access_token_claims
+from app.services.user_events import publish_user_event, USER_VERIFIED
+from app.services.email_queue import enqueue_verification_email
 
 router = APIRouter()
 
@@ -16,25 +20,33 @@ logger = logging.getLogger(__name__)
 
 # Signup route for individual users
 @router.post("/signup")
-def signup_individual(
+async def signup_individual(
     user: IndividualSignUp, 
     request: Request, 
-    db: Session = Depends(get_db)
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Handles the signup process for individual users. It validates the phone number, checks password strength, 
     hashes the password, creates a new user in the database, and sends a verification email to the user.
+    Hashing runs in the bcrypt process pool and the user is inserted with a single `INSERT ... ON CONFLICT
+    DO NOTHING RETURNING` through the async engine, so a duplicate email or phone number is reported as a
+    409 without a failed commit. The verification email is queued for the background email worker, so the
+    response is returned as soon as the user row is committed and an SMTP outage does not fail the signup.
 
     Args:
         user (IndividualSignUp): The user data including username, email, phone number, and password.
         request (Request): The request object, used for generating the verification link.
-        db (Session): The database session dependency.
+        background_tasks (BackgroundTasks): Used to send the email after the response if the queue is unavailable.
+        db (AsyncSession): The async database session dependency.
 
     Returns:
         dict: A message indicating the success of the user signup and verification email sending.
 
     Raises:
-        HTTPException: If an error occurs during any of the validation, user creation, or email sending processes.
+        HTTPException: If an error occurs during any of the validation, user creation, or email sending processes,
+                       409 if the email or phone number is already registered,
+                       or 503 if the password hashing pool is saturated.
     """
     try:
         # Validate phone number format
@@ -44,17 +56,18 @@ def signup_individual(
         validate_password_strength(user.password)
 
         # Hash the password before storing it in the database
-        hashed_password = hash_password(user.password)
+        hashed_password = await hash_password_async(user.password)
 
         # Create new user in the database
-        db_user = create_user(user, hashed_password, db)
+        db_user = await create_user_async(user, hashed_password, db)
 
         # Generate a verification token for email verification
         token = generate_verification_token(user.email)
         verification_link = str(request.url_for("verify-email")) + f"?token={token}"
 
-        # Send verification email to the user
-        send_verification_email(user.username, user.email, verification_link)
+        # Queue the verification email, falling back to sending it after the response
+        if not await run_in_threadpool(enqueue_verification_email, user.username, user.email, verification_link):
+            background_tasks.add_task(send_verification_email, user.username, user.email, verification_link)
 
         # Send SMS verification code (Implement the logic)
         # send_sms(user.phone_number, "Your verification code is: 123456")
@@ -62,6 +75,9 @@ def signup_individual(
 
         return {"message": f"Individual user {user.email} signed up successfully. Verification email sent!"}
 
+    except HTTPException:
+        # Validation errors, conflicts (409) and pool saturation (503) keep their own status codes
+        raise
     except Exception as e:
         # Log the exception and raise an internal server error
         logger.error(f"Error during user signup for {user.email}: {str(e)}")
@@ -71,6 +87,7 @@ def signup_individual(
 def resend_verification_email(
     email: str, 
     request: Request, 
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
 ):
     """
@@ -79,6 +96,7 @@ def resend_verification_email(
     Args:
         email (str): The email address of the user who requested to resend the verification email.
         request (Request): The request object, used for generating the verification link.
+        background_tasks (BackgroundTasks): Used to send the email after the response if the queue is unavailable.
         db (Session): The database session dependency.
 
     Returns:
@@ -109,8 +127,9 @@ def resend_verification_email(
         token = generate_verification_token(email)
         verification_link = str(request.url_for("verify-email")) + f"?token={token}"
 
-        # Resend the verification email
-        send_verification_email(user.username, user.email, verification_link)
+        # Queue the verification email, falling back to sending it after the response
+        if not enqueue_verification_email(user.username, user.email, verification_link):
+            background_tasks.add_task(send_verification_email, user.username, user.email, verification_link)
 
         return {"message": f"Verification email resent to {email}. Please check your inbox."}
 
@@ -124,7 +143,7 @@ def resend_verification_email(
 @router.get("/verify-email", name="verify-email")
 def verify_email(token: str, db: Session = Depends(get_db)):
     """
-    Verifies the user's email using a token.
+    Verifies the user's email using a token, with a single `UPDATE ... RETURNING`.
 
     Args:
         token (str): The email verification token.
@@ -140,35 +159,29 @@ def verify_email(token: str, db: Session = Depends(get_db)):
         # Decode the email from the token
         email = decode_verification_token(token)
 
-        # Get user from the database
-        user = get_user_by_email(email, db)
-        if not user:
-            raise HTTPException(status_code=404, detail="User not found")
-
-        # Mark the email as verified
-        user.is_email_verified = True
-
-        # Mark the phone number as verified (for now, this is a placeholder)
-        user.is_phone_verified = True
+        # Mark the email as verified, and the phone number too (for now, this is a placeholder)
+        username = mark_user_verified(email, db)
 
-        # Commit the changes to the database
-        db.commit()
+        # Notify other services so they refresh any cached validation result
+        publish_user_event(USER_VERIFIED, email, username=username)
 
         return {"message": f"Email {email} verified successfully!"}
 
+    except HTTPException:
+        raise
     except Exception as e:
         # Log the exception or raise it for debugging purposes
         raise HTTPException(status_code=500, detail="Error verifying email.") from e
 
 # Route to validate user by email
 @router.get("/validate-user/{email}")
-def validate_user(email: str, db: Session = Depends(get_db)):
+async def validate_user(email: str, db: AsyncSession = Depends(get_async_db)):
     """
     Validates the user by checking if their email and phone number are verified.
 
     Args:
         email (str): The email of the user to validate.
-        db (Session): The database session.
+        db (AsyncSession): The async database session.
 
     Returns:
         dict: A message indicating if the user is valid and verified.
@@ -177,7 +190,7 @@ def validate_user(email: str, db: Session = Depends(get_db)):
         HTTPException: If the user does not exist or if the email or phone number is not verified.
     """
     # Retrieve user by email
-    user = get_user_by_email(email, db)
+    user = await get_user_by_email_async(email, db)
 
     if not user:
         raise HTTPException(status_code=404, detail="User not found.")
@@ -194,27 +207,34 @@ def validate_user(email: str, db: Session = Depends(get_db)):
 
 # Login route for individual users
 @router.post("/login")
-def login_individual(user: UserLogin, db: Session = Depends(get_db)):
+async def login_individual(user: UserLogin, db: AsyncSession = Depends(get_async_db)):
     """
     Logs in an individual user by validating their credentials and issuing a JWT token.
+    The bcrypt check runs in the password hashing process pool, off the event loop. If the stored
+    hash uses an outdated algorithm or cost, it is transparently replaced with a fresh one.
 
     Args:
         user (UserLogin): User login details (email and password).
-        db (Session): The database session.
+        db (AsyncSession): The async database session.
 
     Returns:
         dict: An access token and token type if the credentials are valid.
 
     Raises:
-        HTTPException: If the credentials are invalid, or if the email or phone number is not verified.
+        HTTPException: If the credentials are invalid, or if the email or phone number is not verified,
+                       or 503 if the password hashing pool is saturated.
     """
     # Retrieve user by email
-    user_in_db = get_user_by_email(user.email, db)
+    user_in_db = await get_user_by_email_async(user.email, db)
+
+    if not user_in_db:
+        raise HTTPException(status_code=400, detail="Invalid credentials")
 
     # Validate user credentials
-    if not user_in_db or not verify_password(user.password, user_in_db.hashed_password):
+    is_valid, new_hash = await verify_and_update_password_async(user.password, user_in_db.hashed_password)
+    if not is_valid:
         raise HTTPException(status_code=400, detail="Invalid credentials")
-    
+
     # Check if the email is verified
     if not user_in_db.is_email_verified:
         raise HTTPException(status_code=403, detail="Email not verified.")
@@ -225,7 +245,15 @@ def login_individual(user: UserLogin, db: Session = Depends(get_db)):
     
     # Generate access token with a 30-minute expiry
     access_token_expires = timedelta(minutes=30)
-    access_token = create_access_token(data={"sub": user_in_db.email}, expires_delta=access_token_expires)
+    access_token = create_access_token(data=build_access_token_claims(user_in_db), expires_delta=access_token_expires)
+
+    # Upgrade the stored hash to the current algorithm/cost; a failure here must not block the login.
+    # The token is built first because a failed upgrade rolls back and expires `user_in_db`.
+    if new_hash:
+        try:
+            await update_user_password_hash_async(user_in_db.id, user_in_db.hashed_password, new_hash, db)
+        except Exception as e:
+            logger.warning(f"Could not upgrade password hash for {user.email}: {str(e)}")
     
     return {
         "access_token": access_token,
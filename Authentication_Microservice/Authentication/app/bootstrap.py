@@ -0,0 +1,81 @@
+import asyncio
+import logging
+
+from sqlalchemy import inspect, text
+from sqlalchemy.schema import CreateColumn
+
+import app.models  # noqa: F401  (registers the tables on Base.metadata)
+from app.core.db import engine, async_engine, Base
+from app.services.readiness import readiness
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Arbitrary key for the advisory lock that serialises concurrent bootstrap runs
+BOOTSTRAP_LOCK_KEY = 0x6175746801
+
+def add_missing_columns(conn):
+    """
+    Adds model columns that an existing table does not have yet, e.g. columns
+    introduced after the table was first created.
+
+    Args:
+        conn: The connection to alter the tables with.
+    """
+    inspector = inspect(conn)
+    preparer = conn.dialect.identifier_preparer
+    for table in Base.metadata.sorted_tables:
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name not in existing:
+                logger.info(f"Adding column {table.name}.{column.name}")
+                definition = CreateColumn(column).compile(dialect=conn.dialect)
+                conn.execute(text(f"ALTER TABLE {preparer.format_table(table)} ADD COLUMN {definition}"))
+
+def bootstrap_schema(bind=engine):
+    """
+    Creates any missing tables, columns and indexes. Safe to run repeatedly.
+
+    `create_all` only creates tables that do not exist, with their indexes, so columns
+    and indexes added to an existing table are created individually afterwards.
+    Everything runs in one transaction, under an advisory lock on PostgreSQL so
+    parallel runs do not race.
+
+    Args:
+        bind: The engine to create the schema with.
+    """
+    with bind.begin() as conn:
+        if conn.dialect.name == "postgresql":
+            conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": BOOTSTRAP_LOCK_KEY})
+
+        Base.metadata.create_all(bind=conn)
+        add_missing_columns(conn)
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(bind=conn, checkfirst=True)
+
+    logger.info("Database schema is up to date.")
+
+async def wait_for_database():
+    """
+    Waits for PostgreSQL, then releases the async pool opened by the checks.
+    """
+    try:
+        await readiness.wait_until_ready()
+    finally:
+        await async_engine.dispose()
+
+def main():
+    """
+    One-shot schema bootstrap: `python -m app.bootstrap`.
+
+    Waits for PostgreSQL, then creates missing tables and indexes. Run it once per
+    deploy (e.g. as a compose init service) instead of on every replica start.
+    """
+    asyncio.run(wait_for_database())
+    bootstrap_schema()
+
+
+if __name__ == "__main__":
+    main()
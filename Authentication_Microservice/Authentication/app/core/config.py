@@ -20,6 +20,20 @@ class Settings(BaseSettings):
     JWT_SECRET_KEY: str = os.getenv("JWT_SECRET_KEY")
     JWT_ALGORITHM: str = os.getenv("JWT_ALGORITHM")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES")
+    JWT_STATELESS_AUTH: bool = os.getenv("JWT_STATELESS_AUTH", False)  # Trust user claims in the token instead of loading the user per request
+    JWT_CACHE_MAX_SIZE: int = os.getenv("JWT_CACHE_MAX_SIZE", 10000)  # Verified tokens kept per process; 0 disables the cache
+    TOKEN_VERSION_KEY_PREFIX: str = os.getenv("TOKEN_VERSION_KEY_PREFIX", "auth:token-version")  # Redis keys holding each user's current token version
+
+    # Password hashing algorithm and cost; measure with `python -m app.services.hash_benchmark`
+    PASSWORD_HASH_SCHEMES: str = os.getenv("PASSWORD_HASH_SCHEMES", "bcrypt")  # First scheme hashes new passwords, the rest are verified and upgraded on login
+    PASSWORD_BCRYPT_ROUNDS: int = os.getenv("PASSWORD_BCRYPT_ROUNDS", 12)
+    PASSWORD_ARGON2_TIME_COST: int = os.getenv("PASSWORD_ARGON2_TIME_COST", 3)
+    PASSWORD_ARGON2_MEMORY_COST: int = os.getenv("PASSWORD_ARGON2_MEMORY_COST", 65536)  # KiB
+    PASSWORD_ARGON2_PARALLELISM: int = os.getenv("PASSWORD_ARGON2_PARALLELISM", 4)
+
+    # Password hashing process pool
+    PASSWORD_HASH_WORKERS: int = os.getenv("PASSWORD_HASH_WORKERS", os.cpu_count() or 1)
+    PASSWORD_HASH_MAX_PENDING: int = os.getenv("PASSWORD_HASH_MAX_PENDING", 64)  # Hash/verify calls queued before returning 503
 
     # Secret Key for serialisation
     SECRET_KEY:str = os.getenv("SECRET_KEY")
@@ -31,6 +45,16 @@ class Settings(BaseSettings):
     DB_PORT: int = os.getenv("DB_PORT")
     DB_NAME: str = os.getenv("DB_NAME")
 
+    # Connection pool tuning (applies to both the sync and the async engine)
+    DB_POOL_SIZE: int = os.getenv("DB_POOL_SIZE", 5)
+    DB_MAX_OVERFLOW: int = os.getenv("DB_MAX_OVERFLOW", 10)
+    DB_POOL_TIMEOUT: float = os.getenv("DB_POOL_TIMEOUT", 30)  # Seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = os.getenv("DB_POOL_RECYCLE", 1800)  # Seconds before a connection is replaced
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", True)
+    DB_CONNECT_TIMEOUT: float = os.getenv("DB_CONNECT_TIMEOUT", 10)
+    DB_COMMAND_TIMEOUT: float = os.getenv("DB_COMMAND_TIMEOUT", 30)  # asyncpg per-statement timeout
+    DB_STATEMENT_CACHE_SIZE: int = os.getenv("DB_STATEMENT_CACHE_SIZE", 100)  # Set to 0 behind a transaction-mode pooler (PgBouncer/Supavisor)
+
     # Email settings for sending emails
     SMTP_SERVER: str = os.getenv("SMTP_SERVER")
     SMTP_PORT: int = os.getenv("SMTP_PORT")
@@ -38,14 +62,62 @@ class Settings(BaseSettings):
     SMTP_PASSWORD: str = os.getenv("SMTP_PASSWORD")
     EMAIL_FROM: str = os.getenv("EMAIL_FROM")
     EMAIL_FROM_NAME: str = os.getenv("EMAIL_FROM_NAME")
+    SMTP_TIMEOUT: float = os.getenv("SMTP_TIMEOUT", 30)
+
+    # Background email queue (Redis list drained by an asyncio worker)
+    EMAIL_QUEUE_ENABLED: bool = os.getenv("EMAIL_QUEUE_ENABLED", True)  # When false or Redis is down, emails are sent as FastAPI background tasks
+    EMAIL_WORKER_EMBEDDED: bool = os.getenv("EMAIL_WORKER_EMBEDDED", True)  # Drain the queue inside the API process
+    EMAIL_QUEUE_KEY: str = os.getenv("EMAIL_QUEUE_KEY", "auth:email-queue")
+    EMAIL_MAX_ATTEMPTS: int = os.getenv("EMAIL_MAX_ATTEMPTS", 5)
+    EMAIL_RETRY_BACKOFF: float = os.getenv("EMAIL_RETRY_BACKOFF", 10)  # Seconds before the first retry, doubled on each attempt
+    EMAIL_WORKER_HEARTBEAT_TTL: float = os.getenv("EMAIL_WORKER_HEARTBEAT_TTL", 30)  # Seconds without a heartbeat before a worker's in-flight jobs are requeued
+    EMAIL_WORKER_STOP_TIMEOUT: float = os.getenv("EMAIL_WORKER_STOP_TIMEOUT", 60)  # Seconds shutdown waits for the in-flight email before cancelling it
 
     # Grpc setup
     GRPC_PORT: int = os.getenv("GRPC_PORT")
+    GRPC_EMBEDDED: bool = os.getenv("GRPC_EMBEDDED", True)  # Run the gRPC server inside the FastAPI process
+    GRPC_MAX_CONCURRENT_RPCS: int = os.getenv("GRPC_MAX_CONCURRENT_RPCS", 1000)
+    GRPC_MAX_CONCURRENT_STREAMS: int = os.getenv("GRPC_MAX_CONCURRENT_STREAMS", 100)
+    GRPC_SHUTDOWN_GRACE: float = os.getenv("GRPC_SHUTDOWN_GRACE", 5.0)
+    GRPC_WORKERS: int = os.getenv("GRPC_WORKERS", 1)  # Processes started by `python -m app.grpc_server`
+    GRPC_REUSE_PORT: bool = os.getenv("GRPC_REUSE_PORT", True)  # Let several processes bind GRPC_PORT (SO_REUSEPORT)
+
+    # Redis configuration for publishing user-change events
+    REDIS_HOST: str = os.getenv("REDIS_HOST")
+    REDIS_PORT: int = os.getenv("REDIS_PORT")
+    USER_EVENTS_CHANNEL: str = os.getenv("USER_EVENTS_CHANNEL", "auth:user-events")
+
+    # Prometheus metrics port for processes without the HTTP API (`python -m app.grpc_server`); 0 disables
+    METRICS_PORT: int = os.getenv("METRICS_PORT", 0)
+
+    # Distributed tracing (OpenTelemetry). The OTLP exporter reads the standard OTEL_EXPORTER_OTLP_* variables
+    TRACING_EXPORTERS: str = os.getenv("TRACING_EXPORTERS", "")  # Comma-separated: console, file, otlp; empty disables tracing
+    TRACING_FILE_PATH: str = os.getenv("TRACING_FILE_PATH", "traces.jsonl")  # JSON lines written by the "file" exporter
+    TRACING_SAMPLE_RATIO: float = os.getenv("TRACING_SAMPLE_RATIO", 1.0)  # Fraction of new traces recorded
+
+    # Opt-in request profiling (see app.core.profiling)
+    PROFILING_SECRET: str = os.getenv("PROFILING_SECRET", "")  # Signs X-Profile tokens; empty disables header-triggered profiles
+    PROFILING_SAMPLE_RATE: float = os.getenv("PROFILING_SAMPLE_RATE", 0)  # Fraction of all requests profiled without a token
+    PROFILING_INTERVAL: float = os.getenv("PROFILING_INTERVAL", 0.005)  # Seconds between stack samples
+    PROFILING_DIR: str = os.getenv("PROFILING_DIR", "profiles")
+    PROFILING_MAX_FILES: int = os.getenv("PROFILING_MAX_FILES", 100)  # Oldest profiles are deleted beyond this
+
+    # Startup and readiness probes
+    STARTUP_TIMEOUT: float = os.getenv("STARTUP_TIMEOUT", 60)  # Seconds to wait for dependencies before giving up
+    STARTUP_MAX_BACKOFF: float = os.getenv("STARTUP_MAX_BACKOFF", 5)  # Cap on the delay between dependency checks
+    READINESS_CHECK_TIMEOUT: float = os.getenv("READINESS_CHECK_TIMEOUT", 2)
+    # Redis only carries the email queue and user-change events, both of which degrade gracefully
+    READINESS_REDIS_REQUIRED: bool = os.getenv("READINESS_REDIS_REQUIRED", False)  # Whether the service is unready while Redis is down
+    SCHEMA_BOOTSTRAP_ON_STARTUP: bool = os.getenv("SCHEMA_BOOTSTRAP_ON_STARTUP", False)  # Local development only; deployments run `python -m app.bootstrap`
 
     @property
     def SUPABASE_DATABASE_URL(self) -> str:
         return f"postgresql+psycopg2://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
 
+    @property
+    def SUPABASE_ASYNC_DATABASE_URL(self) -> str:
+        return f"postgresql+asyncpg://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
+
     class Config:
         env_file = ".env"
 
@@ -1,19 +1,60 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from fastapi import HTTPException
+from fastapi.exceptions import RequestValidationError
 
 from app.core.config import settings
+from app.core.metrics import instrument_engine
+from app.core.tracing import trace_engine
 
 # Database connection URL from settings
 SQLALCHEMY_DATABASE_URL = settings.SUPABASE_DATABASE_URL
 
+# Pool settings shared by the sync and async engines
+POOL_OPTIONS = {
+    "pool_size": settings.DB_POOL_SIZE,
+    "max_overflow": settings.DB_MAX_OVERFLOW,
+    "pool_timeout": settings.DB_POOL_TIMEOUT,
+    "pool_recycle": settings.DB_POOL_RECYCLE,
+    "pool_pre_ping": settings.DB_POOL_PRE_PING,
+}
+
 # Create the database engine
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL,
+    connect_args={"connect_timeout": int(settings.DB_CONNECT_TIMEOUT)},
+    **POOL_OPTIONS,
+)
 
 # SessionLocal factory to create a new session instance
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async (asyncpg) engine and session factory for code running on an event loop.
+# Both asyncpg's own statement cache and SQLAlchemy's prepared statement cache
+# follow DB_STATEMENT_CACHE_SIZE, so setting it to 0 makes the engine safe to
+# use behind a transaction-mode connection pooler.
+async_engine = create_async_engine(
+    make_url(settings.SUPABASE_ASYNC_DATABASE_URL).update_query_dict(
+        {"prepared_statement_cache_size": str(settings.DB_STATEMENT_CACHE_SIZE)}
+    ),
+    connect_args={
+        "timeout": settings.DB_CONNECT_TIMEOUT,
+        "command_timeout": settings.DB_COMMAND_TIMEOUT,
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+    },
+    **POOL_OPTIONS,
+)
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+# Time every statement run by either engine, and trace those run inside a traced request
+instrument_engine(engine, "sync")
+instrument_engine(async_engine.sync_engine, "async")
+trace_engine(engine)
+trace_engine(async_engine.sync_engine)
+
 # Base class for all models
 Base = declarative_base()
 
@@ -32,3 +73,19 @@ def get_db():
         raise HTTPException(status_code=500, detail=f"Database connection error: {str(e)}")
     finally:
         db.close()
+
+async def get_async_db():
+    """
+    Dependency to retrieve an async DB session for each request.
+
+    Routes using this session await Postgres I/O on the event loop instead of
+    holding a threadpool worker. The session is closed when the request completes.
+    """
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db  # Provides the async database session to the caller
+        except (HTTPException, RequestValidationError):
+            # Request errors pass through yield dependencies too; keep their 4xx responses
+            raise
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Database connection error: {str(e)}")
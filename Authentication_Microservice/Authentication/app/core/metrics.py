@@ -0,0 +1,183 @@
+import inspect
+import os
+import time
+
+# In multiprocess mode (several uvicorn or gRPC workers) every process writes its
+# samples under this directory and /metrics aggregates them
+if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+    os.makedirs(os.environ["PROMETHEUS_MULTIPROC_DIR"], exist_ok=True)
+
+import grpc
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Gauge, Histogram, generate_latest, multiprocess
+from sqlalchemy import event
+from starlette.responses import Response
+
+# Latency buckets in seconds, from sub-millisecond cache hits to multi-second bcrypt queues
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Route label for requests that did not match any route, so 404 scans cannot blow up label cardinality
+UNMATCHED_ROUTE = "<unmatched>"
+
+# The histogram's _count series doubles as the request counter per route and status code
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds", "HTTP request latency.", ["method", "route", "status"], buckets=LATENCY_BUCKETS,
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress", "HTTP requests currently being handled.", ["method"], multiprocess_mode="livesum",
+)
+DB_QUERY_DURATION = Histogram(
+    "db_query_duration_seconds", "Time spent executing SQL statements.", ["engine", "operation"], buckets=LATENCY_BUCKETS,
+)
+GRPC_SERVER_HANDLING = Histogram(
+    "grpc_server_handling_seconds", "gRPC server call latency.", ["method", "code"], buckets=LATENCY_BUCKETS,
+)
+
+
+class PrometheusMiddleware:
+    """
+    Pure ASGI middleware recording request count, latency and in-flight requests.
+
+    Requests are labelled with the matched route template (e.g. `/auth/validate-user/{email}`)
+    rather than the raw path. Labelled children are cached, since `labels()` dominates the
+    cost of recording; what is left is a few microseconds per request.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self._in_progress = {}
+        self._durations = {}
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        in_progress = self._in_progress.get(method)
+        if in_progress is None:
+            in_progress = self._in_progress[method] = HTTP_REQUESTS_IN_PROGRESS.labels(method)
+        in_progress.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            in_progress.dec()
+            # The router stores the matched route in the scope
+            key = (method, getattr(scope.get("route"), "path", UNMATCHED_ROUTE), status_code)
+            duration = self._durations.get(key)
+            if duration is None:
+                duration = self._durations[key] = HTTP_REQUEST_DURATION.labels(*key)
+            duration.observe(elapsed)
+
+
+def instrument_engine(engine, name: str):
+    """
+    Records the duration of every statement run by a SQLAlchemy engine.
+
+    Args:
+        engine: A sync `Engine`, or the `sync_engine` of an `AsyncEngine`.
+        name (str): Value of the `engine` label, e.g. "sync" or "async".
+    """
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        context._query_start = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - context._query_start
+        operation = statement.lstrip().split(None, 1)[0].upper() if statement else "UNKNOWN"
+        DB_QUERY_DURATION.labels(name, operation).observe(elapsed)
+
+
+class GrpcMetricsInterceptor(grpc.aio.ServerInterceptor):
+    """
+    Records the latency and status code of every unary and server-streaming call.
+    """
+
+    async def intercept_service(self, continuation, handler_call_details):
+        handler = await continuation(handler_call_details)
+        if handler is None:
+            return handler
+
+        method = handler_call_details.method.rsplit("/", 1)[-1]
+
+        if handler.unary_unary is not None:
+            return grpc.unary_unary_rpc_method_handler(
+                _timed_unary(handler.unary_unary, method),
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer,
+            )
+        if handler.unary_stream is not None:
+            return grpc.unary_stream_rpc_method_handler(
+                _timed_stream(handler.unary_stream, method),
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer,
+            )
+        return handler
+
+
+def _observe_grpc(method: str, context, start: float, failed: bool):
+    code = context.code()
+    if code is None:
+        label = "UNKNOWN" if failed else "OK"
+    else:
+        label = code.name if isinstance(code, grpc.StatusCode) else str(code)
+    GRPC_SERVER_HANDLING.labels(method, label).observe(time.perf_counter() - start)
+
+
+def _timed_unary(behavior, method: str):
+    async def wrapper(request, context):
+        start = time.perf_counter()
+        failed = True
+        try:
+            response = await behavior(request, context)
+            failed = False
+            return response
+        finally:
+            _observe_grpc(method, context, start, failed)
+    return wrapper
+
+
+def _timed_stream(behavior, method: str):
+    if inspect.isasyncgenfunction(behavior):
+        async def wrapper(request, context):
+            start = time.perf_counter()
+            failed = True
+            try:
+                async for response in behavior(request, context):
+                    yield response
+                failed = False
+            finally:
+                _observe_grpc(method, context, start, failed)
+        return wrapper
+
+    # Streaming handlers that write with `context.write()` are plain coroutines
+    return _timed_unary(behavior, method)
+
+
+def metrics_registry() -> CollectorRegistry:
+    """
+    Returns the registry to expose: the aggregate of all worker processes in multiprocess mode,
+    otherwise the default registry of this process.
+    """
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return registry
+    return REGISTRY
+
+
+def metrics_response() -> Response:
+    """
+    Renders the metrics in the Prometheus text exposition format.
+    """
+    return Response(generate_latest(metrics_registry()), media_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,237 @@
+# Identical in the Auth, Event and Videochat services; change all three copies together.
+import hashlib
+import hmac
+import logging
+import os
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from contextlib import contextmanager
+
+from app.core.config import settings
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Request header (and WebSocket query parameter) carrying a signed profiling token
+PROFILE_HEADER = "x-profile"
+
+# Threads that run sync endpoints and dependencies for the event loop
+WORKER_THREAD_NAME = "AnyIO worker thread"
+
+
+def profile_requested(token: str | None) -> bool:
+    """
+    Checks a profiling token from a request. Tokens are `<expiry>.<hmac-sha256 of expiry>`,
+    signed with `PROFILING_SECRET`; mint one with `python -m benchmarks.profile_token`.
+
+    Returns:
+        bool: True if profiling is enabled and the token is correctly signed and unexpired.
+    """
+    if not token or not settings.PROFILING_SECRET:
+        return False
+    expires, _, signature = token.partition(".")
+    if not expires.isdigit() or int(expires) < time.time():
+        return False
+    expected = hmac.new(settings.PROFILING_SECRET.encode(), expires.encode(), hashlib.sha256).hexdigest()
+    return hmac.compare_digest(signature, expected)
+
+def profile_sampled() -> bool:
+    """
+    Returns True for a random `PROFILING_SAMPLE_RATE` fraction of calls.
+    """
+    return settings.PROFILING_SAMPLE_RATE > 0 and random.random() < settings.PROFILING_SAMPLE_RATE
+
+def profiling_enabled() -> bool:
+    """
+    Returns whether any request can be profiled, i.e. a secret or a sample rate is configured.
+    """
+    return bool(settings.PROFILING_SECRET) or settings.PROFILING_SAMPLE_RATE > 0
+
+
+class StackSampler:
+    """
+    Wall-clock sampling profiler.
+
+    A background thread records the Python stack of the target thread every `interval`
+    seconds, together with any busy threadpool worker (sync endpoints and dependencies
+    run there). Stacks are aggregated in the folded format read by flamegraph.pl and
+    speedscope. Samples are process-wide, so requests running concurrently on the same
+    threads show up too.
+    """
+
+    def __init__(self, thread_id: int, interval: float):
+        """
+        Initializes the sampler.
+
+        Args:
+            thread_id (int): The thread to profile, usually the event loop's.
+            interval (float): Seconds between samples.
+        """
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self._names: dict = {}  # Code object -> frame label
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self) -> Counter[str]:
+        """
+        Stops sampling and returns the number of samples per folded stack.
+        """
+        self._stop.set()
+        self._thread.join()
+        return self.stacks
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def _sample(self):
+        workers = {thread.ident for thread in threading.enumerate() if thread.name.startswith(WORKER_THREAD_NAME)}
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == self.thread_id:
+                self.stacks[self._fold(frame)] += 1
+            elif thread_id in workers and not _is_idle(frame):
+                self.stacks[f"{WORKER_THREAD_NAME};{self._fold(frame)}"] += 1
+
+    def _fold(self, frame) -> str:
+        names = []
+        while frame is not None:
+            code = frame.f_code
+            name = self._names.get(code)
+            if name is None:
+                module = frame.f_globals.get("__name__", "?")
+                name = self._names[code] = f"{module}:{code.co_qualname}".replace(";", ":")
+            names.append(name)
+            frame = frame.f_back
+        return ";".join(reversed(names))
+
+
+def _is_idle(frame) -> bool:
+    # A worker waiting for its next job is parked in threading.Condition.wait
+    return frame.f_code.co_name == "wait" and frame.f_globals.get("__name__") == "threading"
+
+
+class ProfileRing:
+    """
+    Bounded on-disk store of folded-stack profiles; the oldest files are removed once
+    more than `max_files` exist. Several worker processes can share the directory.
+    """
+
+    def __init__(self, directory: str, max_files: int):
+        self.directory = directory
+        self.max_files = max_files
+
+    def write(self, profile_id: str, label: str, stacks: Counter[str]) -> str:
+        """
+        Saves a profile and prunes the ring.
+
+        Args:
+            profile_id (str): Identifier returned to the caller.
+            label (str): What was profiled, e.g. "GET /readyz"; used in the file name.
+            stacks (Counter[str]): Samples per folded stack.
+
+        Returns:
+            str: The path of the written file.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        now = time.time()
+        timestamp = f"{time.strftime('%Y%m%dT%H%M%S', time.gmtime(now))}{int(now * 1000) % 1000:03d}Z"
+        slug = re.sub(r"[^A-Za-z0-9]+", "_", label).strip("_")[:80]
+        path = os.path.join(self.directory, f"{timestamp}-{profile_id}-{slug}.folded")
+        with open(path, "w") as f:
+            for stack, count in stacks.most_common():
+                f.write(f"{stack} {count}\n")
+        self._prune()
+        return path
+
+    def _prune(self):
+        # File names start with the timestamp, so name order is age order across processes
+        names = sorted(name for name in os.listdir(self.directory) if name.endswith(".folded"))
+        for name in names[: max(0, len(names) - self.max_files)]:
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                pass  # Removed by another worker
+
+
+# Process-wide ring under PROFILING_DIR
+profile_ring = ProfileRing(settings.PROFILING_DIR, settings.PROFILING_MAX_FILES)
+
+
+class Profile:
+    """
+    A profile in progress; `label` can be refined (e.g. with the matched route) before it is saved.
+    """
+
+    def __init__(self, label: str):
+        self.id = uuid.uuid4().hex[:12]
+        self.label = label
+
+@contextmanager
+def profile(label: str):
+    """
+    Samples the current thread for the duration of the block and saves the profile to the ring.
+
+    Args:
+        label (str): What is being profiled, e.g. "GET /readyz".
+
+    Yields:
+        Profile: The profile; its id appears in the file name.
+    """
+    current = Profile(label)
+    sampler = StackSampler(threading.get_ident(), settings.PROFILING_INTERVAL)
+    sampler.start()
+    try:
+        yield current
+    finally:
+        stacks = sampler.stop()
+        try:
+            path = profile_ring.write(current.id, current.label, stacks)
+            logger.info(f"Saved profile of {current.label} ({sum(stacks.values())} samples) to {path}")
+        except OSError as e:
+            logger.warning(f"Could not save profile of {current.label}: {str(e)}")
+
+
+class ProfilingMiddleware:
+    """
+    Pure ASGI middleware profiling requests that carry a valid signed `X-Profile` header,
+    plus a random `PROFILING_SAMPLE_RATE` fraction of all requests. Profiled responses
+    carry the profile id in an `X-Profile-Id` header.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = next((value.decode("latin-1") for key, value in scope["headers"] if key == PROFILE_HEADER.encode()), None)
+        if not (profile_requested(token) or profile_sampled()):
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        with profile(method) as current:
+
+            async def send_wrapper(message):
+                if message["type"] == "http.response.start":
+                    message["headers"] = [*message.get("headers", []), (b"x-profile-id", current.id.encode())]
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                # Name the profile after the route template rather than the raw path, which may hold emails
+                current.label = f"{method} {getattr(scope.get('route'), 'path', 'unmatched')}"
+
@@ -1,16 +1,73 @@
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timedelta
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import HTTPException, status
 
 from app.core.config import settings
+from app.core.token_cache import token_cache
 
 # JWT settings
 SECRET_KEY = settings.JWT_SECRET_KEY
 ALGORITHM = settings.JWT_ALGORITHM
 ACCESS_TOKEN_EXPIRE_MINUTES = settings.ACCESS_TOKEN_EXPIRE_MINUTES
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Layout of the user claims embedded by `build_access_token_claims` ("ver"); bump it whenever
+# the claim set changes so tokens issued with the old layout fall back to a DB lookup.
+# Revoking a user's tokens uses the per-user token version ("tv") instead.
+TOKEN_CLAIMS_VERSION = 2
+
+def build_crypt_context(
+    schemes: list[str] | None = None,
+    bcrypt_rounds: int | None = None,
+    argon2_time_cost: int | None = None,
+    argon2_memory_cost: int | None = None,
+    argon2_parallelism: int | None = None,
+) -> CryptContext:
+    """
+    Build a CryptContext for the given schemes and cost parameters, defaulting to the settings.
+
+    The first scheme hashes new passwords; every other scheme is deprecated. Each
+    scheme's cost is pinned to a single value, so `needs_update` reports hashes that
+    use an old algorithm or a different cost and they can be re-hashed on login.
+
+    Args:
+        schemes (list[str] | None): Passlib scheme names, preferred first. Defaults to `PASSWORD_HASH_SCHEMES`.
+        bcrypt_rounds (int | None): bcrypt log2 cost. Defaults to `PASSWORD_BCRYPT_ROUNDS`.
+        argon2_time_cost (int | None): argon2 iterations. Defaults to `PASSWORD_ARGON2_TIME_COST`.
+        argon2_memory_cost (int | None): argon2 memory in KiB. Defaults to `PASSWORD_ARGON2_MEMORY_COST`.
+        argon2_parallelism (int | None): argon2 lanes. Defaults to `PASSWORD_ARGON2_PARALLELISM`.
+
+    Returns:
+        CryptContext: The configured context.
+    """
+    if schemes is None:
+        schemes = [scheme.strip() for scheme in settings.PASSWORD_HASH_SCHEMES.split(",") if scheme.strip()]
+    rounds = bcrypt_rounds if bcrypt_rounds is not None else settings.PASSWORD_BCRYPT_ROUNDS
+
+    return CryptContext(
+        schemes=schemes,
+        deprecated="auto",
+        bcrypt__default_rounds=rounds,
+        bcrypt__min_rounds=rounds,
+        bcrypt__max_rounds=rounds,
+        argon2__type="ID",
+        argon2__time_cost=argon2_time_cost if argon2_time_cost is not None else settings.PASSWORD_ARGON2_TIME_COST,
+        argon2__memory_cost=argon2_memory_cost if argon2_memory_cost is not None else settings.PASSWORD_ARGON2_MEMORY_COST,
+        argon2__parallelism=argon2_parallelism if argon2_parallelism is not None else settings.PASSWORD_ARGON2_PARALLELISM,
+    )
+
+pwd_context = build_crypt_context()
+
+# Process pool for bcrypt, created lazily so importing this module (including
+# from the pool's own worker processes) does not start any processes
+_hash_pool: ProcessPoolExecutor | None = None
+_hash_pool_lock = threading.Lock()
+_hash_pending = 0
 
 def hash_password(password: str) -> str:
     """
@@ -51,6 +108,180 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                             detail=f"Error while verifying password: {str(e)}")
 
+def _hash_in_worker(password: str) -> str:
+    # Runs in a pool worker, using that process's own CryptContext
+    return pwd_context.hash(password)
+
+def _verify_in_worker(plain_password: str, hashed_password: str) -> bool:
+    # Runs in a pool worker, using that process's own CryptContext
+    return pwd_context.verify(plain_password, hashed_password)
+
+def _verify_and_update_in_worker(plain_password: str, hashed_password: str) -> tuple[bool, str | None]:
+    # Runs in a pool worker, using that process's own CryptContext
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+def _get_hash_pool() -> ProcessPoolExecutor:
+    """
+    Return the password hashing process pool, creating it on first use.
+    """
+    global _hash_pool
+
+    with _hash_pool_lock:
+        if _hash_pool is None:
+            # Spawn rather than fork so workers do not inherit the gRPC server or DB connections
+            _hash_pool = ProcessPoolExecutor(
+                max_workers=settings.PASSWORD_HASH_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _hash_pool
+
+async def _run_in_hash_pool(fn, *args):
+    """
+    Run a CPU-bound password function in the process pool without blocking the event loop.
+
+    At most `PASSWORD_HASH_MAX_PENDING` calls may be queued or running at once;
+    beyond that the request is rejected with 503 so a login burst sheds load
+    instead of piling up unbounded latency.
+
+    Raises:
+        HTTPException: 503 if the pool is saturated or its workers died.
+    """
+    global _hash_pending, _hash_pool
+
+    with _hash_pool_lock:
+        if _hash_pending >= settings.PASSWORD_HASH_MAX_PENDING:
+            raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                                detail="Server is busy, please try again shortly.",
+                                headers={"Retry-After": "1"})
+        _hash_pending += 1
+
+    pool = None
+    try:
+        loop = asyncio.get_running_loop()
+        pool = _get_hash_pool()
+        return await loop.run_in_executor(pool, fn, *args)
+    except BrokenProcessPool:
+        # A worker died; shut the broken pool down (reaping its management thread and any
+        # surviving workers) and drop it so the next call starts a fresh one. Concurrent
+        # calls may see the same failure after a new pool was started; leave that one alone.
+        with _hash_pool_lock:
+            if _hash_pool is pool:
+                _hash_pool = None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                            detail="Server is busy, please try again shortly.",
+                            headers={"Retry-After": "1"})
+    finally:
+        with _hash_pool_lock:
+            _hash_pending -= 1
+
+async def hash_password_async(password: str) -> str:
+    """
+    Hash the password using bcrypt in the process pool.
+
+    Args:
+        password (str): The plain password to be hashed.
+
+    Returns:
+        str: The hashed password.
+
+    Raises:
+        HTTPException: 503 if the hashing pool is saturated, 500 if hashing fails.
+    """
+    try:
+        return await _run_in_hash_pool(_hash_in_worker, password)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                            detail=f"Error while hashing password: {str(e)}")
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify the plain password against the hashed password in the process pool.
+
+    Args:
+        plain_password (str): The plain password.
+        hashed_password (str): The hashed password.
+
+    Returns:
+        bool: True if passwords match, False otherwise.
+
+    Raises:
+        HTTPException: 503 if the hashing pool is saturated, 500 if verification fails.
+    """
+    try:
+        return await _run_in_hash_pool(_verify_in_worker, plain_password, hashed_password)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                            detail=f"Error while verifying password: {str(e)}")
+
+async def verify_and_update_password_async(plain_password: str, hashed_password: str) -> tuple[bool, str | None]:
+    """
+    Verify the password in the process pool and re-hash it if the stored hash is out of date.
+
+    A stored hash is out of date when it uses a deprecated scheme or a cost other than
+    the configured one (see `build_crypt_context`).
+
+    Args:
+        plain_password (str): The plain password.
+        hashed_password (str): The hashed password.
+
+    Returns:
+        tuple[bool, str | None]: Whether the password matches, and the replacement hash to
+        store if the password matched and the stored hash needs upgrading (else None).
+
+    Raises:
+        HTTPException: 503 if the hashing pool is saturated, 500 if verification fails.
+    """
+    try:
+        return await _run_in_hash_pool(_verify_and_update_in_worker, plain_password, hashed_password)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                            detail=f"Error while verifying password: {str(e)}")
+
+def shutdown_hash_pool():
+    """
+    Shut down the password hashing process pool, if it was started.
+    """
+    global _hash_pool
+
+    with _hash_pool_lock:
+        if _hash_pool is not None:
+            _hash_pool.shutdown(wait=True, cancel_futures=True)
+            _hash_pool = None
+
+def build_access_token_claims(user) -> dict:
+    """
+    Build the payload for a user's access token.
+
+    Every token carries the user's token version (`tv`), so bumping
+    `IndividualUser.token_version` revokes the tokens issued before it. In stateless mode
+    (`JWT_STATELESS_AUTH`) the token also carries the user details that authenticated
+    endpoints need, so they can be served without loading the user row.
+
+    Args:
+        user (IndividualUser): The authenticated user.
+
+    Returns:
+        dict: The claims to pass to `create_access_token`.
+    """
+    claims = {"sub": user.email, "tv": user.token_version}
+    if settings.JWT_STATELESS_AUTH:
+        claims.update({
+            "username": user.username,
+            "phone_number": user.phone_number,
+            "email_verified": bool(user.is_email_verified),
+            "phone_verified": bool(user.is_phone_verified),
+            "ver": TOKEN_CLAIMS_VERSION,
+        })
+    return claims
+
 def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
     """
     Create a JWT access token.
@@ -79,6 +310,9 @@ def verify_access_token(token: str) -> dict | None:
     """
     Verify and decode the JWT token.
 
+    Payloads of recently verified tokens are served from `token_cache` until the
+    token expires, skipping the signature check and JSON parsing for hot tokens.
+
     Args:
         token (str): The JWT token to verify.
 
@@ -88,8 +322,13 @@ def verify_access_token(token: str) -> dict | None:
     Raises:
         HTTPException: If there is an error in decoding or verifying the token.
     """
+    payload = token_cache.get(token)
+    if payload is not None:
+        return payload
+
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        token_cache.set(token, payload)
         return payload
     except JWTError as e:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED,
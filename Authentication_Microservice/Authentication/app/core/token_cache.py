@@ -0,0 +1,107 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from app.core.config import settings
+
+
+class TokenCache:
+    """
+    Thread-safe LRU cache of verified JWT payloads, keyed by a SHA-256 digest of the token.
+
+    An entry is only ever added after the token's signature has been verified, and it
+    is dropped as soon as the token's `exp` passes, so a hit is exactly as trustworthy
+    as a fresh `jwt.decode`. Storing the digest rather than the token keeps bearer
+    credentials out of memory dumps of the cache.
+    """
+
+    def __init__(self, max_size: int):
+        """
+        Initializes the cache.
+
+        Args:
+            max_size (int): Maximum number of entries before the least recently used is evicted; 0 disables caching.
+        """
+        self.max_size = max_size
+        self._data: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @staticmethod
+    def key(token: str) -> str:
+        """
+        Returns the cache key for a token.
+        """
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def get(self, token: str) -> dict | None:
+        """
+        Returns a copy of the cached payload for `token`, or None if absent or expired.
+        """
+        if self.max_size <= 0:
+            return None
+
+        key = self.key(token)
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, payload = entry
+            if expires_at <= time.time():
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return dict(payload)
+
+    def set(self, token: str, payload: dict):
+        """
+        Caches the verified payload of `token` until its `exp` claim.
+
+        Tokens without an `exp` claim are not cached.
+        """
+        expires_at = payload.get("exp")
+        if self.max_size <= 0 or not isinstance(expires_at, (int, float)):
+            return
+
+        key = self.key(token)
+        with self._lock:
+            self._data[key] = (float(expires_at), dict(payload))
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """
+        Removes every entry from the cache.
+        """
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict:
+        """
+        Returns size, hit/miss and eviction counters for monitoring.
+        """
+        return {
+            "size": len(self._data),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+# Process-wide cache instance
+token_cache = TokenCache(settings.JWT_CACHE_MAX_SIZE)
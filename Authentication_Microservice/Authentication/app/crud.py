@@ -1,47 +1,199 @@
+import asyncio
+
+from fastapi import HTTPException, status
+from sqlalchemy import and_, case, select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import IndividualUser, IndividualSignUp
+from app.services.token_versions import publish_token_version
+from app.services.user_events import publish_user_event, USER_CREATED
+
+def _insert_user_statement(user: IndividualSignUp, hashed_password: str):
+    """
+    Build a single `INSERT ... ON CONFLICT DO NOTHING RETURNING` for a new user.
+
+    No row is returned if the email or phone number is already taken, so a duplicate
+    signup costs one round trip instead of a failed commit and a rollback.
+    """
+    return (
+        insert(IndividualUser)
+        .values(
+            username=user.username,
+            email=user.email,
+            phone_number=user.phone_number,
+            hashed_password=hashed_password,
+        )
+        .on_conflict_do_nothing()
+        .returning(IndividualUser)
+    )
+
+def _conflicting_user_statement(user: IndividualSignUp):
+    # Only run after an insert was skipped, to tell the caller which unique field clashed
+    return select(IndividualUser.email, IndividualUser.phone_number).where(
+        (IndividualUser.email == user.email) | (IndividualUser.phone_number == user.phone_number)
+    ).limit(1)
+
+def _conflict_error(user: IndividualSignUp, existing) -> HTTPException:
+    if existing is not None and existing.email != user.email:
+        detail = "A user with this phone number already exists."
+    else:
+        detail = "A user with this email already exists."
+    return HTTPException(status_code=status.HTTP_409_CONFLICT, detail=detail)
+
+# get user by email from db
+def get_user_by_email(email: str, db: Session):
+    """
+    Retrieve a user from the database by their email.
+
+    Args:
+        email (str): The email of the user to retrieve.
+        db (Session): The database session.
 
-# create new user in the db
-def create_user(user: IndividualSignUp, hashed_password: str, db: Session):
+    Returns:
+        IndividualUser: The user object corresponding to the email, or None if not found.
+    """
+    return db.query(IndividualUser).filter(IndividualUser.email == email).first()
+
+# create new user in the db (async)
+async def create_user_async(user: IndividualSignUp, hashed_password: str, db: AsyncSession):
     """
-    Create a new user in the database.
+    Create a new user in the database using an async session.
 
     Args:
         user (IndividualSignUp): User data including username, email, and phone number.
         hashed_password (str): The hashed password for the user.
-        db (Session): The database session.
+        db (AsyncSession): The async database session.
 
     Returns:
         IndividualUser: The newly created user object after being added to the database.
+
+    Raises:
+        HTTPException: 409 if the email or phone number is already registered.
     """
-    db_user = IndividualUser(
-        username=user.username,
-        email=user.email,
-        phone_number=user.phone_number,
-        hashed_password=hashed_password,
-    )
-    
     try:
-        db.add(db_user)
-        db.commit()
-        db.refresh(db_user)
+        db_user = (await db.execute(_insert_user_statement(user, hashed_password))).scalars().first()
+        if db_user is None:
+            existing = (await db.execute(_conflicting_user_statement(user))).first()
+            await db.rollback()
+            raise _conflict_error(user, existing)
+        await db.commit()
+    except HTTPException:
+        raise
     except Exception as e:
-        db.rollback()  # Rollback the transaction in case of error
+        await db.rollback()  # Rollback the transaction in case of error
         raise Exception(f"Error creating user: {str(e)}")
-    
+
+    # Let other services drop any cached "user not found" entry for this email
+    await asyncio.to_thread(publish_user_event, USER_CREATED, db_user.email, username=db_user.username)
+
     return db_user
 
-# get user by email from db
-def get_user_by_email(email: str, db: Session):
+# replace a user's stored password hash (async)
+async def update_user_password_hash_async(user_id: int, old_hash: str, new_hash: str, db: AsyncSession):
     """
-    Retrieve a user from the database by their email.
+    Replace a user's password hash with a single `UPDATE`, without touching any loaded
+    `IndividualUser` instance.
+
+    The row is only changed if it still holds `old_hash`, so an upgrade computed from the
+    old password cannot overwrite a password changed in the meantime.
 
     Args:
-        email (str): The email of the user to retrieve.
+        user_id (int): The id of the user whose hash is replaced.
+        old_hash (str): The hash the new one was derived from.
+        new_hash (str): The new password hash.
+        db (AsyncSession): The async database session.
+
+    Returns:
+        bool: True if the hash was replaced, False if it had changed in the meantime.
+    """
+    try:
+        result = await db.execute(
+            update(IndividualUser)
+            .where(IndividualUser.id == user_id, IndividualUser.hashed_password == old_hash)
+            .values(hashed_password=new_hash)
+        )
+        await db.commit()
+    except Exception as e:
+        await db.rollback()  # Rollback the transaction in case of error
+        raise Exception(f"Error updating password hash: {str(e)}")
+
+    return result.rowcount > 0
+
+# mark a user's email and phone number as verified
+def mark_user_verified(email: str, db: Session):
+    """
+    Mark a user's email (and, for now, phone number) as verified with a single
+    `UPDATE ... RETURNING`, without loading the row first.
+
+    If the verification status changes, the user's token version is bumped in the
+    same statement and published, so tokens carrying the old status are rejected.
+
+    Args:
+        email (str): The email of the user to verify.
         db (Session): The database session.
 
+    Returns:
+        str | None: The user's username.
+
+    Raises:
+        HTTPException: 404 if no user has this email.
+    """
+    try:
+        result = db.execute(
+            update(IndividualUser)
+            .where(IndividualUser.email == email)
+            .values(
+                is_email_verified=True,
+                is_phone_verified=True,
+                token_version=IndividualUser.token_version + case(
+                    (and_(IndividualUser.is_email_verified, IndividualUser.is_phone_verified), 0), else_=1
+                ),
+            )
+            .returning(IndividualUser.username, IndividualUser.token_version)
+        ).first()
+        if result is None:
+            db.rollback()
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+        db.commit()
+    except HTTPException:
+        raise
+    except Exception as e:
+        db.rollback()  # Rollback the transaction in case of error
+        raise Exception(f"Error verifying user: {str(e)}")
+
+    publish_token_version(email, result.token_version)
+    return result.username
+
+# get user by email from db (async)
+async def get_user_by_email_async(email: str, db: AsyncSession):
+    """
+    Retrieve a user from the database by their email using an async session.
+
+    Args:
+        email (str): The email of the user to retrieve.
+        db (AsyncSession): The async database session.
+
     Returns:
         IndividualUser: The user object corresponding to the email, or None if not found.
     """
-    return db.query(IndividualUser).filter(IndividualUser.email == email).first()
+    result = await db.execute(select(IndividualUser).where(IndividualUser.email == email))
+    return result.scalars().first()
+
+# get users by a batch of emails from db (async)
+async def get_users_by_emails_async(emails: list[str], db: AsyncSession):
+    """
+    Retrieve all users matching any of the given emails in a single query using an async session.
+
+    Args:
+        emails (list[str]): The emails of the users to retrieve.
+        db (AsyncSession): The async database session.
+
+    Returns:
+        list[IndividualUser]: The users found; emails with no matching user are simply absent.
+    """
+    if not emails:
+        return []
+    result = await db.execute(select(IndividualUser).where(IndividualUser.email.in_(emails)))
+    return list(result.scalars().all())
@@ -1,25 +1,67 @@
+import argparse
+import asyncio
+import multiprocessing
+import signal
 import grpc
-from concurrent import futures
-from sqlalchemy.orm import Session
+from grpc_health.v1 import health, health_pb2, health_pb2_grpc
+from prometheus_client import start_http_server
+from sqlalchemy.ext.asyncio import AsyncSession
 import logging
 
 from app.services import auth_pb2, auth_pb2_grpc
 from app.core.config import settings
-from app.crud import get_user_by_email
-from app.core.db import SessionLocal
+from app.core.metrics import GrpcMetricsInterceptor, metrics_registry
+from app.core.tracing import GrpcTracingInterceptor, configure_tracing, tracing_enabled
+from app.crud import get_user_by_email_async, get_users_by_emails_async
+from app.core.db import AsyncSessionLocal
 
 # Set up logging
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
+# Maximum number of emails resolved per database query when streaming
+STREAM_CHUNK_SIZE = 500
+
+# Fully-qualified service name reported by the gRPC health-checking service
+SERVICE_NAME = auth_pb2.DESCRIPTOR.services_by_name["AuthService"].full_name
+
+# Health servicer of the server running in this process, set by start_server()
+_health_servicer: health.aio.HealthServicer | None = None
+
+
+async def _validate_batch(emails: list[str], db: AsyncSession) -> list:
+    """
+    Resolve a batch of emails to UserValidation messages with one `IN (...)` query.
+
+    Args:
+        emails (list[str]): Emails to validate; duplicates are collapsed.
+        db (AsyncSession): The async database session.
+
+    Returns:
+        list[UserValidation]: One entry per distinct email, in request order.
+    """
+    unique_emails = list(dict.fromkeys(emails))
+    users = {user.email: user for user in await get_users_by_emails_async(unique_emails, db)}
+
+    results = []
+    for email in unique_emails:
+        user = users.get(email)
+        if not user or not user.is_email_verified:
+            results.append(auth_pb2.UserValidation(email=email, is_valid=False))
+        else:
+            results.append(auth_pb2.UserValidation(email=email, is_valid=True, username=user.username or ""))
+    return results
+
+
 class AuthService(auth_pb2_grpc.AuthServiceServicer):
     """
-    gRPC service implementation for user authentication.
+    Asyncio gRPC service implementation for user authentication.
 
-    Provides methods to validate a user's email and check whether it is verified.
+    Provides methods to validate a user's email (singly or in batches) and check whether it is verified.
+    Database lookups use the async engine, so a single event loop can serve many concurrent calls.
     """
 
-    def ValidateUser(self, request, context):
+    async def ValidateUser(self, request, context):
         """
         Validate a user by email.
 
@@ -34,8 +76,8 @@ class AuthService(auth_pb2_grpc.AuthServiceServicer):
 
         try:
             # Using context manager for database session to ensure it's properly closed
-            with SessionLocal() as db:
-                user = get_user_by_email(email, db)
+            async with AsyncSessionLocal() as db:
+                user = await get_user_by_email_async(email, db)
 
                 # Check if the user exists and has a verified email
                 if not user or not user.is_email_verified:
@@ -54,22 +96,203 @@ class AuthService(auth_pb2_grpc.AuthServiceServicer):
             context.set_code(grpc.StatusCode.INTERNAL)
             return auth_pb2.ValidateUserResponse(is_valid=False)
 
-def serve():
+    async def ValidateUsers(self, request, context):
+        """
+        Validate a batch of users by email using a single database query.
+
+        Args:
+            request: gRPC request containing the emails to validate.
+            context: gRPC context to set error details and status code.
+
+        Returns:
+            A ValidateUsersResponse with one UserValidation per distinct email.
+        """
+        try:
+            async with AsyncSessionLocal() as db:
+                return auth_pb2.ValidateUsersResponse(users=await _validate_batch(list(request.emails), db))
+
+        except Exception as e:
+            logger.error(f"Error occurred during ValidateUsers: {str(e)}")
+            context.set_details(f"Internal server error: {str(e)}")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            return auth_pb2.ValidateUsersResponse()
+
+    async def StreamValidateUsers(self, request, context):
+        """
+        Validate a batch of users by email, streaming results back as each chunk is resolved.
+
+        Args:
+            request: gRPC request containing the emails to validate.
+            context: gRPC context to set error details and status code.
+
+        Yields:
+            UserValidation messages, one per distinct email.
+        """
+        emails = list(dict.fromkeys(request.emails))
+
+        try:
+            async with AsyncSessionLocal() as db:
+                for start in range(0, len(emails), STREAM_CHUNK_SIZE):
+                    for result in await _validate_batch(emails[start:start + STREAM_CHUNK_SIZE], db):
+                        yield result
+
+        except Exception as e:
+            logger.error(f"Error occurred during StreamValidateUsers: {str(e)}")
+            context.set_details(f"Internal server error: {str(e)}")
+            context.set_code(grpc.StatusCode.INTERNAL)
+
+
+async def start_server() -> grpc.aio.Server:
     """
-    Start the gRPC server to handle incoming authentication requests.
+    Create and start the asyncio gRPC server on the current event loop.
 
-    The server will listen on the specified port and handle requests using the AuthService.
+    Concurrency is bounded by `GRPC_MAX_CONCURRENT_RPCS` (calls beyond the limit are
+    rejected with RESOURCE_EXHAUSTED) and `GRPC_MAX_CONCURRENT_STREAMS` per connection.
+    The standard `grpc.health.v1.Health` service is registered alongside AuthService
+    so load balancers and orchestrators can probe each process.
+
+    Returns:
+        grpc.aio.Server: The running server.
     """
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+    global _health_servicer
+
+    interceptors = [GrpcMetricsInterceptor()]
+    if tracing_enabled():
+        interceptors.insert(0, GrpcTracingInterceptor())
+
+    # Accept keepalive pings from long-lived client channels instead of
+    # closing the connection with "too_many_pings"
+    server = grpc.aio.server(
+        interceptors=interceptors,
+        maximum_concurrent_rpcs=settings.GRPC_MAX_CONCURRENT_RPCS,
+        options=[
+            ("grpc.max_concurrent_streams", settings.GRPC_MAX_CONCURRENT_STREAMS),
+            ("grpc.keepalive_permit_without_calls", 1),
+            ("grpc.http2.min_recv_ping_interval_without_data_ms", 10000),
+            ("grpc.http2.max_pings_without_data", 0),
+            # Lets several worker processes bind the same port; the kernel spreads
+            # incoming connections between them
+            ("grpc.so_reuseport", 1 if settings.GRPC_REUSE_PORT else 0),
+        ],
+    )
 
     try:
         auth_pb2_grpc.add_AuthServiceServicer_to_server(AuthService(), server)
+
+        _health_servicer = health.aio.HealthServicer()
+        health_pb2_grpc.add_HealthServicer_to_server(_health_servicer, server)
+
         server.add_insecure_port(f"[::]:{settings.GRPC_PORT}")
+        await server.start()
+
+        # "" is the overall server status, as queried by grpc_health_probe without --service
+        for service in ("", SERVICE_NAME):
+            await _health_servicer.set(service, health_pb2.HealthCheckResponse.SERVING)
+
         logger.info(f"gRPC server started on port {settings.GRPC_PORT}.")
-        server.start()
-        server.wait_for_termination()
+        return server
 
     except Exception as e:
         # Log and handle server startup errors
         logger.error(f"Error starting the gRPC server: {str(e)}")
         raise RuntimeError("Failed to start gRPC server.") from e
+
+
+async def stop_server(server: grpc.aio.Server):
+    """
+    Gracefully stop the gRPC server.
+
+    Health checks report NOT_SERVING first so clients stop routing new calls here,
+    then in-flight calls get `GRPC_SHUTDOWN_GRACE` seconds to finish.
+
+    Args:
+        server (grpc.aio.Server): The server returned by `start_server`.
+    """
+    if _health_servicer is not None:
+        await _health_servicer.enter_graceful_shutdown()
+    await server.stop(settings.GRPC_SHUTDOWN_GRACE)
+    logger.info("gRPC server stopped.")
+
+
+async def serve():
+    """
+    Start the gRPC server to handle incoming authentication requests and block until
+    the process receives SIGINT or SIGTERM, then shut down gracefully.
+
+    The server will listen on the specified port and handle requests using the AuthService.
+    """
+    server = await start_server()
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    await stop.wait()
+    await stop_server(server)
+
+
+def _run_worker():
+    """
+    Entrypoint of a single worker process.
+    """
+    configure_tracing("auth-grpc")
+    asyncio.run(serve())
+
+
+def main(argv: list[str] | None = None):
+    """
+    Run the gRPC server in one or more worker processes.
+
+    Every worker runs its own event loop and binds `GRPC_PORT` with `SO_REUSEPORT`,
+    so throughput scales with the number of cores instead of being capped by a
+    single Python process.
+
+    Args:
+        argv (list[str] | None): Command-line arguments; defaults to `sys.argv[1:]`.
+    """
+    parser = argparse.ArgumentParser(description="Run the AuthService gRPC server.")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=settings.GRPC_WORKERS,
+        help="number of server processes to start (default: GRPC_WORKERS)",
+    )
+    args = parser.parse_args(argv)
+
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    # Without the HTTP API in this process, expose metrics on their own port. With several
+    # workers, set PROMETHEUS_MULTIPROC_DIR so this endpoint aggregates all of them.
+    if settings.METRICS_PORT:
+        start_http_server(settings.METRICS_PORT, registry=metrics_registry())
+    if args.workers == 1:
+        _run_worker()
+        return
+    if not settings.GRPC_REUSE_PORT:
+        parser.error("--workers greater than 1 requires GRPC_REUSE_PORT to be enabled")
+
+    # Spawn rather than fork: gRPC core must not be inherited across a fork
+    context = multiprocessing.get_context("spawn")
+    workers = [context.Process(target=_run_worker, name=f"grpc-worker-{i}") for i in range(args.workers)]
+    for worker in workers:
+        worker.start()
+    logger.info(f"Started {len(workers)} gRPC worker processes on port {settings.GRPC_PORT}.")
+
+    def _terminate(signum, frame):
+        # Forward shutdown to the workers; each one stops gracefully on SIGTERM
+        for worker in workers:
+            if worker.is_alive():
+                worker.terminate()
+
+    signal.signal(signal.SIGINT, _terminate)
+    signal.signal(signal.SIGTERM, _terminate)
+
+    for worker in workers:
+        worker.join()
+
+
+if __name__ == "__main__":
+    # Standalone entrypoint: python -m app.grpc_server [--workers N]
+    main()
@@ -1,48 +1,120 @@
-import threading
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
-from app.grpc_server import serve
+from app.bootstrap import bootstrap_schema
+from app.grpc_server import start_server, stop_server
 from app.api.main import api_router
-from app.core.db import engine, Base
-from app.services.wait_for_postgres import wait_for_postgres
+from app.core.config import settings
+from app.core.db import async_engine
+from app.core.metrics import PrometheusMiddleware, metrics_response
+from app.core.profiling import ProfilingMiddleware, profiling_enabled
+from app.core.security import shutdown_hash_pool
+from app.core.tracing import TracingMiddleware, configure_tracing, tracing_enabled
+from app.core.token_cache import token_cache
+from app.services.email_queue import email_worker
+from app.services.readiness import readiness
 
-# Initialize FastAPI app
-app = FastAPI(title="Dodgygeezers Auth")
+# Configure logging
+logger = logging.getLogger(__name__)
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-def start_grpc_server():
+async def start_grpc_server():
     """
-    Starts the gRPC server in a separate thread to handle authentication requests.
-    
-    This function runs the gRPC server in a daemon thread, allowing the main 
-    FastAPI application to handle HTTP requests concurrently.
+    Starts the asyncio gRPC server on the FastAPI event loop to handle authentication requests.
+
+    Skipped when `GRPC_EMBEDDED` is false, in which case the server is expected to run
+    as its own process (`python -m app.grpc_server --workers N`). Running uvicorn with
+    several workers and the embedded server relies on `GRPC_REUSE_PORT`.
     """
+    if not settings.GRPC_EMBEDDED:
+        return
     try:
-        threading.Thread(target=serve, daemon=True).start()
+        app.state.grpc_server = await start_server()
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error starting gRPC server: {str(e)}")
 
-# Wait for PostgreSQL to be ready before starting the app
-wait_for_postgres()
+async def start_email_worker():
+    """
+    Starts draining the verification email queue on the FastAPI event loop.
 
+    Skipped when `EMAIL_WORKER_EMBEDDED` is false, in which case the worker is expected
+    to run as its own process (`python -m app.services.email_queue`).
+    """
+    if settings.EMAIL_QUEUE_ENABLED and settings.EMAIL_WORKER_EMBEDDED:
+        await email_worker.start()
 
-# Create all database tables in Supabase
-Base.metadata.create_all(bind=engine)
+async def stop_grpc_server():
+    """
+    Gracefully stops the embedded gRPC server, letting in-flight calls finish.
+    """
+    server = getattr(app.state, "grpc_server", None)
+    if server is not None:
+        await stop_server(server)
+
+async def wait_for_dependencies():
+    """
+    Waits for PostgreSQL (and Redis) in the background so the server accepts connections,
+    and answers `/healthz`, straight away. `/readyz` reports 503 until the database answers.
+
+    The schema is created by the one-shot `python -m app.bootstrap` command, or here when
+    `SCHEMA_BOOTSTRAP_ON_STARTUP` is set for local development.
+    """
+    try:
+        await readiness.wait_until_ready()
+    except TimeoutError as e:
+        logger.error(f"Dependencies are still unavailable: {str(e)}")
+        return
+
+    if settings.SCHEMA_BOOTSTRAP_ON_STARTUP:
+        await asyncio.to_thread(bootstrap_schema)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Starts the embedded gRPC server and email worker alongside the HTTP API, and stops
+    them, the password hashing pool and the async database pool on shutdown.
+    """
+    await start_grpc_server()
+    await start_email_worker()
+    dependencies = asyncio.create_task(wait_for_dependencies())
+
+    yield
+
+    dependencies.cancel()
+    await stop_grpc_server()
+    await email_worker.stop()
+    shutdown_hash_pool()
+    await async_engine.dispose()
+
+# Install the tracer provider before the app and the embedded gRPC server are built
+configure_tracing("auth-service")
+
+# Initialize FastAPI app
+app = FastAPI(
+    title="Dodgygeezers Auth",
+    lifespan=lifespan,
+)
+
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+app.add_middleware(PrometheusMiddleware)
+if profiling_enabled():
+    app.add_middleware(ProfilingMiddleware)
+if tracing_enabled():
+    app.add_middleware(TracingMiddleware)
 
 # Include the API routes
 app.include_router(api_router)
 
-# Start gRPC server in a separate thread
-start_grpc_server()
-
 # Root endpoint
 @app.get("/")
 def read_root():
@@ -53,3 +125,45 @@ def read_root():
         dict: A message indicating the server is up and running.
     """
     return {"message": "Welcome to the Dodgygeezers Auth"}
+
+@app.get("/healthz")
+def read_liveness():
+    """
+    Liveness probe: the process is up and serving requests. Does not touch any dependency.
+
+    Returns:
+        dict: `{"status": "ok"}`.
+    """
+    return {"status": "ok"}
+
+@app.get("/readyz")
+async def read_readiness():
+    """
+    Readiness probe: checks PostgreSQL and Redis concurrently.
+
+    Returns:
+        JSONResponse: 200 if every required dependency answers, otherwise 503, with the
+        result of each check.
+    """
+    ready, checks = await readiness.check()
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={"status": "ready" if ready else "unavailable", "checks": checks},
+    )
+
+@app.get("/metrics", include_in_schema=False)
+def read_metrics():
+    """
+    Exposes Prometheus metrics: HTTP, database and gRPC server latency histograms.
+    """
+    return metrics_response()
+
+@app.get("/cache/stats")
+def read_cache_stats():
+    """
+    Exposes counters for the verified-token cache.
+
+    Returns:
+        dict: Size, hit, miss, eviction and expiration counters for this worker process.
+    """
+    return token_cache.stats()
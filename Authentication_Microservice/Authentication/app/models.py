@@ -20,6 +20,8 @@ class IndividualUser(Base):
     - hashed_password (str): The hashed password of the user.
     - is_email_verified (bool): Indicates whether the user's email is verified (default is False).
     - is_phone_verified (bool): Indicates whether the user's phone number is verified (default is False).
+    - token_version (int): Incremented whenever the password or verification status changes; access
+      tokens carrying an older version are rejected.
     """
     __tablename__ = "individual_users"
 
@@ -31,6 +33,7 @@ class IndividualUser(Base):
 
     is_email_verified = Column(Boolean, default=False)
     is_phone_verified = Column(Boolean, default=False)
+    token_version = Column(Integer, nullable=False, default=0, server_default="0")
 
 # ---------------------------
 # Pydantic Schemas
@@ -59,4 +62,37 @@ class UserLogin(BaseModel):
     - password (str): The password of the user.
     """
     email: str
-    password: str
\ No newline at end of file
+    password: str
+
+class TokenUser(BaseModel):
+    """
+    The current user as described by the claims of a verified access token.
+
+    Used in stateless JWT mode in place of an `IndividualUser` row; it exposes the
+    same attribute names, so endpoints can read either one.
+
+    Attributes:
+    - username (Optional[str]): The username of the user.
+    - email (str): The email address of the user.
+    - phone_number (str): The phone number of the user.
+    - is_email_verified (bool): Whether the user's email was verified when the token was issued.
+    - is_phone_verified (bool): Whether the user's phone number was verified when the token was issued.
+    """
+    username: Optional[str] = None
+    email: str
+    phone_number: str
+    is_email_verified: bool
+    is_phone_verified: bool
+
+    @classmethod
+    def from_claims(cls, payload: dict) -> "TokenUser":
+        """
+        Build a TokenUser from a decoded access token payload.
+        """
+        return cls(
+            username=payload.get("username"),
+            email=payload["sub"],
+            phone_number=payload["phone_number"],
+            is_email_verified=payload["email_verified"],
+            is_phone_verified=payload["phone_verified"],
+        )
@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\nauth.proto\x12\x04\x61uth\"$\n\x13ValidateUserRequest\x12\r\n\x05\x65mail\x18\x01 \x01(\t\":\n\x14ValidateUserResponse\x12\x10\n\x08is_valid\x18\x01 \x01(\x08\x12\x10\n\x08username\x18\x02 \x01(\t2T\n\x0b\x41uthService\x12\x45\n\x0cValidateUser\x12\x19.auth.ValidateUserRequest\x1a\x1a.auth.ValidateUserResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\nauth.proto\x12\x04\x61uth\"$\n\x13ValidateUserRequest\x12\r\n\x05\x65mail\x18\x01 \x01(\t\":\n\x14ValidateUserResponse\x12\x10\n\x08is_valid\x18\x01 \x01(\x08\x12\x10\n\x08username\x18\x02 \x01(\t\"&\n\x14ValidateUsersRequest\x12\x0e\n\x06\x65mails\x18\x01 \x03(\t\"C\n\x0eUserValidation\x12\r\n\x05\x65mail\x18\x01 \x01(\t\x12\x10\n\x08is_valid\x18\x02 \x01(\x08\x12\x10\n\x08username\x18\x03 \x01(\t\"<\n\x15ValidateUsersResponse\x12#\n\x05users\x18\x01 \x03(\x0b\x32\x14.auth.UserValidation2\xe9\x01\n\x0b\x41uthService\x12\x45\n\x0cValidateUser\x12\x19.auth.ValidateUserRequest\x1a\x1a.auth.ValidateUserResponse\x12H\n\rValidateUsers\x12\x1a.auth.ValidateUsersRequest\x1a\x1b.auth.ValidateUsersResponse\x12I\n\x13StreamValidateUsers\x12\x1a.auth.ValidateUsersRequest\x1a\x14.auth.UserValidation0\x01\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -35,6 +35,12 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_VALIDATEUSERREQUEST']._serialized_end=56
   _globals['_VALIDATEUSERRESPONSE']._serialized_start=58
   _globals['_VALIDATEUSERRESPONSE']._serialized_end=116
-  _globals['_AUTHSERVICE']._serialized_start=118
-  _globals['_AUTHSERVICE']._serialized_end=202
+  _globals['_VALIDATEUSERSREQUEST']._serialized_start=118
+  _globals['_VALIDATEUSERSREQUEST']._serialized_end=156
+  _globals['_USERVALIDATION']._serialized_start=158
+  _globals['_USERVALIDATION']._serialized_end=225
+  _globals['_VALIDATEUSERSRESPONSE']._serialized_start=227
+  _globals['_VALIDATEUSERSRESPONSE']._serialized_end=287
+  _globals['_AUTHSERVICE']._serialized_start=290
+  _globals['_AUTHSERVICE']._serialized_end=523
 # @@protoc_insertion_point(module_scope)
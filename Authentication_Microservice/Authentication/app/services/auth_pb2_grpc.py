@@ -39,6 +39,16 @@ class AuthServiceStub(object):
                 request_serializer=auth__pb2.ValidateUserRequest.SerializeToString,
                 response_deserializer=auth__pb2.ValidateUserResponse.FromString,
                 _registered_method=True)
+        self.ValidateUsers = channel.unary_unary(
+                '/auth.AuthService/ValidateUsers',
+                request_serializer=auth__pb2.ValidateUsersRequest.SerializeToString,
+                response_deserializer=auth__pb2.ValidateUsersResponse.FromString,
+                _registered_method=True)
+        self.StreamValidateUsers = channel.unary_stream(
+                '/auth.AuthService/StreamValidateUsers',
+                request_serializer=auth__pb2.ValidateUsersRequest.SerializeToString,
+                response_deserializer=auth__pb2.UserValidation.FromString,
+                _registered_method=True)
 
 
 class AuthServiceServicer(object):
@@ -50,6 +60,18 @@ class AuthServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def ValidateUsers(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def StreamValidateUsers(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_AuthServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -58,6 +80,16 @@ def add_AuthServiceServicer_to_server(servicer, server):
                     request_deserializer=auth__pb2.ValidateUserRequest.FromString,
                     response_serializer=auth__pb2.ValidateUserResponse.SerializeToString,
             ),
+            'ValidateUsers': grpc.unary_unary_rpc_method_handler(
+                    servicer.ValidateUsers,
+                    request_deserializer=auth__pb2.ValidateUsersRequest.FromString,
+                    response_serializer=auth__pb2.ValidateUsersResponse.SerializeToString,
+            ),
+            'StreamValidateUsers': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamValidateUsers,
+                    request_deserializer=auth__pb2.ValidateUsersRequest.FromString,
+                    response_serializer=auth__pb2.UserValidation.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'auth.AuthService', rpc_method_handlers)
@@ -95,3 +127,57 @@ class AuthService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def ValidateUsers(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/auth.AuthService/ValidateUsers',
+            auth__pb2.ValidateUsersRequest.SerializeToString,
+            auth__pb2.ValidateUsersResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def StreamValidateUsers(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/auth.AuthService/StreamValidateUsers',
+            auth__pb2.ValidateUsersRequest.SerializeToString,
+            auth__pb2.UserValidation.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
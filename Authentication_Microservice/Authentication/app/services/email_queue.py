@@ -0,0 +1,302 @@
+import asyncio
+import json
+import logging
+import os
+import signal
+import socket
+import time
+
+import aiosmtplib
+import redis
+import redis.asyncio as aioredis
+
+from app.core.config import settings
+from app.utils import build_verification_email
+
+# Set up logging
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO)
+
+# Job types understood by the worker
+VERIFICATION_EMAIL = "verification"
+
+# Jobs waiting for their next attempt (sorted set scored by due time) and jobs that gave up
+RETRY_KEY = f"{settings.EMAIL_QUEUE_KEY}:retry"
+DEAD_LETTER_KEY = f"{settings.EMAIL_QUEUE_KEY}:dead"
+
+# Per-worker list of the job being sent, and the key that shows the worker is alive
+PROCESSING_KEY = f"{settings.EMAIL_QUEUE_KEY}:processing"
+HEARTBEAT_KEY = f"{settings.EMAIL_QUEUE_KEY}:worker"
+
+# Redis client used by request handlers to enqueue emails; connections are opened lazily
+redis_client = redis.Redis(
+    host=settings.REDIS_HOST,
+    port=settings.REDIS_PORT,
+    socket_timeout=1,
+    socket_connect_timeout=1,
+)
+
+def enqueue_verification_email(to_username: str, to_email: str, verification_link: str) -> bool:
+    """
+    Queue a verification email for the background worker.
+
+    Args:
+        to_username (str): The username of the recipient.
+        to_email (str): The email address of the recipient.
+        verification_link (str): The link the recipient needs to click to verify their email.
+
+    Returns:
+        bool: True if the email was queued; False if the queue is disabled or Redis is
+        unreachable, in which case the caller should send it some other way.
+    """
+    if not settings.EMAIL_QUEUE_ENABLED:
+        return False
+
+    job = {
+        "type": VERIFICATION_EMAIL,
+        "username": to_username,
+        "email": to_email,
+        "link": verification_link,
+        "attempts": 0,
+    }
+    try:
+        redis_client.lpush(settings.EMAIL_QUEUE_KEY, json.dumps(job))
+        return True
+    except redis.RedisError as e:
+        logger.warning(f"Could not queue verification email for {to_email}: {str(e)}")
+        return False
+
+def _build_message(job: dict):
+    """
+    Build the MIME message for a queued job.
+
+    Raises:
+        ValueError: If the job type is unknown.
+    """
+    if job["type"] == VERIFICATION_EMAIL:
+        return build_verification_email(job["username"], job["email"], job["link"])
+    raise ValueError(f"Unknown email job type: {job['type']}")
+
+async def send_message(msg):
+    """
+    Send a message over SMTP with STARTTLS without blocking the event loop.
+
+    Raises:
+        aiosmtplib.SMTPException: If the message could not be delivered.
+    """
+    await aiosmtplib.send(
+        msg,
+        hostname=settings.SMTP_SERVER,
+        port=settings.SMTP_PORT,
+        username=settings.SMTP_USER,
+        password=settings.SMTP_PASSWORD,
+        start_tls=True,
+        timeout=settings.SMTP_TIMEOUT,
+    )
+
+
+class EmailWorker:
+    """
+    Drains the email queue on the current event loop.
+
+    Jobs are taken in FIFO order with `BLMOVE` into this worker's own processing list
+    and only removed from it once they are sent, scheduled for a retry or dead-lettered,
+    so a crash or a cancelled send never loses a job. The processing lists of workers
+    whose heartbeat has expired are requeued when a worker starts, and periodically after.
+
+    A failed send is retried with exponential backoff (`EMAIL_RETRY_BACKOFF`, doubled per
+    attempt) up to `EMAIL_MAX_ATTEMPTS` times, after which the job is moved to the
+    dead-letter list for inspection. Several workers (e.g. one per uvicorn process) can
+    share a queue; delivery is at least once.
+    """
+
+    def __init__(self, worker_id: str | None = None):
+        """
+        Initializes the worker.
+
+        Args:
+            worker_id (str | None): Unique name of this worker; defaults to the host name and process id.
+        """
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.processing_key = f"{PROCESSING_KEY}:{self.worker_id}"
+        self.heartbeat_key = f"{HEARTBEAT_KEY}:{self.worker_id}"
+        self._redis: aioredis.Redis | None = None
+        self._task: asyncio.Task | None = None
+        self._stopping = asyncio.Event()
+
+    async def start(self):
+        """
+        Starts the worker as a background task on the running loop.
+        """
+        if self._task is not None and not self._task.done():
+            return
+        self._stopping = asyncio.Event()
+        self._task = asyncio.create_task(self.run(), name="email-worker")
+
+    async def stop(self):
+        """
+        Stops taking new jobs, waits up to `EMAIL_WORKER_STOP_TIMEOUT` for the email being
+        sent, then closes the Redis connection.
+
+        If the send does not finish in time it is cancelled; its job stays in the
+        processing list and is requeued when a worker next starts.
+        """
+        if self._task is not None:
+            self._stopping.set()
+            try:
+                await asyncio.wait_for(asyncio.shield(self._task), timeout=settings.EMAIL_WORKER_STOP_TIMEOUT)
+            except asyncio.TimeoutError:
+                logger.warning("Email worker did not finish its current job in time; cancelling it")
+                self._task.cancel()
+                try:
+                    await self._task
+                except asyncio.CancelledError:
+                    pass
+            self._task = None
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+    async def run(self):
+        """
+        Processes jobs until stopped, reconnecting with backoff if Redis goes away.
+        """
+        if self._redis is None:
+            self._redis = aioredis.Redis(host=settings.REDIS_HOST, port=settings.REDIS_PORT)
+        logger.info(f"Email worker {self.worker_id} listening on {settings.EMAIL_QUEUE_KEY}")
+
+        heartbeat = asyncio.create_task(self._heartbeat(), name="email-worker-heartbeat")
+        next_recovery = 0.0
+        backoff = 1
+        try:
+            while not self._stopping.is_set():
+                try:
+                    # On startup, then once per heartbeat TTL to pick up workers that died since
+                    if time.monotonic() >= next_recovery:
+                        await self._requeue_orphaned_jobs()
+                        next_recovery = time.monotonic() + settings.EMAIL_WORKER_HEARTBEAT_TTL
+                    await self._promote_due_retries()
+                    raw = await self._redis.blmove(settings.EMAIL_QUEUE_KEY, self.processing_key, 1, "RIGHT", "LEFT")
+                    backoff = 1
+                    if raw is not None:
+                        await self.process(raw)
+                except redis.RedisError as e:
+                    logger.warning(f"Email queue unavailable: {str(e)}; retrying in {backoff}s")
+                    try:
+                        await asyncio.wait_for(self._stopping.wait(), timeout=backoff)
+                    except asyncio.TimeoutError:
+                        pass
+                    backoff = min(backoff * 2, 30)
+        finally:
+            heartbeat.cancel()
+            try:
+                await heartbeat
+            except asyncio.CancelledError:
+                pass
+            if self._stopping.is_set():
+                try:
+                    await self._redis.delete(self.heartbeat_key)
+                except redis.RedisError:
+                    pass
+
+    async def process(self, raw: bytes | str):
+        """
+        Sends a single queued email, scheduling a retry or dead-lettering it on failure.
+
+        The job stays in this worker's processing list until it is sent, or until a retry
+        or dead letter replaces it there atomically, so it is always in one place or another.
+
+        Args:
+            raw (bytes | str): The JSON-encoded job, as taken from the queue.
+        """
+        try:
+            job = json.loads(raw)
+            msg = _build_message(job)
+        except (ValueError, KeyError, TypeError) as e:
+            logger.error(f"Dropping malformed email job: {str(e)}")
+            await self._replace(raw, lambda pipe: pipe.lpush(DEAD_LETTER_KEY, raw))
+            return
+
+        try:
+            await send_message(msg)
+            await self._redis.lrem(self.processing_key, 1, raw)
+            logger.info(f"Sent {job['type']} email to {job['email']}")
+        except Exception as e:
+            job["attempts"] = job.get("attempts", 0) + 1
+            if job["attempts"] >= settings.EMAIL_MAX_ATTEMPTS:
+                logger.error(f"Giving up on {job['type']} email to {job['email']} after {job['attempts']} attempts: {str(e)}")
+                await self._replace(raw, lambda pipe: pipe.lpush(DEAD_LETTER_KEY, json.dumps(job)))
+                return
+
+            delay = settings.EMAIL_RETRY_BACKOFF * 2 ** (job["attempts"] - 1)
+            logger.warning(f"Sending {job['type']} email to {job['email']} failed: {str(e)}; retrying in {delay:.0f}s")
+            await self._replace(raw, lambda pipe: pipe.zadd(RETRY_KEY, {json.dumps(job): time.time() + delay}))
+
+    async def _replace(self, raw: bytes | str, queue_next):
+        """
+        Removes `raw` from the processing list and runs `queue_next(pipe)` in one transaction.
+        """
+        async with self._redis.pipeline(transaction=True) as pipe:
+            queue_next(pipe)
+            pipe.lrem(self.processing_key, 1, raw)
+            await pipe.execute()
+
+    async def _heartbeat(self):
+        """
+        Keeps this worker's heartbeat key alive while it runs.
+        """
+        ttl = settings.EMAIL_WORKER_HEARTBEAT_TTL
+        while True:
+            try:
+                await self._redis.set(self.heartbeat_key, int(time.time()), px=int(ttl * 1000))
+            except redis.RedisError:
+                pass  # run() reports the outage
+            await asyncio.sleep(ttl / 3)
+
+    async def _requeue_orphaned_jobs(self):
+        """
+        Moves the jobs left in the processing lists of stopped or crashed workers, and in
+        this worker's own list from a previous run, back onto the queue.
+        """
+        async for key in self._redis.scan_iter(match=f"{PROCESSING_KEY}:*"):
+            key = key.decode() if isinstance(key, bytes) else key
+            worker_id = key[len(PROCESSING_KEY) + 1:]
+            if worker_id != self.worker_id and await self._redis.exists(f"{HEARTBEAT_KEY}:{worker_id}"):
+                continue
+            # LMOVE is atomic, so two workers recovering the same list never requeue a job twice
+            while await self._redis.lmove(key, settings.EMAIL_QUEUE_KEY, "RIGHT", "RIGHT") is not None:
+                logger.warning(f"Requeued an email job left unfinished by worker {worker_id}")
+
+    async def _promote_due_retries(self):
+        """
+        Moves retries whose backoff has elapsed back onto the queue.
+        """
+        due = await self._redis.zrangebyscore(RETRY_KEY, 0, time.time(), start=0, num=100)
+        for raw in due:
+            # Only the worker whose ZREM succeeds requeues the job
+            if await self._redis.zrem(RETRY_KEY, raw):
+                await self._redis.lpush(settings.EMAIL_QUEUE_KEY, raw)
+
+
+async def main():
+    """
+    Runs a standalone worker until SIGINT or SIGTERM, then lets the current email finish.
+    """
+    worker = EmailWorker()
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    await worker.start()
+    await stop.wait()
+    await worker.stop()
+
+
+# Worker embedded in the API process (see app.main)
+email_worker = EmailWorker()
+
+
+if __name__ == "__main__":
+    # Standalone entrypoint: python -m app.services.email_queue
+    asyncio.run(main())
@@ -0,0 +1,170 @@
+import argparse
+import json
+import multiprocessing
+import os
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from passlib.exc import MissingBackendError
+from rich.console import Console
+from rich.table import Table
+
+from app.core.config import settings
+from app.core.security import build_crypt_context
+
+# Password used for every measurement; its value does not affect bcrypt/argon2 cost
+BENCHMARK_PASSWORD = "Benchmark#Passw0rd"
+
+
+def _context_for(config: dict):
+    """
+    Build a CryptContext that hashes with exactly the scheme and cost in `config`.
+    """
+    if config["scheme"] == "bcrypt":
+        return build_crypt_context(schemes=["bcrypt"], bcrypt_rounds=config["rounds"])
+    return build_crypt_context(
+        schemes=["argon2"],
+        argon2_time_cost=config["time_cost"],
+        argon2_memory_cost=config["memory_cost"],
+        argon2_parallelism=config["parallelism"],
+    )
+
+
+def _label(config: dict) -> str:
+    if config["scheme"] == "bcrypt":
+        return f"bcrypt rounds={config['rounds']}"
+    return f"argon2id t={config['time_cost']} m={config['memory_cost']}KiB p={config['parallelism']}"
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _verify_many(config: dict, hashed: str, count: int) -> int:
+    # Runs in a pool worker: verify `count` times and report how many succeeded
+    context = _context_for(config)
+    return sum(context.verify(BENCHMARK_PASSWORD, hashed) for _ in range(count))
+
+
+def benchmark(config: dict, iterations: int, processes: int) -> dict:
+    """
+    Measure hash and verify latency for one scheme/cost, plus verify throughput across processes.
+
+    Args:
+        config (dict): The scheme (`bcrypt` or `argon2`) and its cost parameters.
+        iterations (int): Number of timed hash and verify calls.
+        processes (int): Worker processes used for the throughput run.
+
+    Returns:
+        dict: Latencies in milliseconds (mean/p50/p95) and verify throughput in operations per second.
+    """
+    context = _context_for(config)
+
+    hash_ms, verify_ms = [], []
+    hashed = context.hash(BENCHMARK_PASSWORD)  # warm-up, also loads the backend
+    for _ in range(iterations):
+        start = time.perf_counter()
+        hashed = context.hash(BENCHMARK_PASSWORD)
+        hash_ms.append((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        context.verify(BENCHMARK_PASSWORD, hashed)
+        verify_ms.append((time.perf_counter() - start) * 1000)
+
+    # Throughput with every process busy, as under a login burst
+    with ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context("spawn")) as pool:
+        list(pool.map(_verify_many, [config] * processes, [hashed] * processes, [1] * processes))  # start workers
+        start = time.perf_counter()
+        verified = sum(pool.map(_verify_many, [config] * processes, [hashed] * processes, [iterations] * processes))
+        elapsed = time.perf_counter() - start
+
+    return {
+        **config,
+        "label": _label(config),
+        "hash_ms_mean": statistics.fmean(hash_ms),
+        "hash_ms_p50": _percentile(hash_ms, 50),
+        "hash_ms_p95": _percentile(hash_ms, 95),
+        "verify_ms_mean": statistics.fmean(verify_ms),
+        "verify_ms_p50": _percentile(verify_ms, 50),
+        "verify_ms_p95": _percentile(verify_ms, 95),
+        "verify_ops_per_sec": verified / elapsed,
+        "processes": processes,
+    }
+
+
+def _parse_argon2(value: str) -> dict:
+    try:
+        time_cost, memory_cost, parallelism = (int(part) for part in value.split(":"))
+    except ValueError:
+        raise argparse.ArgumentTypeError("expected TIME:MEMORY_KIB:PARALLELISM, e.g. 3:65536:4")
+    return {"scheme": "argon2", "time_cost": time_cost, "memory_cost": memory_cost, "parallelism": parallelism}
+
+
+def main(argv: list[str] | None = None):
+    """
+    Benchmark password hashing on this machine to pick `PASSWORD_BCRYPT_ROUNDS` or argon2 costs.
+
+    Usage: python -m app.services.hash_benchmark [--bcrypt-rounds 10 11 12 13] [--argon2 3:65536:4] [--target-ms 250]
+
+    Args:
+        argv (list[str] | None): Command-line arguments; defaults to `sys.argv[1:]`.
+    """
+    parser = argparse.ArgumentParser(description="Measure password hash/verify latency and throughput.")
+    parser.add_argument("--bcrypt-rounds", type=int, nargs="*", default=[10, 11, 12, 13],
+                        help="bcrypt cost factors to measure (default: 10 11 12 13)")
+    parser.add_argument("--argon2", type=_parse_argon2, nargs="*", metavar="T:M:P",
+                        default=[_parse_argon2(f"{settings.PASSWORD_ARGON2_TIME_COST}:{settings.PASSWORD_ARGON2_MEMORY_COST}:{settings.PASSWORD_ARGON2_PARALLELISM}")],
+                        help="argon2id time_cost:memory_cost_kib:parallelism settings to measure (default: current settings)")
+    parser.add_argument("--iterations", type=int, default=10, help="timed calls per setting (default: 10)")
+    parser.add_argument("--processes", type=int, default=settings.PASSWORD_HASH_WORKERS,
+                        help="processes for the throughput run (default: PASSWORD_HASH_WORKERS)")
+    parser.add_argument("--target-ms", type=float, default=250.0,
+                        help="verify latency budget used for the recommendation (default: 250)")
+    parser.add_argument("--json", action="store_true", help="print results as JSON instead of a table")
+    args = parser.parse_args(argv)
+
+    configs = [{"scheme": "bcrypt", "rounds": rounds} for rounds in args.bcrypt_rounds] + list(args.argon2 or [])
+
+    console = Console()
+    results = []
+    for config in configs:
+        try:
+            results.append(benchmark(config, args.iterations, max(1, args.processes)))
+        except MissingBackendError as e:
+            console.print(f"[yellow]Skipping {_label(config)}: {e}[/yellow]")
+
+    # Strongest setting of each scheme whose median verify time fits the budget
+    recommended = {}
+    for result in results:
+        if result["verify_ms_p50"] <= args.target_ms:
+            recommended[result["scheme"]] = result["label"]
+
+    if args.json:
+        print(json.dumps({"cpu_count": os.cpu_count(), "results": results, "recommended": recommended}, indent=2))
+        return
+
+    table = Table(title=f"Password hashing on {os.cpu_count()} CPUs ({args.iterations} iterations)")
+    for column in ("setting", "hash p50 ms", "hash p95 ms", "verify p50 ms", "verify p95 ms", "verify ops/s"):
+        table.add_column(column, justify="left" if column == "setting" else "right")
+    for result in results:
+        table.add_row(
+            result["label"],
+            f"{result['hash_ms_p50']:.1f}",
+            f"{result['hash_ms_p95']:.1f}",
+            f"{result['verify_ms_p50']:.1f}",
+            f"{result['verify_ms_p95']:.1f}",
+            f"{result['verify_ops_per_sec']:.1f} ({result['processes']} proc)",
+        )
+    console.print(table)
+
+    for scheme, label in recommended.items():
+        console.print(f"Recommended {scheme} within {args.target_ms:.0f} ms: [green]{label}[/green]")
+    if not recommended:
+        console.print(f"[red]No setting verifies within {args.target_ms:.0f} ms on this machine.[/red]")
+
+
+if __name__ == "__main__":
+    main()
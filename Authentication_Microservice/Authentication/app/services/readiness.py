@@ -0,0 +1,125 @@
+# Identical in the Auth and Event services; Videochat shares ReadinessProbe. Change the copies together.
+import asyncio
+import logging
+import random
+import time
+from typing import Awaitable, Callable
+
+import redis.asyncio as aioredis
+from redis.asyncio.retry import Retry
+from redis.backoff import NoBackoff
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.core.db import async_engine
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class ReadinessProbe:
+    """
+    Tracks the external dependencies this service needs and whether they are reachable.
+
+    Each dependency is an async check that raises if it is unavailable. `wait_until_ready`
+    polls all of them concurrently with exponential backoff, so startup never sleeps on
+    one dependency while another is already up, and `check` runs them once for `/readyz`.
+    Optional dependencies are reported but do not make the service unready.
+    """
+
+    def __init__(self):
+        self._checks: dict[str, tuple[Callable[[], Awaitable[None]], bool]] = {}
+        self.started = False  # Set once every required dependency has answered
+
+    def add_check(self, name: str, check: Callable[[], Awaitable[None]], required: bool = True):
+        """
+        Registers a dependency check.
+
+        Args:
+            name (str): Name reported by `/readyz`.
+            check (Callable[[], Awaitable[None]]): Coroutine function that raises if the dependency is down.
+            required (bool): Whether the service is unready while this check fails.
+        """
+        self._checks[name] = (check, required)
+
+    async def _run(self, name: str) -> str | None:
+        # Returns None on success, or the reason the check failed
+        check, _ = self._checks[name]
+        try:
+            await asyncio.wait_for(check(), timeout=settings.READINESS_CHECK_TIMEOUT)
+            return None
+        except Exception as e:
+            return str(e) or type(e).__name__
+
+    async def _wait_for(self, name: str, deadline: float):
+        delay = 0.1
+        attempt = 1
+        while True:
+            error = await self._run(name)
+            if error is None:
+                logger.info(f"{name} is ready!")
+                return
+            if time.monotonic() + delay > deadline:
+                raise TimeoutError(f"{name} is not available after {attempt} attempts: {error}")
+            logger.warning(f"{name} is not ready yet, retrying in {delay:.1f}s (attempt {attempt}): {error}")
+            await asyncio.sleep(delay * random.uniform(0.8, 1.2))
+            delay = min(delay * 2, settings.STARTUP_MAX_BACKOFF)
+            attempt += 1
+
+    async def wait_until_ready(self, timeout: float | None = None):
+        """
+        Waits until every required dependency answers, polling them concurrently.
+
+        Args:
+            timeout (float | None): Seconds to wait; defaults to `STARTUP_TIMEOUT`.
+
+        Raises:
+            TimeoutError: If a required dependency is still down after `timeout`.
+        """
+        deadline = time.monotonic() + (settings.STARTUP_TIMEOUT if timeout is None else timeout)
+        required = [name for name, (_, is_required) in self._checks.items() if is_required]
+        await asyncio.gather(*(self._wait_for(name, deadline) for name in required))
+        self.started = True
+
+    async def check(self) -> tuple[bool, dict[str, str]]:
+        """
+        Runs every check once, concurrently.
+
+        Returns:
+            tuple[bool, dict[str, str]]: Whether all required dependencies are up, and
+            "ok" or the failure reason per dependency.
+        """
+        names = list(self._checks)
+        errors = await asyncio.gather(*(self._run(name) for name in names))
+        results = {name: error or "ok" for name, error in zip(names, errors)}
+        ready = all(error is None for name, error in zip(names, errors) if self._checks[name][1])
+        return ready, results
+
+
+async def check_postgres():
+    """
+    Runs `SELECT 1` over the async engine's pool.
+    """
+    async with async_engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+async def check_redis():
+    """
+    Pings Redis with a short-lived client that fails fast instead of retrying.
+    """
+    client = aioredis.Redis(
+        host=settings.REDIS_HOST,
+        port=settings.REDIS_PORT,
+        socket_connect_timeout=settings.READINESS_CHECK_TIMEOUT,
+        retry=Retry(NoBackoff(), 0),
+    )
+    try:
+        await client.ping()
+    finally:
+        await client.aclose()
+
+
+# Process-wide probe. Whether Redis is required differs per service, see READINESS_REDIS_REQUIRED.
+readiness = ReadinessProbe()
+readiness.add_check("postgres", check_postgres)
+readiness.add_check("redis", check_redis, required=settings.READINESS_REDIS_REQUIRED)
@@ -0,0 +1,65 @@
+import logging
+
+import redis
+import redis.asyncio as aioredis
+from redis.asyncio.retry import Retry
+from redis.backoff import NoBackoff
+
+from app.core.config import settings
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Clients for the current token version of each user; connections are opened lazily.
+# Only users whose version was ever bumped have a key, so a missing key means version 0.
+redis_client = redis.Redis(
+    host=settings.REDIS_HOST,
+    port=settings.REDIS_PORT,
+    socket_timeout=1,
+    socket_connect_timeout=1,
+)
+# Read on every stateless request, so fail fast (no retries) and let the caller use the database
+aio_redis_client = aioredis.Redis(
+    host=settings.REDIS_HOST,
+    port=settings.REDIS_PORT,
+    socket_timeout=1,
+    socket_connect_timeout=1,
+    retry=Retry(NoBackoff(), 0),
+)
+
+def _key(email: str) -> str:
+    return f"{settings.TOKEN_VERSION_KEY_PREFIX}:{email}"
+
+def publish_token_version(email: str, version: int):
+    """
+    Record a user's current token version so that stateless authentication can reject
+    tokens issued before it.
+
+    Publishing is best effort: the new version has already been committed, and requests
+    that cannot read it from Redis fall back to the database. A failure is logged, and
+    until the key is written stateless tokens with the old version are still accepted.
+
+    Args:
+        email (str): The email of the user.
+        version (int): The user's token version as committed.
+    """
+    try:
+        redis_client.set(_key(email), version)
+    except redis.RedisError as e:
+        logger.error(f"Failed to publish the token version of {email}: {str(e)}")
+
+async def get_token_version_async(email: str) -> int:
+    """
+    Return a user's current token version.
+
+    Args:
+        email (str): The email of the user.
+
+    Returns:
+        int: The version, or 0 if it was never bumped.
+
+    Raises:
+        redis.RedisError: If Redis is unreachable; the caller should check the database instead.
+    """
+    version = await aio_redis_client.get(_key(email))
+    return int(version) if version is not None else 0
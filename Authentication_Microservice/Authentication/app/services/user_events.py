@@ -0,0 +1,49 @@
+import json
+import logging
+from datetime import datetime, timezone
+
+import redis
+
+from app.core.config import settings
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Event types published on the user-events channel
+USER_CREATED = "user.created"
+USER_VERIFIED = "user.verified"
+USER_UPDATED = "user.updated"
+USER_DELETED = "user.deleted"
+
+# Redis client used for publishing; connections are opened lazily
+redis_client = redis.Redis(
+    host=settings.REDIS_HOST,
+    port=settings.REDIS_PORT,
+    socket_timeout=1,
+    socket_connect_timeout=1,
+)
+
+def publish_user_event(event_type: str, email: str, **fields):
+    """
+    Publish a user-change event so that other services can invalidate cached user data.
+
+    Publishing is best effort: the database change has already been committed when
+    this is called, so a Redis failure is logged rather than raised. Subscribers
+    must still rely on their cache TTLs as a backstop.
+
+    Args:
+        event_type (str): One of USER_CREATED, USER_VERIFIED, USER_UPDATED or USER_DELETED.
+        email (str): The email of the user that changed.
+        **fields: Extra attributes to include in the event (e.g. the new username).
+    """
+    payload = {
+        "type": event_type,
+        "email": email,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        **fields,
+    }
+
+    try:
+        redis_client.publish(settings.USER_EVENTS_CHANNEL, json.dumps(payload))
+    except redis.RedisError as e:
+        logger.error(f"Failed to publish {event_type} event for {email}: {str(e)}")
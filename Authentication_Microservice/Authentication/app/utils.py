@@ -73,17 +73,17 @@ def send_sms(phone_number: str, message: str):
     pass  # TODO: implemnt the logic of otp
 
 # Email utility
-def send_verification_email(to_username: str, to_email: str, verification_link: str):
+def build_verification_email(to_username: str, to_email: str, verification_link: str) -> MIMEMultipart:
     """
-    Sends a verification email to the user with a registration link.
+    Builds the verification email containing the registration link.
 
     Args:
     - to_username (str): The username of the recipient.
     - to_email (str): The email address of the recipient.
     - verification_link (str): The link the recipient needs to click to verify their email.
 
-    Raises:
-    - SMTPException: If an error occurs while sending the email.
+    Returns:
+    - MIMEMultipart: The message, ready to be sent.
     """
     msg = MIMEMultipart()
     msg['From'] = f'Dodgygeezers.co<{settings.EMAIL_FROM}>'
@@ -106,6 +106,24 @@ def send_verification_email(to_username: str, to_email: str, verification_link:
     </html>
     """
     msg.attach(MIMEText(body, 'plain'))
+    return msg
+
+def send_verification_email(to_username: str, to_email: str, verification_link: str):
+    """
+    Sends a verification email to the user with a registration link, synchronously.
+
+    Request handlers should enqueue the email with `app.services.email_queue` instead;
+    this is the fallback used when the queue is unavailable.
+
+    Args:
+    - to_username (str): The username of the recipient.
+    - to_email (str): The email address of the recipient.
+    - verification_link (str): The link the recipient needs to click to verify their email.
+
+    Raises:
+    - SMTPException: If an error occurs while sending the email.
+    """
+    msg = build_verification_email(to_username, to_email, verification_link)
 
     try:
         with smtplib.SMTP(settings.SMTP_SERVER, settings.SMTP_PORT) as server:
@@ -0,0 +1,141 @@
+import asyncio
+import os
+import uuid
+
+import psycopg2
+import pytest
+from dotenv import load_dotenv
+from psycopg2 import sql
+
+# Same environment file as app.core.config
+load_dotenv(".env.development" if os.getenv("ENV") == "development" else ".env.production")
+
+# Every session runs against its own database, created on the PostgreSQL server in
+# DB_HOST/DB_PORT and dropped afterwards, so the tests never touch DB_NAME itself.
+# This has to happen before app.core.config reads DB_NAME.
+SERVER = {
+    "host": os.getenv("DB_HOST"),
+    "port": os.getenv("DB_PORT"),
+    "user": os.getenv("DB_USER"),
+    "password": os.getenv("DB_PASSWORD"),
+}
+TEST_DB_NAME = f"auth_test_{uuid.uuid4().hex[:12]}"
+os.environ["DB_NAME"] = TEST_DB_NAME
+
+# Cheap hashes keep the hashing pool fast; tests that need an outdated hash use fewer rounds
+os.environ["PASSWORD_BCRYPT_ROUNDS"] = "5"
+os.environ["PASSWORD_HASH_WORKERS"] = "1"
+
+PASSWORD = "Test_pass1"
+
+
+def _admin_connection():
+    connection = psycopg2.connect(dbname="postgres", connect_timeout=5, **SERVER)
+    connection.autocommit = True
+    return connection
+
+
+@pytest.fixture(scope="session")
+def database():
+    """
+    Creates the session's database and its schema.
+    """
+    if not SERVER["host"]:
+        pytest.skip("DB_HOST is not set; these tests need a PostgreSQL server")
+    try:
+        admin = _admin_connection()
+    except psycopg2.OperationalError as e:
+        pytest.skip(f"PostgreSQL is not available: {e}")
+
+    with admin.cursor() as cursor:
+        cursor.execute(sql.SQL("CREATE DATABASE {}").format(sql.Identifier(TEST_DB_NAME)))
+
+    from app.bootstrap import bootstrap_schema
+    from app.core.db import engine, async_engine
+    from app.core.security import shutdown_hash_pool
+
+    bootstrap_schema()
+    yield engine
+
+    shutdown_hash_pool()
+    engine.dispose()
+    asyncio.run(async_engine.dispose())
+    with admin.cursor() as cursor:
+        cursor.execute(sql.SQL("DROP DATABASE {} WITH (FORCE)").format(sql.Identifier(TEST_DB_NAME)))
+    admin.close()
+
+
+@pytest.fixture
+def db(database):
+    """
+    A session on an empty database.
+    """
+    from sqlalchemy import text
+    from app.core.db import SessionLocal
+    from app.core.token_cache import token_cache
+
+    with database.begin() as conn:
+        conn.execute(text("TRUNCATE individual_users RESTART IDENTITY"))
+    token_cache.clear()
+    with SessionLocal() as session:
+        yield session
+
+
+class Api:
+    """
+    Calls the app in-process. All requests share one event loop, like a server
+    process, so the async engine's pooled connections stay usable between them.
+    """
+
+    def __init__(self, app):
+        import httpx
+
+        self.loop = asyncio.new_event_loop()
+        self.client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+    def get(self, url: str, bearer: str | None = None, **params):
+        headers = {"Authorization": f"Bearer {bearer}"} if bearer else {}
+        return self.loop.run_until_complete(self.client.get(url, params=params, headers=headers))
+
+    def post(self, url: str, json: dict):
+        return self.loop.run_until_complete(self.client.post(url, json=json))
+
+    def close(self):
+        self.loop.run_until_complete(self.client.aclose())
+        self.loop.close()
+
+
+@pytest.fixture(scope="session")
+def api(database):
+    """
+    Client for the app.
+    """
+    from app.main import app
+
+    client = Api(app)
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def add_user(db):
+    """
+    Inserts a verified user with the password PASSWORD.
+    """
+    from app.core.security import pwd_context
+    from app.models import IndividualUser
+
+    def add(email: str = "user@example.com", hashed_password: str | None = None, verified: bool = True) -> IndividualUser:
+        user = IndividualUser(
+            username=email.split("@")[0],
+            email=email,
+            phone_number=f"+44{db.query(IndividualUser).count() + 7000000000}",
+            hashed_password=hashed_password or pwd_context.hash(PASSWORD),
+            is_email_verified=verified,
+            is_phone_verified=verified,
+        )
+        db.add(user)
+        db.commit()
+        return user
+
+    return add
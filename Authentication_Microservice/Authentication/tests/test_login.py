@@ -0,0 +1,75 @@
+import pytest
+from passlib.hash import bcrypt
+from sqlalchemy import select, text
+
+from app.models import IndividualUser
+from conftest import PASSWORD
+
+# Fewer rounds than PASSWORD_BCRYPT_ROUNDS, so login upgrades the hash
+OUTDATED_HASH = bcrypt.using(rounds=4).hash(PASSWORD)
+
+
+def _stored_hash(database, email: str) -> str:
+    with database.connect() as conn:
+        return conn.execute(select(IndividualUser.hashed_password).where(IndividualUser.email == email)).scalar_one()
+
+
+@pytest.fixture
+def reject_hash_updates(database):
+    """
+    Makes PostgreSQL reject every change to a stored password hash.
+    """
+    with database.begin() as conn:
+        conn.execute(text("""
+            CREATE FUNCTION reject_hash_update() RETURNS trigger AS $$
+            BEGIN
+                RAISE EXCEPTION 'password hash updates are disabled';
+            END;
+            $$ LANGUAGE plpgsql
+        """))
+        conn.execute(text("""
+            CREATE TRIGGER reject_hash_update BEFORE UPDATE OF hashed_password ON individual_users
+            FOR EACH ROW EXECUTE FUNCTION reject_hash_update()
+        """))
+    yield
+    with database.begin() as conn:
+        conn.execute(text("DROP TRIGGER reject_hash_update ON individual_users"))
+        conn.execute(text("DROP FUNCTION reject_hash_update()"))
+
+
+def test_login_upgrades_an_outdated_hash(api, database, add_user):
+    add_user(hashed_password=OUTDATED_HASH)
+
+    response = api.post("/auth/login", {"email": "user@example.com", "password": PASSWORD})
+
+    assert response.status_code == 200
+    assert response.json()["access_token"]
+    upgraded = _stored_hash(database, "user@example.com")
+    assert upgraded.startswith("$2b$05$")
+    assert bcrypt.verify(PASSWORD, upgraded)
+
+
+def test_login_succeeds_when_the_hash_upgrade_fails(api, database, add_user, reject_hash_updates):
+    add_user(hashed_password=OUTDATED_HASH)
+
+    response = api.post("/auth/login", {"email": "user@example.com", "password": PASSWORD})
+
+    assert response.status_code == 200
+    assert response.json()["access_token"]
+    assert _stored_hash(database, "user@example.com") == OUTDATED_HASH
+
+
+def test_login_rejects_a_wrong_password(api, add_user):
+    add_user()
+
+    response = api.post("/auth/login", {"email": "user@example.com", "password": "Wrong_pass1"})
+
+    assert response.status_code == 400
+
+
+def test_login_rejects_an_unverified_user(api, add_user):
+    add_user(verified=False)
+
+    response = api.post("/auth/login", {"email": "user@example.com", "password": PASSWORD})
+
+    assert response.status_code == 403
@@ -0,0 +1,80 @@
+import pytest
+from jose import jwt
+from sqlalchemy import select, text, update
+
+from app.bootstrap import bootstrap_schema
+from app.core.config import settings
+from app.models import IndividualUser
+from app.services.token_versions import publish_token_version
+from app.utils import generate_verification_token
+from conftest import PASSWORD
+
+
+def _login(api) -> str:
+    response = api.post("/auth/login", {"email": "user@example.com", "password": PASSWORD})
+    assert response.status_code == 200, response.text
+    return response.json()["access_token"]
+
+
+def _token_version(database) -> int:
+    with database.connect() as conn:
+        return conn.execute(select(IndividualUser.token_version).where(IndividualUser.email == "user@example.com")).scalar_one()
+
+
+def _bump_token_version(database):
+    with database.begin() as conn:
+        version = conn.execute(
+            update(IndividualUser)
+            .values(token_version=IndividualUser.token_version + 1)
+            .returning(IndividualUser.token_version)
+        ).scalar_one()
+    publish_token_version("user@example.com", version)
+
+
+@pytest.fixture(params=[False, True], ids=["stateful", "stateless"])
+def auth_mode(request, monkeypatch):
+    monkeypatch.setattr(settings, "JWT_STATELESS_AUTH", request.param)
+
+
+def test_token_carries_the_users_token_version(api, database, add_user):
+    add_user()
+    _bump_token_version(database)
+
+    claims = jwt.get_unverified_claims(_login(api))
+
+    assert claims["tv"] == 1
+
+
+def test_bumping_the_token_version_revokes_older_tokens(api, database, add_user, auth_mode):
+    add_user()
+    token = _login(api)
+    assert api.get("/user/dashboard", bearer=token).status_code == 200
+
+    _bump_token_version(database)
+
+    response = api.get("/user/dashboard", bearer=token)
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Token has been revoked"
+    assert api.get("/user/dashboard", bearer=_login(api)).status_code == 200
+
+
+def test_verification_bumps_the_token_version_once(api, database, add_user):
+    add_user(verified=False)
+    token = generate_verification_token("user@example.com")
+
+    assert api.get("/auth/verify-email", token=token).status_code == 200
+    assert _token_version(database) == 1
+
+    # Verifying again does not change the status, so existing tokens stay valid
+    assert api.get("/auth/verify-email", token=token).status_code == 200
+    assert _token_version(database) == 1
+
+
+def test_bootstrap_adds_the_token_version_column(database, db):
+    with database.begin() as conn:
+        conn.execute(text("ALTER TABLE individual_users DROP COLUMN token_version"))
+
+    bootstrap_schema()
+
+    with database.connect() as conn:
+        assert conn.execute(text("SELECT token_version FROM individual_users")).all() == []
@@ -1,19 +1,21 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Literal, Optional
 from uuid import UUID
+from datetime import datetime, timedelta, timezone
 
-from app.models import EventOut, EventCreate, EventUpdate
-from app.crud import create_event, get_events, get_event, get_all_events, update_event, delete_event
-from app.core.db import get_db
-from app.utils import validate_user
+from app.models import EventOut, EventPage, EventCreate, EventUpdate, TagCount, as_naive_utc
+from app.crud import create_event_async, get_events_async, search_events_async, get_tag_counts_async, get_event_async, get_all_events_async, update_event_async, delete_event_async
+from app.core.config import settings
+from app.core.db import get_async_db
+from app.utils import validate_user_async
 from app.tasks import send_event_created_email
 
 router = APIRouter()
 
 # Create a new event
 @router.post("/", response_model=EventOut)
-def create_new_event(event: EventCreate, db: Session = Depends(get_db)):
+async def create_new_event(event: EventCreate, db: AsyncSession = Depends(get_async_db)):
     """
     Creates a new event in the system.
     
@@ -22,48 +24,145 @@ def create_new_event(event: EventCreate, db: Session = Depends(get_db)):
     """
     try:
         # Validate organizer's email through an authentication microservice
-        validate_user(event.organizer_email)
+        await validate_user_async(event.organizer_email)
     except HTTPException as e:
         raise e  # Raise the exception if validation fails
 
-    created_event = create_event(db=db, event=event)
+    created_event = await create_event_async(db=db, event=event)
 
     # Send email notification about the event creation
     send_event_created_email.apply_async((created_event.id, event.organizer_email))
     
     return created_event
 
-# Get all events that the user is a member of
-@router.get("/all", response_model=List[EventOut])
-def read_all_events(db: Session = Depends(get_db)):
+# Pagination query parameters shared by the event listings
+def page_params(
+    cursor: Optional[str] = None,
+    limit: int = Query(settings.EVENT_PAGE_SIZE, ge=1, le=settings.EVENT_PAGE_SIZE_MAX),
+    unbounded: bool = False,
+) -> dict:
     """
-    Retrieves all of events in dodgygeezers.
-    
     Arguments:
-    - user_email: The user's email to check membership
+    - cursor: The `next_cursor` of the previous page; omit for the first page
+    - limit: The maximum number of events to return
+    - unbounded: Return every remaining event in one response, ignoring `limit`
+    """
+    return {"cursor": cursor, "limit": None if unbounded else limit}
+
+# Filter query parameters shared by the event listings
+def filter_params(
+    tags: Optional[str] = None,
+    match: Literal["any", "all"] = "any",
+    date_from: Optional[datetime] = Query(None, alias="from"),
+    date_to: Optional[datetime] = Query(None, alias="to"),
+) -> dict:
+    """
+    Arguments:
+    - tags: Comma-separated tags; only events with these tags are returned
+    - match: Whether events need `any` of the tags or `all` of them
+    - from: Only events on or after this time (UTC unless an offset is given)
+    - to: Only events before this time (UTC unless an offset is given)
+    """
+    if date_from and date_to and as_naive_utc(date_from) > as_naive_utc(date_to):
+        raise HTTPException(status_code=400, detail="`from` must not be after `to`")
+    tag_list = [tag.strip() for tag in tags.split(",") if tag.strip()] if tags else None
+    return {"tags": tag_list, "match_all": match == "all", "date_from": date_from, "date_to": date_to}
+
+# Get a page of all events
+@router.get("/all", response_model=EventPage)
+async def read_all_events(
+    user_email: Optional[str] = None,
+    page: dict = Depends(page_params),
+    filters: dict = Depends(filter_params),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Retrieves a page of all events in dodgygeezers, ordered by date.
+
+    Arguments:
+    - user_email: If given, each event's `is_member` says whether this user is a member
+    - cursor, limit, unbounded: Pagination, see `page_params`
+    - tags, match: Filters, see `filter_params`
     """
     # try:
     #     # Validate user's email through an authentication microservice
     #     validate_user(user_email)
     # except HTTPException as e:
     #     raise e  # Raise the exception if validation fails
-    
-    return get_all_events(db=db)
 
-# Get all events that the user is a member of
-@router.get("/", response_model=List[EventOut])
-def read_events(user_email: str, db: Session = Depends(get_db)):
+    return await get_all_events_async(db=db, user_email=user_email, **page, **filters)
+
+# Get a page of the events that the user is a member of
+@router.get("/", response_model=EventPage)
+async def read_events(
+    user_email: str,
+    page: dict = Depends(page_params),
+    filters: dict = Depends(filter_params),
+    db: AsyncSession = Depends(get_async_db),
+):
     """
-    Retrieves a list of events where the user is a member.
-    
+    Retrieves a page of the events where the user is a member, ordered by date.
+
+    Arguments:
+    - user_email: The user's email to check membership
+    - cursor, limit, unbounded: Pagination, see `page_params`
+    - tags, match: Filters, see `filter_params`
+    """
+    return await get_events_async(db=db, user_email=user_email, **page, **filters)
+
+# Get the user's events in the next few days
+@router.get("/upcoming", response_model=EventPage)
+async def read_upcoming_events(
+    user_email: str,
+    days: int = Query(7, ge=1, le=365),
+    page: dict = Depends(page_params),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Retrieves a page of the events where the user is a member that start within the
+    next `days` days, soonest first.
+
+    Arguments:
+    - user_email: The user's email to check membership
+    - days: How many days ahead to look
+    - cursor, limit, unbounded: Pagination, see `page_params`
+    """
+    now = datetime.now(timezone.utc)
+    return await get_events_async(db=db, user_email=user_email, date_from=now, date_to=now + timedelta(days=days), **page)
+
+# Get the most used tags with their event counts
+@router.get("/tags", response_model=List[TagCount])
+async def read_tag_counts(limit: int = Query(20, ge=1, le=100), db: AsyncSession = Depends(get_async_db)):
+    """
+    Retrieves the most used tags and how many events carry each, most used first.
+
+    Arguments:
+    - limit: The number of tags to return
+    """
+    return await get_tag_counts_async(db=db, limit=limit)
+
+# Search the events that the user is a member of
+@router.get("/search", response_model=EventPage)
+async def search_events(
+    user_email: str,
+    q: str = Query(..., min_length=1, max_length=200),
+    page: dict = Depends(page_params),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Searches the title, location and description of the events where the user is a member,
+    most relevant first.
+
     Arguments:
+    - q: The search terms; "quoted phrases", `or` and `-excluded` words are supported
     - user_email: The user's email to check membership
+    - cursor, limit, unbounded: Pagination, see `page_params`
     """
-    return get_events(db=db, user_email=user_email)
+    return await search_events_async(db=db, user_email=user_email, q=q, **page)
 
 # Get a single event by its ID (only if the user is a member)
 @router.get("/{event_id}", response_model=EventOut)
-def read_event(event_id: str, user_email: str, db: Session = Depends(get_db)):
+async def read_event(event_id: UUID, user_email: str, db: AsyncSession = Depends(get_async_db)):
     """
     Retrieves a single event by its ID if the user is a member of the event.
     
@@ -71,11 +170,11 @@ def read_event(event_id: str, user_email: str, db: Session = Depends(get_db)):
     - event_id: The ID of the event to retrieve
     - user_email: The user's email to check membership
     """
-    return get_event(db=db, event_id=event_id, user_email=user_email)
+    return await get_event_async(db=db, event_id=event_id, user_email=user_email)
 
 # Update an existing event by its ID (only if the user is the organizer)
 @router.put("/{event_id}", response_model=EventOut)
-def update_existing_event(event_id: str, event: EventUpdate, user_email: str, db: Session = Depends(get_db)):
+async def update_existing_event(event_id: UUID, event: EventUpdate, user_email: str, db: AsyncSession = Depends(get_async_db)):
     """
     Updates an existing event by its ID, only if the user is the event organizer.
     
@@ -84,11 +183,11 @@ def update_existing_event(event_id: str, event: EventUpdate, user_email: str, db
     - event: The updated event data
     - user_email: The user's email to verify if they are the organizer
     """
-    return update_event(db=db, event_id=event_id, event=event, user_email=user_email)
+    return await update_event_async(db=db, event_id=event_id, event=event, user_email=user_email)
 
 # Delete an event by its ID (only by organizer)
 @router.delete("/{event_id}", response_model=EventOut)
-def delete_existing_event(event_id: str, user_email: str, db: Session = Depends(get_db)):
+async def delete_existing_event(event_id: UUID, user_email: str, db: AsyncSession = Depends(get_async_db)):
     """
     Deletes an event by its ID, only if the user is the event organizer.
     
@@ -96,5 +195,5 @@ def delete_existing_event(event_id: str, user_email: str, db: Session = Depends(
     - event_id: The ID of the event to delete
     - user_email: The user's email to verify if they are the organizer
     """
-    deleted_event = delete_event(db=db, event_id=event_id, user_email=user_email)
+    deleted_event = await delete_event_async(db=db, event_id=event_id, user_email=user_email)
     return deleted_event
\ No newline at end of file
@@ -1,17 +1,17 @@
 from fastapi import APIRouter, HTTPException, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timezone
 
-from app.models import ReminderCreate, ReminderOut, EventReminderOut
+from app.models import ReminderCreate, ReminderOut, EventReminderOut, as_naive_utc
 from app.tasks import send_event_reminder_email
-from app.core.db import get_db
-from app.crud import get_event, create_reminder_entry, get_reminders, delete_reminder_entry
-from app.utils import validate_user
+from app.core.db import get_async_db
+from app.crud import get_event_async, create_reminder_entry_async, get_reminders_async, delete_reminder_entry_async
+from app.utils import validate_user_async
 
 router = APIRouter()
 
 @router.post("/", response_model=ReminderOut)
-def create_reminder(reminder: ReminderCreate, db: Session = Depends(get_db)):
+async def create_reminder(reminder: ReminderCreate, db: AsyncSession = Depends(get_async_db)):
     """
     Creates a new reminder for an event, ensuring the reminder time is in the future and the event exists.
     
@@ -27,23 +27,22 @@ def create_reminder(reminder: ReminderCreate, db: Session = Depends(get_db)):
     """
     try:
         # Validate user email
-        validate_user(reminder.user_email)
+        await validate_user_async(reminder.user_email)
     except HTTPException as e:
         raise e  # Raise the exception if validation fails
 
     # Validate that the event exists
-    event = get_event(db, reminder.event_id, reminder.user_email)
+    event = await get_event_async(db, reminder.event_id, reminder.user_email)
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
 
     # Validate that the reminder time is in the future
-    now = datetime.now(timezone.utc)
-    reminder_time = reminder.reminder_time.astimezone(timezone.utc)
-    if reminder_time <= now:
+    now = as_naive_utc(datetime.now(timezone.utc))
+    if reminder.reminder_time <= now:
         raise HTTPException(status_code=400, detail="Reminder time must be in the future")
 
     # Create a new reminder entry in the database
-    new_reminder = create_reminder_entry(db, reminder)
+    new_reminder = await create_reminder_entry_async(db, reminder)
 
     # Schedule the reminder email task
     send_event_reminder_email.apply_async(
@@ -58,7 +57,7 @@ def create_reminder(reminder: ReminderCreate, db: Session = Depends(get_db)):
     )
 
 @router.get("/", response_model=list[EventReminderOut])
-def read_reminders(user_email: str, db: Session = Depends(get_db)):
+async def read_reminders(user_email: str, db: AsyncSession = Depends(get_async_db)):
     """
     Retrieves a list of events with reminders for a specific user.
     
@@ -66,15 +65,15 @@ def read_reminders(user_email: str, db: Session = Depends(get_db)):
     - user_email: The user's email to retrieve reminders for
     - db: Database session dependency
     """
-    return get_reminders(db=db, user_email=user_email)
+    return await get_reminders_async(db=db, user_email=user_email)
 
 @router.delete("/{reminder_id}", response_model=ReminderOut)
-def delete_reminder(reminder_id: int, db: Session = Depends(get_db)):
+async def delete_reminder(reminder_id: int, db: AsyncSession = Depends(get_async_db)):
     """
     Deletes a reminder by its ID.
     """
     try:
-        reminder = delete_reminder_entry(db=db, reminder_id=reminder_id)
+        reminder = await delete_reminder_entry_async(db=db, reminder_id=reminder_id)
         if not reminder:
             raise HTTPException(status_code=404, detail="Reminder not found")
         return reminder
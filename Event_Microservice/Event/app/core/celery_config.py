@@ -1,6 +1,18 @@
+import os
+import time
+
 from celery import Celery
+from celery.signals import (
+    before_task_publish, task_failure, task_postrun, task_prerun, worker_init, worker_process_init, worker_process_shutdown,
+)
+from prometheus_client import multiprocess, start_http_server
 
 from app.core.config import settings
+from app.core.metrics import CELERY_TASK_DURATION, metrics_registry
+from app.core import tracing
+from app.services import auth_client
+from app.services.smtp_pool import smtp_pool
+from app.services.user_events import user_event_subscriber
 
 # Create Celery instance with the necessary configurations
 celery_app = Celery(
@@ -30,4 +42,78 @@ celery_app.conf.beat_schedule = {
         'task': 'app.tasks.send_reminder',  # The task to execute
         'schedule': 300.0,  # Time interval in seconds (5 minutes)
     },
-}
\ No newline at end of file
+}
+
+@worker_process_init.connect
+def init_worker_process(**kwargs):
+    """
+    Drop any gRPC channels and SMTP connections inherited from the parent so each prefork
+    child opens its own, subscribe the child's user cache to user-change events, and
+    start the child's span exporters.
+    """
+    tracing.configure_tracing("event-worker")
+    auth_client.close_channels()
+    smtp_pool.close_all()
+    user_event_subscriber.start()
+
+
+@worker_process_shutdown.connect
+def shutdown_worker_process(**kwargs):
+    """
+    Close the worker's gRPC channels to the auth service and its SMTP connections on shutdown.
+    """
+    user_event_subscriber.stop()
+    auth_client.close_channels()
+    smtp_pool.close_all()
+
+
+# Start times of the tasks running in this process, keyed by task id
+_task_started: dict[str, float] = {}
+
+@before_task_publish.connect
+def propagate_trace_context(headers=None, **kwargs):
+    """
+    Carry the publisher's trace context (e.g. the API request) in the task headers.
+    """
+    tracing.inject_task_headers(headers)
+
+
+@task_prerun.connect
+def record_task_start(task_id=None, task=None, **kwargs):
+    _task_started[task_id] = time.perf_counter()
+    tracing.start_task_span(task_id, task)
+
+
+@task_failure.connect
+def record_task_failure(task_id=None, exception=None, **kwargs):
+    tracing.record_task_exception(task_id, exception)
+
+
+@task_postrun.connect
+def record_task_duration(task_id=None, task=None, state=None, **kwargs):
+    """
+    Records how long a task ran and whether it succeeded, and closes its span.
+    """
+    start = _task_started.pop(task_id, None)
+    if start is not None:
+        CELERY_TASK_DURATION.labels(task.name, state or "UNKNOWN").observe(time.perf_counter() - start)
+    tracing.end_task_span(task_id, state)
+
+
+@worker_init.connect
+def start_metrics_server(**kwargs):
+    """
+    Serve the metrics of every prefork child from the worker's main process, if `METRICS_PORT` is set.
+    Children write to `PROMETHEUS_MULTIPROC_DIR`, which must be set for their samples to be visible here.
+    """
+    if settings.METRICS_PORT:
+        start_http_server(settings.METRICS_PORT, registry=metrics_registry())
+
+
+@worker_process_shutdown.connect
+def mark_metrics_process_dead(pid=None, **kwargs):
+    """
+    Drop the live gauge samples of a prefork child that is exiting.
+    """
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        multiprocess.mark_process_dead(pid or os.getpid())
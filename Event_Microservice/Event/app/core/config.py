@@ -23,6 +23,16 @@ class Settings(BaseSettings):
     DB_PORT: int = os.getenv("DB_PORT")
     DB_NAME: str = os.getenv("DB_NAME")
 
+    # Connection pool tuning (applies to both the sync and the async engine)
+    DB_POOL_SIZE: int = os.getenv("DB_POOL_SIZE", 5)
+    DB_MAX_OVERFLOW: int = os.getenv("DB_MAX_OVERFLOW", 10)
+    DB_POOL_TIMEOUT: float = os.getenv("DB_POOL_TIMEOUT", 30)  # Seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = os.getenv("DB_POOL_RECYCLE", 1800)  # Seconds before a connection is replaced
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", True)
+    DB_CONNECT_TIMEOUT: float = os.getenv("DB_CONNECT_TIMEOUT", 10)
+    DB_COMMAND_TIMEOUT: float = os.getenv("DB_COMMAND_TIMEOUT", 30)  # asyncpg per-statement timeout
+    DB_STATEMENT_CACHE_SIZE: int = os.getenv("DB_STATEMENT_CACHE_SIZE", 100)  # Set to 0 behind a transaction-mode pooler (PgBouncer/Supavisor)
+
     # Email settings for sending emails
     SMTP_SERVER: str = os.getenv("SMTP_SERVER")
     SMTP_PORT: int = os.getenv("SMTP_PORT")
@@ -30,15 +40,68 @@ class Settings(BaseSettings):
     SMTP_PASSWORD: str = os.getenv("SMTP_PASSWORD")
     EMAIL_FROM: str = os.getenv("EMAIL_FROM")
     EMAIL_FROM_NAME: str = os.getenv("EMAIL_FROM_NAME")
+    SMTP_TIMEOUT: float = os.getenv("SMTP_TIMEOUT", 30)
+
+    # SMTP connection pool used by the Celery email tasks (one per worker process)
+    SMTP_POOL_SIZE: int = os.getenv("SMTP_POOL_SIZE", 2)
+    SMTP_POOL_IDLE_TIMEOUT: float = os.getenv("SMTP_POOL_IDLE_TIMEOUT", 60)  # Seconds before an idle connection is closed instead of reused
+    SMTP_MAX_MESSAGES_PER_CONNECTION: int = os.getenv("SMTP_MAX_MESSAGES_PER_CONNECTION", 100)  # Many relays cap messages per session
 
     # Redis configuration for caching and task queueing
     REDIS_HOST: str = os.getenv("REDIS_HOST")
     REDIS_PORT: int = os.getenv("REDIS_PORT")
 
+    # Redis pub/sub channel on which the auth microservice announces user changes
+    USER_EVENTS_CHANNEL: str = os.getenv("USER_EVENTS_CHANNEL", "auth:user-events")
+
     # gRPC configuration for the auth microservice
     AUTH_SERVICE_HOST: str = os.getenv("AUTH_SERVICE_HOST")
     AUTH_SERVICE_PORT: int = os.getenv("AUTH_SERVICE_PORT")
 
+    # gRPC client tuning for calls to the auth microservice
+    AUTH_GRPC_TIMEOUT: float = os.getenv("AUTH_GRPC_TIMEOUT", 2.0)
+    AUTH_GRPC_KEEPALIVE_TIME_MS: int = os.getenv("AUTH_GRPC_KEEPALIVE_TIME_MS", 30000)
+    AUTH_GRPC_KEEPALIVE_TIMEOUT_MS: int = os.getenv("AUTH_GRPC_KEEPALIVE_TIMEOUT_MS", 10000)
+    AUTH_GRPC_COMPRESSION: str = os.getenv("AUTH_GRPC_COMPRESSION", "none")
+    AUTH_GRPC_STREAM_THRESHOLD: int = os.getenv("AUTH_GRPC_STREAM_THRESHOLD", 1000)
+    AUTH_GRPC_LB_POLICY: str = os.getenv("AUTH_GRPC_LB_POLICY", "round_robin")  # Spread calls over every resolved auth address
+    AUTH_GRPC_CHANNELS: int = os.getenv("AUTH_GRPC_CHANNELS", 4)  # Connections per process, spread over SO_REUSEPORT workers
+
+    # Cache of user lookups from the auth microservice
+    USER_CACHE_MAX_SIZE: int = os.getenv("USER_CACHE_MAX_SIZE", 10000)
+    USER_CACHE_TTL: float = os.getenv("USER_CACHE_TTL", 300)
+    USER_CACHE_NEGATIVE_TTL: float = os.getenv("USER_CACHE_NEGATIVE_TTL", 30)
+    USER_CACHE_REDIS_ENABLED: bool = os.getenv("USER_CACHE_REDIS_ENABLED", False)
+    USER_CACHE_REDIS_DB: int = os.getenv("USER_CACHE_REDIS_DB", 1)
+    USER_CACHE_REDIS_TIMEOUT: float = os.getenv("USER_CACHE_REDIS_TIMEOUT", 0.1)
+
+    # Event listing pagination
+    EVENT_PAGE_SIZE: int = os.getenv("EVENT_PAGE_SIZE", 50)  # Default `limit`
+    EVENT_PAGE_SIZE_MAX: int = os.getenv("EVENT_PAGE_SIZE_MAX", 200)  # Largest `limit` a client may ask for
+
+    # Prometheus metrics port for the Celery worker's main process, which serves no HTTP; 0 disables
+    METRICS_PORT: int = os.getenv("METRICS_PORT", 0)
+
+    # Distributed tracing (OpenTelemetry). The OTLP exporter reads the standard OTEL_EXPORTER_OTLP_* variables
+    TRACING_EXPORTERS: str = os.getenv("TRACING_EXPORTERS", "")  # Comma-separated: console, file, otlp; empty disables tracing
+    TRACING_FILE_PATH: str = os.getenv("TRACING_FILE_PATH", "traces.jsonl")  # JSON lines written by the "file" exporter
+    TRACING_SAMPLE_RATIO: float = os.getenv("TRACING_SAMPLE_RATIO", 1.0)  # Fraction of new traces recorded
+
+    # Opt-in request profiling (see app.core.profiling)
+    PROFILING_SECRET: str = os.getenv("PROFILING_SECRET", "")  # Signs X-Profile tokens; empty disables header-triggered profiles
+    PROFILING_SAMPLE_RATE: float = os.getenv("PROFILING_SAMPLE_RATE", 0)  # Fraction of all requests profiled without a token
+    PROFILING_INTERVAL: float = os.getenv("PROFILING_INTERVAL", 0.005)  # Seconds between stack samples
+    PROFILING_DIR: str = os.getenv("PROFILING_DIR", "profiles")
+    PROFILING_MAX_FILES: int = os.getenv("PROFILING_MAX_FILES", 100)  # Oldest profiles are deleted beyond this
+
+    # Startup and readiness probes
+    STARTUP_TIMEOUT: float = os.getenv("STARTUP_TIMEOUT", 60)  # Seconds to wait for dependencies before giving up
+    STARTUP_MAX_BACKOFF: float = os.getenv("STARTUP_MAX_BACKOFF", 5)  # Cap on the delay between dependency checks
+    READINESS_CHECK_TIMEOUT: float = os.getenv("READINESS_CHECK_TIMEOUT", 2)
+    # Redis is the Celery broker as well as the user cache and user-change channel
+    READINESS_REDIS_REQUIRED: bool = os.getenv("READINESS_REDIS_REQUIRED", True)  # Whether the service is unready while Redis is down
+    SCHEMA_BOOTSTRAP_ON_STARTUP: bool = os.getenv("SCHEMA_BOOTSTRAP_ON_STARTUP", False)  # Local development only; deployments run `python -m app.bootstrap`
+
     @property
     def SUPABASE_DATABASE_URL(self) -> str:
         """
@@ -46,6 +109,13 @@ class Settings(BaseSettings):
         """
         return f"postgresql+psycopg2://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
     
+    @property
+    def SUPABASE_ASYNC_DATABASE_URL(self) -> str:
+        """
+        Returns the asyncpg database connection URL for Supabase using the environment variables.
+        """
+        return f"postgresql+asyncpg://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
+    
     @property
     def CELERY_BROKER(self) -> str:
         """
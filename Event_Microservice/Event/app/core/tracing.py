@@ -0,0 +1,252 @@
+import logging
+import os
+from contextlib import contextmanager
+from typing import Callable
+
+import grpc
+from opentelemetry import context as otel_context, propagate, trace
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter, SpanExporter
+from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+from opentelemetry.trace import SpanKind, Status, StatusCode
+from sqlalchemy import event
+
+from app.core.config import settings
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Spans are no-ops until configure_tracing() installs a provider
+tracer = trace.get_tracer("app")
+
+
+def _file_exporter() -> SpanExporter:
+    # One JSON document per line, appended so several worker processes can share the file
+    out = open(settings.TRACING_FILE_PATH, "a", buffering=1)
+    return ConsoleSpanExporter(out=out, formatter=lambda span: span.to_json(indent=None) + os.linesep)
+
+def _otlp_exporter() -> SpanExporter:
+    # Endpoint, headers and TLS come from the standard OTEL_EXPORTER_OTLP_* variables
+    from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+    return OTLPSpanExporter()
+
+# Exporters selectable through TRACING_EXPORTERS
+EXPORTERS: dict[str, Callable[[], SpanExporter]] = {
+    "console": ConsoleSpanExporter,
+    "file": _file_exporter,
+    "otlp": _otlp_exporter,
+}
+
+def register_exporter(name: str, factory: Callable[[], SpanExporter]):
+    """
+    Makes another span exporter selectable through `TRACING_EXPORTERS`.
+
+    Args:
+        name (str): The name to list in `TRACING_EXPORTERS`.
+        factory (Callable[[], SpanExporter]): Creates the exporter when tracing is configured.
+    """
+    EXPORTERS[name] = factory
+
+def configure_tracing(service_name: str) -> bool:
+    """
+    Installs the process-wide tracer provider with the exporters listed in `TRACING_EXPORTERS`.
+
+    Call once per process, after any fork. Root spans are sampled at `TRACING_SAMPLE_RATIO`;
+    spans continuing a trace from another service follow the caller's sampling decision.
+
+    Args:
+        service_name (str): The `service.name` resource attribute (`OTEL_SERVICE_NAME` takes precedence).
+
+    Returns:
+        bool: False if tracing is disabled, i.e. no exporter is configured.
+
+    Raises:
+        ValueError: If an exporter name is unknown.
+    """
+    names = [name.strip() for name in settings.TRACING_EXPORTERS.split(",") if name.strip()]
+    if not names:
+        return False
+
+    unknown = [name for name in names if name not in EXPORTERS]
+    if unknown:
+        raise ValueError(f"Unknown tracing exporter(s): {', '.join(unknown)}")
+
+    provider = TracerProvider(
+        resource=Resource.create({"service.name": service_name}),
+        sampler=ParentBased(TraceIdRatioBased(settings.TRACING_SAMPLE_RATIO)),
+    )
+    for name in names:
+        provider.add_span_processor(BatchSpanProcessor(EXPORTERS[name]()))
+    trace.set_tracer_provider(provider)
+    logger.info(f"Tracing enabled for {service_name} with exporters: {', '.join(names)}")
+    return True
+
+def tracing_enabled() -> bool:
+    """
+    Returns whether `configure_tracing` installed a provider in this process.
+    """
+    return isinstance(trace.get_tracer_provider(), TracerProvider)
+
+
+class TracingMiddleware:
+    """
+    Pure ASGI middleware that opens a server span per HTTP request.
+
+    An incoming W3C `traceparent` header is continued; otherwise a new trace starts. The
+    span is named after the matched route template so traces group by endpoint.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        carrier = {key.decode("latin-1"): value.decode("latin-1") for key, value in scope["headers"]}
+        with tracer.start_as_current_span(
+            method,
+            context=propagate.extract(carrier),
+            kind=SpanKind.SERVER,
+            attributes={"http.request.method": method, "url.path": scope["path"]},
+        ) as span:
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                route = getattr(scope.get("route"), "path", None)
+                if route is not None:
+                    span.update_name(f"{method} {route}")
+                    span.set_attribute("http.route", route)
+                span.set_attribute("http.response.status_code", status_code)
+                if status_code >= 500:
+                    span.set_status(Status(StatusCode.ERROR))
+
+
+def trace_engine(engine):
+    """
+    Records a client span for every statement run by a SQLAlchemy engine inside a traced request or task.
+
+    Statements outside a sampled span (e.g. startup checks) are not traced.
+
+    Args:
+        engine: A sync `Engine` (Celery tasks), or the `sync_engine` of an `AsyncEngine`.
+    """
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if not trace.get_current_span().is_recording():
+            return
+        operation = statement.lstrip().split(None, 1)[0].upper() if statement else "UNKNOWN"
+        context._span = tracer.start_span(
+            operation,
+            kind=SpanKind.CLIENT,
+            attributes={"db.system": "postgresql", "db.operation": operation, "db.statement": statement},
+        )
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        span = getattr(context, "_span", None)
+        if span is not None:
+            span.end()
+
+    @event.listens_for(engine, "handle_error")
+    def _handle_error(exception_context):
+        span = getattr(exception_context.execution_context, "_span", None)
+        if span is not None:
+            span.record_exception(exception_context.original_exception)
+            span.set_status(Status(StatusCode.ERROR))
+            span.end()
+
+
+class _MetadataSetter:
+    # gRPC metadata is a sequence of (key, value) pairs
+    def set(self, carrier: list, key: str, value: str):
+        carrier.append((key, value))
+
+@contextmanager
+def grpc_client_span(method: str):
+    """
+    Opens a client span around a call to the auth service.
+
+    Yields the call metadata carrying the trace context, to pass as `metadata=`, so
+    AuthService continues the same trace.
+
+    Args:
+        method (str): The RPC name, e.g. "ValidateUser".
+    """
+    with tracer.start_as_current_span(
+        f"auth.AuthService/{method}",
+        kind=SpanKind.CLIENT,
+        attributes={"rpc.system": "grpc", "rpc.service": "auth.AuthService", "rpc.method": method},
+    ) as span:
+        metadata = []
+        propagate.inject(metadata, setter=_MetadataSetter())
+        try:
+            yield metadata
+        except grpc.RpcError as e:
+            span.set_attribute("rpc.grpc.status_code", e.code().value[0])
+            raise
+
+
+class _TaskRequestGetter:
+    # Headers published with a task are exposed as attributes of `task.request`
+    def get(self, carrier, key: str) -> list[str] | None:
+        value = getattr(carrier, key, None)
+        return [value] if isinstance(value, str) else None
+
+    def keys(self, carrier) -> list[str]:
+        return []
+
+# Spans of the tasks running in this process, with the context token to restore, keyed by task id
+_task_spans: dict[str, tuple] = {}
+
+def inject_task_headers(headers: dict | None):
+    """
+    Adds the current trace context to the headers of a task being published.
+    """
+    if headers is not None:
+        propagate.inject(headers)
+
+def start_task_span(task_id: str, task):
+    """
+    Opens the span of a task about to run, continuing the trace it was published from.
+    """
+    span = tracer.start_span(
+        f"run {task.name}",
+        context=propagate.extract(task.request, getter=_TaskRequestGetter()),
+        kind=SpanKind.CONSUMER,
+        attributes={"celery.task_name": task.name, "celery.task_id": task_id},
+    )
+    token = otel_context.attach(trace.set_span_in_context(span))
+    _task_spans[task_id] = (span, token)
+
+def record_task_exception(task_id: str, exception: BaseException):
+    """
+    Marks the span of a failed task as an error.
+    """
+    entry = _task_spans.get(task_id)
+    if entry is not None:
+        entry[0].record_exception(exception)
+        entry[0].set_status(Status(StatusCode.ERROR, str(exception)))
+
+def end_task_span(task_id: str, state: str | None):
+    """
+    Closes the span of a finished task.
+    """
+    entry = _task_spans.pop(task_id, None)
+    if entry is None:
+        return
+    span, token = entry
+    span.set_attribute("celery.state", state or "UNKNOWN")
+    otel_context.detach(token)
+    span.end()
@@ -1,31 +1,278 @@
-from sqlalchemy.orm import Session
+import base64
+import json
+from sqlalchemy import select, delete, exists, and_, or_, func, tuple_
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 from uuid import UUID
 from datetime import datetime, timezone
-from app.utils import validate_user
+from app.utils import validate_user_async, validate_users_async
 
-from app.models import EventMember, Event, EventCreate, EventUpdate, Reminder, ReminderCreate, EventOut
+from app.models import EventMember, Event, EventTagCount, EventCreate, EventUpdate, Reminder, ReminderCreate, EventOut, EventPage, TagCount, SEARCH_CONFIG, as_naive_utc
 
-# fet user name from grpc
-def get_username(email: str):
+# Encode a keyset position as an opaque pagination cursor
+def encode_cursor(values: list) -> str:
+    """
+    Encode the sort key of the last row on a page as an opaque, URL-safe cursor.
+
+    Args:
+        values (list): JSON-serializable sort key values.
+
+    Returns:
+        str: The cursor.
+    """
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode().rstrip("=")
+
+# Decode a pagination cursor back into its keyset position
+def decode_cursor(cursor: str, size: int) -> list:
+    """
+    Decode a cursor created by `encode_cursor`.
+
+    Args:
+        cursor (str): The cursor sent by the client.
+        size (int): The number of sort key values the cursor must hold.
+
+    Returns:
+        list: The sort key values.
+
+    Raises:
+        HTTPException: If the cursor is malformed.
+    """
     try:
-        # Validate organizer's email through an authentication microservice
-        return validate_user(email)["username"]
-    except HTTPException as e:
-        raise e  # Raise the exception if validation fails
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except ValueError:
+        values = None
+    if not isinstance(values, list) or len(values) != size:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    return values
+
+def _paginate_events(query, cursor: str | None, limit: int | None):
+    """
+    Order an event query by (date, id) and restrict it to the page after `cursor`.
+
+    One row more than `limit` is fetched so the caller can tell whether a next page exists.
 
-# Create a new event
-def create_event(db: Session, event: EventCreate):
+    Args:
+        query: A `select(Event)` statement.
+        cursor (str | None): Cursor from the previous page, or None for the first page.
+        limit (int | None): Page size; None returns every remaining event.
+
+    Returns:
+        The paginated statement.
     """
-    Create a new event and add the organizer as a member.
+    query = query.order_by(Event.date, Event.id)
+    if cursor:
+        date, event_id = decode_cursor(cursor, 2)
+        try:
+            position = (datetime.fromisoformat(date), UUID(event_id))
+        except (AttributeError, TypeError, ValueError):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+        # Row comparison, so PostgreSQL can seek straight to the position in ix_events_date_id
+        query = query.where(tuple_(Event.date, Event.id) > tuple_(*position))
+    if limit is not None:
+        query = query.limit(limit + 1)
+    return query
+
+def _filter_events(
+    query,
+    tags: list[str] | None = None,
+    match_all: bool = False,
+    date_from: datetime | None = None,
+    date_to: datetime | None = None,
+):
+    """
+    Restrict an event query to the events carrying the given tags and within a date range.
+
+    Tag operators are served by the GIN index on `events.tags`, date ranges by the
+    (date, id) index.
+
+    Args:
+        query: A `select(Event)` statement.
+        tags (list[str] | None): Tags to filter by; None or empty disables the filter.
+        match_all (bool): Require every tag (`@>`) instead of any of them (`&&`).
+        date_from (datetime | None): Only events on or after this time.
+        date_to (datetime | None): Only events before this time.
+
+    Returns:
+        The filtered statement.
+    """
+    if tags:
+        query = query.where(Event.tags.contains(tags) if match_all else Event.tags.overlap(tags))
+    if date_from is not None:
+        query = query.where(Event.date >= as_naive_utc(date_from))
+    if date_to is not None:
+        query = query.where(Event.date < as_naive_utc(date_to))
+    return query
+
+def _date_key(event: Event) -> list:
+    return [event.date.isoformat(), str(event.id)]
+
+def _event_page(events: list[Event], usernames: dict[str, str], limit: int | None, key=_date_key,
+                membership: dict[UUID, bool] | None = None) -> EventPage:
+    """
+    Build a page from the rows fetched by a paginated query.
+
+    Args:
+        events (list[Event]): Up to `limit + 1` events, in page order.
+        usernames (dict[str, str]): Organizer usernames keyed by email.
+        limit (int | None): Page size; None if the query was unbounded.
+        key: Returns the sort key of an event, stored in the next page's cursor.
+        membership (dict[UUID, bool] | None): Whether the user is a member, keyed by event ID;
+            None leaves `is_member` unset.
+
+    Returns:
+        EventPage: The events and the cursor of the next page.
+    """
+    next_cursor = None
+    if limit is not None and len(events) > limit:
+        events = events[:limit]
+        next_cursor = encode_cursor(key(events[-1]))
+    return EventPage(
+        items=[
+            EventOut(
+                **event.to_dict(),
+                username=usernames[event.organizer_email],
+                is_member=membership[event.id] if membership is not None else None,
+            )
+            for event in events
+        ],
+        next_cursor=next_cursor,
+    )
+
+def _with_membership(query, user_email: str | None):
+    """
+    Add an `is_member` column for the user to a `select(Event)` statement, if a user is given.
+    """
+    return query if user_email is None else query.add_columns(_is_member(user_email).label("is_member"))
+
+def _is_member(user_email: str):
+    """
+    EXISTS clause, correlated with `Event` in the enclosing query, that is true if the user is a member.
+    """
+    membership = aliased(EventMember)
+    return exists().where(membership.event_id == Event.id, membership.user_email == user_email)
+
+def _event_with_membership(event_id: UUID, user_email: str):
+    """
+    Select the event together with whether the user is a member of it, in a single statement.
+
+    Returns no row if the event does not exist.
+    """
+    return select(Event, _is_member(user_email).label("is_member")).where(Event.id == event_id)
+
+def _event_members_for(event_id: UUID, user_email: str):
+    """
+    Select the members of an event together with whether the user is a member, in a single statement.
+
+    The members are outer-joined onto the event only when the user is a member, so there is
+    no row if the event does not exist, one row with no member if the user is not a member,
+    and one row per member otherwise.
+    """
+    is_member = _is_member(user_email)
+    return (
+        select(is_member.label("is_member"), EventMember)
+        .select_from(Event)
+        .outerjoin(EventMember, and_(EventMember.event_id == Event.id, is_member))
+        .where(Event.id == event_id)
+    )
+
+def _event_not_found(event_id: UUID) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail=f"Event with ID {event_id} not found"
+    )
+
+def _not_a_member() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail="You are not a member of this event"
+    )
+
+# Delete several reminders at once (sync, for the Celery reminder sweep)
+def delete_reminder_entries(db: Session, reminder_ids: list[int]) -> int:
+    """
+    Delete several reminder entries in one statement and one commit.
 
     Args:
         db (Session): The database session.
+        reminder_ids (list[int]): The IDs of the reminders to delete.
+
+    Returns:
+        int: The number of reminders deleted.
+
+    Raises:
+        HTTPException: If there is an error deleting the reminders.
+    """
+    if not reminder_ids:
+        return 0
+    try:
+        result = db.execute(delete(Reminder).where(Reminder.id.in_(reminder_ids)))
+        db.commit()
+        return result.rowcount
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Error deleting reminders: {str(e)}")
+
+# ---------------------------
+# Async CRUD (AsyncSession + grpc.aio), used by the API routes
+# ---------------------------
+
+# fetch user name from grpc (async)
+async def get_username_async(email: str):
+    """
+    Resolve a user's username through the authentication service without blocking the event loop.
+    """
+    return (await validate_user_async(email))["username"]
+
+# fetch user names for many emails with a single grpc call (async)
+async def get_usernames_async(emails: list[str]) -> dict[str, str]:
+    """
+    Resolve usernames for a set of emails in one round trip to the authentication service.
+
+    Args:
+        emails (list[str]): The emails to resolve; duplicates are collapsed.
+
+    Returns:
+        dict[str, str]: Usernames keyed by email.
+
+    Raises:
+        HTTPException: If any of the users is not found or validation fails.
+    """
+    users = await validate_users_async(emails)
+    if any(email not in users for email in emails):
+        raise HTTPException(status_code=404, detail="User not found")
+    return {email: user["username"] for email, user in users.items()}
+
+async def _get_event_or_404(db: AsyncSession, event_id: UUID) -> Event:
+    """
+    Load an event by ID or raise 404.
+    """
+    db_event = (await db.execute(select(Event).where(Event.id == event_id))).scalars().first()
+    if not db_event:
+        raise _event_not_found(event_id)
+    return db_event
+
+async def _get_member(db: AsyncSession, event_id: UUID, user_email: str) -> EventMember | None:
+    """
+    Load a user's membership of an event, or None if they are not a member.
+    """
+    result = await db.execute(
+        select(EventMember).where(EventMember.event_id == event_id, EventMember.user_email == user_email)
+    )
+    return result.scalars().first()
+
+# Create a new event (async)
+async def create_event_async(db: AsyncSession, event: EventCreate):
+    """
+    Create a new event and add the organizer as a member.
+
+    Args:
+        db (AsyncSession): The async database session.
         event (EventCreate): The event details to be created.
 
     Returns:
-        Event: The created event object.
-    
+        EventOut: The created event.
+
     Raises:
         HTTPException: If there is an error creating the event.
     """
@@ -40,99 +287,179 @@ def create_event(db: Session, event: EventCreate):
             organizer_email=event.organizer_email,
         )
         db.add(db_event)
-        db.commit()
-        db.refresh(db_event)
+        await db.flush()
 
-        # Add the organizer as a member of the event
-        event_member = EventMember(event_id=db_event.id, user_email=event.organizer_email)
-        db.add(event_member)
-        db.commit()
+        # Add the organizer as a member of the event, in the same transaction
+        db.add(EventMember(event_id=db_event.id, user_email=event.organizer_email))
+        await db.commit()
 
-        username = get_username(db_event.organizer_email)
-        event_out = EventOut(**db_event.to_dict(), username=username)
-        return event_out
+        username = await get_username_async(db_event.organizer_email)
+        return EventOut(**db_event.to_dict(), username=username)
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Error creating event: {str(e)}")
 
-# Get all events for a user (that they are a member of)
-def get_all_events(db: Session):
+# Get a page of all events (async)
+async def get_all_events_async(db: AsyncSession, cursor: str | None = None, limit: int | None = None,
+                               tags: list[str] | None = None, match_all: bool = False,
+                               date_from: datetime | None = None, date_to: datetime | None = None,
+                               user_email: str | None = None):
     """
-    Get a list of events that a user is a member of.
+    Get a page of all events ordered by date, with organizer usernames resolved in one batch.
 
     Args:
-        db (Session): The database session.
+        db (AsyncSession): The async database session.
+        cursor (str | None): Cursor from the previous page, or None for the first page.
+        limit (int | None): Page size; None returns every remaining event.
+        tags (list[str] | None): Only return events with these tags.
+        match_all (bool): Require every tag instead of any of them.
+        date_from (datetime | None): Only return events on or after this time.
+        date_to (datetime | None): Only return events before this time.
+        user_email (str | None): If given, each event says whether this user is a member,
+            so listing pages need no separate membership lookup.
+
     Returns:
-        List[Event]: List of all events currently active.
+        EventPage: The events and the cursor of the next page.
     """
     try:
-        events = db.query(Event).all()
-        event_list_with_username = []
+        query = _filter_events(_with_membership(select(Event), user_email), tags, match_all, date_from, date_to)
+        rows = (await db.execute(_paginate_events(query, cursor, limit))).all()
+        events = [row.Event for row in rows]
+        membership = {row.Event.id: row.is_member for row in rows} if user_email is not None else None
+        usernames = await get_usernames_async([event.organizer_email for event in events])
+        return _event_page(events, usernames, limit, membership=membership)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Error retrieving events: {str(e)}")
 
-        for event in events:
-            username = get_username(event.organizer_email) 
-            # Create a new EventOutWithUsername object
-            event_with_username = EventOut(
-                **event.to_dict(),
-                username=username
-            )
-            event_list_with_username.append(event_with_username)
+# Get a page of the events a user is a member of (async)
+async def get_events_async(db: AsyncSession, user_email: str, cursor: str | None = None, limit: int | None = None,
+                           tags: list[str] | None = None, match_all: bool = False,
+                           date_from: datetime | None = None, date_to: datetime | None = None):
+    """
+    Get a page of the events that a user is a member of, ordered by date.
+
+    Args:
+        db (AsyncSession): The async database session.
+        user_email (str): The user's email to check membership.
+        cursor (str | None): Cursor from the previous page, or None for the first page.
+        limit (int | None): Page size; None returns every remaining event.
+        tags (list[str] | None): Only return events with these tags.
+        match_all (bool): Require every tag instead of any of them.
+        date_from (datetime | None): Only return events on or after this time.
+        date_to (datetime | None): Only return events before this time.
 
-        return event_list_with_username
+    Returns:
+        EventPage: The events and the cursor of the next page.
+    """
+    try:
+        query = select(Event).join(EventMember).where(EventMember.user_email == user_email)
+        query = _filter_events(query, tags, match_all, date_from, date_to)
+        events = (await db.execute(_paginate_events(query, cursor, limit))).scalars().all()
+        usernames = await get_usernames_async([event.organizer_email for event in events])
+        return _event_page(events, usernames, limit)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Error retrieving events: {str(e)}")
 
-# Get all events for a user (that they are a member of)
-def get_events(db: Session, user_email: str):
+# Get the most used tags (async)
+async def get_tag_counts_async(db: AsyncSession, limit: int):
     """
-    Get a list of events that a user is a member of.
+    Get the most used tags with the number of events carrying each, read from the
+    `event_tag_counts` aggregate rather than by scanning events.
 
     Args:
-        db (Session): The database session.
-        user_email (str): The user's email to check membership.
+        db (AsyncSession): The async database session.
+        limit (int): The number of tags to return.
 
     Returns:
-        List[Event]: List of events the user is a member of.
+        List[TagCount]: Tags by descending count, then alphabetically.
     """
     try:
-        events = db.query(Event).join(EventMember).filter(EventMember.user_email == user_email).all()
-        event_list_with_username = []
+        result = await db.execute(
+            select(EventTagCount.tag, EventTagCount.count)
+            .where(EventTagCount.count > 0)
+            .order_by(EventTagCount.count.desc(), EventTagCount.tag)
+            .limit(limit)
+        )
+        return [TagCount(tag=row.tag, count=row.count) for row in result]
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Error retrieving tags: {str(e)}")
 
-        for event in events:
-            username = get_username(event.organizer_email) 
-            # Create a new EventOutWithUsername object
-            event_with_username = EventOut(
-                **event.to_dict(),
-                username=username
-            )
-            event_list_with_username.append(event_with_username)
+# Search the events a user is a member of (async)
+async def search_events_async(db: AsyncSession, user_email: str, q: str, cursor: str | None = None, limit: int | None = None):
+    """
+    Full-text search over the title, location and description of the events a user is a member of.
+
+    `q` accepts web search syntax ("quoted phrases", `or`, `-excluded`). Results are ordered
+    by relevance, then id, and paginated with a (rank, id) cursor.
 
-        return event_list_with_username
+    Args:
+        db (AsyncSession): The async database session.
+        user_email (str): The user's email to check membership.
+        q (str): The search terms.
+        cursor (str | None): Cursor from the previous page, or None for the first page.
+        limit (int | None): Page size; None returns every remaining match.
+
+    Returns:
+        EventPage: The matching events and the cursor of the next page.
+
+    Raises:
+        HTTPException: If the cursor is malformed or the search fails.
+    """
+    try:
+        tsquery = func.websearch_to_tsquery(SEARCH_CONFIG, q)
+        rank = func.ts_rank_cd(Event.search_vector, tsquery)
+        query = (
+            select(Event, rank.label("rank"))
+            .join(EventMember)
+            .where(EventMember.user_email == user_email, Event.search_vector.op("@@")(tsquery))
+            .order_by(rank.desc(), Event.id)
+        )
+        if cursor:
+            last_rank, last_id = decode_cursor(cursor, 2)
+            try:
+                last_rank, last_id = float(last_rank), UUID(last_id)
+            except (AttributeError, TypeError, ValueError):
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+            query = query.where(or_(rank < last_rank, and_(rank == last_rank, Event.id > last_id)))
+        if limit is not None:
+            query = query.limit(limit + 1)
+
+        rows = (await db.execute(query)).all()
+        ranks = {row.Event.id: row.rank for row in rows}
+        events = [row.Event for row in rows]
+        usernames = await get_usernames_async([event.organizer_email for event in events])
+        return _event_page(events, usernames, limit, key=lambda event: [ranks[event.id], str(event.id)])
+    except HTTPException:
+        raise
     except Exception as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Error retrieving events: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Error searching events: {str(e)}")
 
-# Get a single event by its ID (only if the user is a member)
-def get_event(db: Session, event_id: UUID, user_email: str):
+# Get a single event by its ID (only if the user is a member) (async)
+async def get_event_async(db: AsyncSession, event_id: UUID, user_email: str):
     """
     Get a single event by its ID, ensuring the user is a member.
 
+    Non-members get an empty event and a join request is sent to the organizer.
+
     Args:
-        db (Session): The database session.
+        db (AsyncSession): The async database session.
         event_id (UUID): The event's ID.
         user_email (str): The user's email to verify membership.
 
     Returns:
-        dict: A dictionary containing event data (or empty event if not a member).
+        EventOut: The event (or an empty event if the user is not a member).
     """
-    db_event = db.query(Event).filter(Event.id == event_id).first()
-    if not db_event:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, 
-            detail=f"Event with ID {event_id} not found"
-        )
+    # Load the event and the user's membership in one round trip
+    row = (await db.execute(_event_with_membership(event_id, user_email))).first()
+    if row is None:
+        raise _event_not_found(event_id)
+    db_event, is_member = row
 
     # Ensure the user is part of the event
-    is_member = db.query(EventMember).filter(EventMember.event_id == event_id, EventMember.user_email == user_email).first()
     if not is_member:
         # Send the access request to join the event
         from app.tasks import send_join_request
@@ -140,48 +467,39 @@ def get_event(db: Session, event_id: UUID, user_email: str):
             args=[user_email, db_event.organizer_email, event_id]
         )
 
-        # Return a response with an empty EventOut and a message
-        empty_event = EventOut(
-            title="", 
-            date=datetime.now(timezone.utc), 
-            description="", 
-            location="", 
-            tags=[], 
-            is_online=False, 
+        return EventOut(
+            title="",
+            date=datetime.now(timezone.utc),
+            description="",
+            location="",
+            tags=[],
+            is_online=False,
             id="ebb1543d-21c2-4ddb-af81-dcea218c8213",
             organizer_email=user_email,
             username=""
         )
-        return empty_event
-    
-    username = get_username(db_event.organizer_email)
-    event_out = EventOut(**db_event.to_dict(), username=username)
-    return event_out
 
+    username = await get_username_async(db_event.organizer_email)
+    return EventOut(**db_event.to_dict(), username=username)
 
-# Update an event (only if the user is the organizer)
-def update_event(db: Session, event_id: UUID, event: EventUpdate, user_email: str):
+# Update an event (only if the user is the organizer) (async)
+async def update_event_async(db: AsyncSession, event_id: UUID, event: EventUpdate, user_email: str):
     """
     Update an existing event, ensuring only the organizer can perform this action.
 
     Args:
-        db (Session): The database session.
+        db (AsyncSession): The async database session.
         event_id (UUID): The event's ID to update.
         event (EventUpdate): The new event data.
         user_email (str): The user's email to verify if they are the organizer.
 
     Returns:
-        Event: The updated event object.
+        EventOut: The updated event.
 
     Raises:
         HTTPException: If the event doesn't exist or the user is not the organizer.
     """
-    db_event = db.query(Event).filter(Event.id == event_id).first()
-    if not db_event:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, 
-            detail=f"Event with ID {event_id} not found"
-        )
+    db_event = await _get_event_or_404(db, event_id)
 
     # Ensure only the organizer can update the event
     if db_event.organizer_email != user_email:
@@ -190,37 +508,31 @@ def update_event(db: Session, event_id: UUID, event: EventUpdate, user_email: st
             detail="Only the organizer can update this event"
         )
 
-    # Update the event with the provided data
     for key, value in event.dict(exclude_unset=True).items():
         setattr(db_event, key, value)
-    db.commit()
-    db.refresh(db_event)
-    username = get_username(db_event.organizer_email)
-    event_out = EventOut(**db_event.to_dict(), username=username)
-    return event_out
+    await db.commit()
+    await db.refresh(db_event)
 
-# Delete an event (only if the user is the organizer)
-def delete_event(db: Session, event_id: UUID, user_email: str):
+    username = await get_username_async(db_event.organizer_email)
+    return EventOut(**db_event.to_dict(), username=username)
+
+# Delete an event (only if the user is the organizer) (async)
+async def delete_event_async(db: AsyncSession, event_id: UUID, user_email: str):
     """
     Delete an event and remove all associated members, ensuring only the organizer can delete it.
 
     Args:
-        db (Session): The database session.
+        db (AsyncSession): The async database session.
         event_id (UUID): The event's ID to delete.
         user_email (str): The user's email to verify if they are the organizer.
 
     Returns:
-        Event: The deleted event object.
+        EventOut: The deleted event.
 
     Raises:
         HTTPException: If the event doesn't exist or the user is not the organizer.
     """
-    db_event = db.query(Event).filter(Event.id == event_id).first()
-    if not db_event:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, 
-            detail=f"Event with ID {event_id} not found"
-        )
+    db_event = await _get_event_or_404(db, event_id)
 
     # Ensure only the organizer can delete the event
     if db_event.organizer_email != user_email:
@@ -228,26 +540,26 @@ def delete_event(db: Session, event_id: UUID, user_email: str):
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Only the organizer can delete this event"
         )
-    username = get_username(db_event.organizer_email)
+    username = await get_username_async(db_event.organizer_email)
     event_out = EventOut(**db_event.to_dict(), username=username)
     try:
         # Delete all associated event members
-        db.query(EventMember).filter(EventMember.event_id == event_id).delete()
+        await db.execute(delete(EventMember).where(EventMember.event_id == event_id))
 
-        db.delete(db_event)
-        db.commit()
+        await db.delete(db_event)
+        await db.commit()
         return event_out
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Error deleting event: {str(e)}")
 
-# Add a member to an event, ensuring the user is the organizer
-def add_event_member(db: Session, event_id: UUID, user_email: str, organizer_email: str):
+# Add a member to an event, ensuring the user is the organizer (async)
+async def add_event_member_async(db: AsyncSession, event_id: UUID, user_email: str, organizer_email: str):
     """
     Add a new member to an event if the user is the organizer and the user is not already a member.
 
     Args:
-        db (Session): The database session.
+        db (AsyncSession): The async database session.
         event_id (UUID): The event's ID.
         user_email (str): The email of the user to add.
         organizer_email (str): The email of the organizer.
@@ -259,46 +571,40 @@ def add_event_member(db: Session, event_id: UUID, user_email: str, organizer_ema
         HTTPException: If the event does not exist, the user is not the organizer, or the user is already a member.
     """
     try:
-        event = db.query(Event).filter(Event.id == event_id).first()
-        if not event:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, 
-                detail=f"Event with ID {event_id} not found"
-            )
+        event = await _get_event_or_404(db, event_id)
 
         # Ensure the user is the organizer before adding a member
         if event.organizer_email != organizer_email:
             raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN, 
+                status_code=status.HTTP_403_FORBIDDEN,
                 detail="Only the organizer can add members to this event"
             )
 
         # Check if the member already exists for the event
-        existing_member = db.query(EventMember).filter(EventMember.event_id == event_id, EventMember.user_email == user_email).first()
-        if existing_member:
+        if await _get_member(db, event_id, user_email):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"User {user_email} is already a member of event {event_id}"
             )
 
-        # Create and add the member
         event_member = EventMember(event_id=event_id, user_email=user_email)
         db.add(event_member)
-        db.commit()
-        db.refresh(event_member)
+        await db.commit()
+        await db.refresh(event_member)
         return event_member
+    except HTTPException:
+        raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Error adding member: {str(e)}")
 
-
-# Remove a member from an event, ensuring the user is the organizer
-def remove_event_member(db: Session, event_id: UUID, user_email: str, organizer_email: str):
+# Remove a member from an event, ensuring the user is the organizer (async)
+async def remove_event_member_async(db: AsyncSession, event_id: UUID, user_email: str, organizer_email: str):
     """
     Remove a member from an event if the user is the organizer, ensuring the organizer cannot remove themselves.
 
     Args:
-        db (Session): The database session.
+        db (AsyncSession): The async database session.
         event_id (UUID): The event's ID.
         user_email (str): The email of the user to remove.
         organizer_email (str): The email of the organizer.
@@ -310,50 +616,45 @@ def remove_event_member(db: Session, event_id: UUID, user_email: str, organizer_
         HTTPException: If the event does not exist, the user is not the organizer, or the user is not a member.
     """
     try:
-        event = db.query(Event).filter(Event.id == event_id).first()
-        if not event:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, 
-                detail=f"Event with ID {event_id} not found"
-            )
+        event = await _get_event_or_404(db, event_id)
 
         # Ensure only the organizer can remove members
         if event.organizer_email != organizer_email:
             raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN, 
+                status_code=status.HTTP_403_FORBIDDEN,
                 detail="Only the organizer can remove members from this event"
             )
 
         # Prevent the organizer from removing themselves
         if event.organizer_email == user_email:
             raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN, 
+                status_code=status.HTTP_403_FORBIDDEN,
                 detail="Organizer cannot remove themselves from the event"
             )
 
-        # Find the event member
-        event_member = db.query(EventMember).filter(EventMember.event_id == event_id, EventMember.user_email == user_email).first()
+        event_member = await _get_member(db, event_id, user_email)
         if not event_member:
             raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, 
+                status_code=status.HTTP_404_NOT_FOUND,
                 detail="Member not found"
             )
 
-        db.delete(event_member)
-        db.commit()
+        await db.delete(event_member)
+        await db.commit()
         return event_member
+    except HTTPException:
+        raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Error removing member: {str(e)}")
 
-
-# Get members of an event
-def get_event_members(db: Session, event_id: UUID, user_email: str):
+# Get members of an event (async)
+async def get_event_members_async(db: AsyncSession, event_id: UUID, user_email: str):
     """
     Retrieve all members of an event, ensuring the user is a member.
 
     Args:
-        db (Session): The database session.
+        db (AsyncSession): The async database session.
         event_id (UUID): The event's ID.
         user_email (str): The user's email to verify membership.
 
@@ -364,37 +665,25 @@ def get_event_members(db: Session, event_id: UUID, user_email: str):
         HTTPException: If the event does not exist or the user is not a member.
     """
     try:
-        event = db.query(Event).filter(Event.id == event_id).first()
-        if not event:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Event with ID {event_id} not found"
-            )
-
-        # Check if the user is a member of the event
-        user_member = db.query(EventMember).filter(
-            EventMember.event_id == event_id,
-            EventMember.user_email == user_email
-        ).first()
-
-        if not user_member:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="You are not a member of this event"
-            )
-
-        # Retrieve and return the members
-        return db.query(EventMember).filter(EventMember.event_id == event_id).all()
+        # Check the event, the user's membership and load the members in one round trip
+        rows = (await db.execute(_event_members_for(event_id, user_email))).all()
+        if not rows:
+            raise _event_not_found(event_id)
+        if not rows[0].is_member:
+            raise _not_a_member()
+
+        return [row.EventMember for row in rows]
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Error retrieving members: {str(e)}")
 
-
-def create_reminder_entry(db: Session, reminder: ReminderCreate):
+async def create_reminder_entry_async(db: AsyncSession, reminder: ReminderCreate):
     """
     Create a new reminder entry for an event.
 
     Args:
-        db (Session): The database session.
+        db (AsyncSession): The async database session.
         reminder (ReminderCreate): The reminder data.
 
     Returns:
@@ -410,57 +699,55 @@ def create_reminder_entry(db: Session, reminder: ReminderCreate):
             reminder_time=reminder.reminder_time
         )
         db.add(new_reminder)
-        db.commit()
-        db.refresh(new_reminder)
+        await db.commit()
+        await db.refresh(new_reminder)
         return new_reminder
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Error creating reminder: {str(e)}")
 
-def delete_reminder_entry(db: Session, reminder_id: int):
+async def delete_reminder_entry_async(db: AsyncSession, reminder_id: int):
     """
     Delete a reminder entry by its ID.
 
     Args:
-        db (Session): The database session.
+        db (AsyncSession): The async database session.
         reminder_id (int): The ID of the reminder to be deleted.
 
     Returns:
-        bool: True if deletion is successful, False if reminder not found.
+        Reminder: The deleted reminder.
 
     Raises:
-        HTTPException: If there is an error deleting the reminder.
+        HTTPException: If the reminder does not exist or there is an error deleting it.
     """
     try:
-        reminder = db.query(Reminder).filter(Reminder.id == reminder_id).first()
-        if reminder:
-            db.delete(reminder)
-            db.commit()
-            return reminder
-        else:
+        reminder = (await db.execute(select(Reminder).where(Reminder.id == reminder_id))).scalars().first()
+        if not reminder:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Reminder not found")
+
+        await db.delete(reminder)
+        await db.commit()
+        return reminder
+    except HTTPException:
+        raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Error deleting reminder: {str(e)}")
-    
-def get_reminders(db: Session, user_email: str):
+
+async def get_reminders_async(db: AsyncSession, user_email: str):
     """
     Retrieve a list of events with reminders for a specific user.
 
     Args:
-        db (Session): The database session.
+        db (AsyncSession): The async database session.
         user_email (str): The user's email to retrieve reminders for.
 
     Returns:
         List[EventReminderOut]: A list of events with reminders for the user.
     """
     try:
-        return (
-            db.query(Event)
-            .join(EventMember)
-            .join(Reminder)
-            .filter(EventMember.user_email == user_email)
-            .with_entities(
+        result = await db.execute(
+            select(
                 Event.id.label("event_id"),
                 Event.title,
                 Event.date,
@@ -470,12 +757,16 @@ def get_reminders(db: Session, user_email: str):
                 Event.is_online,
                 Event.organizer_email,
                 Reminder.reminder_time,
-                Reminder.id.label("reminder_id")
+                Reminder.id.label("reminder_id"),
             )
-            .all()
+            .select_from(Event)
+            .join(EventMember, EventMember.event_id == Event.id)
+            .join(Reminder, Reminder.event_id == Event.id)
+            .where(EventMember.user_email == user_email)
         )
+        return result.all()
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error retrieving reminders: {str(e)}",
-        )
\ No newline at end of file
+        )
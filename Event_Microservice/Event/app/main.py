@@ -1,21 +1,71 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
 from app.api.main import api_router
-from app.core.db import engine, Base
+from app.bootstrap import bootstrap_schema
+from app.core.config import settings
+from app.core.db import async_engine
 from app.core.celery_config import celery_app
+from app.core.metrics import CeleryQueueCollector, PrometheusMiddleware, metrics_response, register_scrape_collector
+from app.core.profiling import ProfilingMiddleware, profiling_enabled
+from app.core.tracing import TracingMiddleware, configure_tracing, tracing_enabled
 from app.tasks import send_event_created_email, send_member_added_email, send_event_reminder_email, send_reminder, send_join_request
-from app.services.wait_for_postgres import wait_for_postgres
-from app.services.wait_for_redis import wait_for_redis
+from app.services import auth_client
+from app.services.readiness import readiness
+from app.services.user_cache import user_cache
+from app.services.user_events import user_event_subscriber
+
+# Set up logger
+logger = logging.getLogger(__name__)
+
+async def wait_for_dependencies():
+    """
+    Waits for PostgreSQL and Redis in the background so the server accepts connections,
+    and answers `/healthz`, straight away. `/readyz` reports 503 until both answer.
 
-# Wait for PostgreSQL and Redis to be ready before starting the app
-wait_for_postgres()
-wait_for_redis()
+    Once Redis is up, any existing tasks in the Celery queue are purged. The schema is
+    created by the one-shot `python -m app.bootstrap` command, or here when
+    `SCHEMA_BOOTSTRAP_ON_STARTUP` is set for local development.
+    """
+    try:
+        await readiness.wait_until_ready()
+    except TimeoutError as e:
+        logger.error(f"Dependencies are still unavailable: {str(e)}")
+        return
+
+    await asyncio.to_thread(celery_app.control.purge)
+    if settings.SCHEMA_BOOTSTRAP_ON_STARTUP:
+        await asyncio.to_thread(bootstrap_schema)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Subscribes to user-change events on startup, and closes the gRPC channels to the
+    auth service and the async database pool on shutdown.
+    """
+    user_event_subscriber.start()  # Evict cached users when the auth service reports changes
+    dependencies = asyncio.create_task(wait_for_dependencies())
+
+    yield
+
+    dependencies.cancel()
+    user_event_subscriber.stop()
+    auth_client.close_channels()  # Close the shared gRPC channels to the auth service
+    await auth_client.close_aio_channels()
+    await async_engine.dispose()  # Release pooled asyncpg connections
+
+# Install the tracer provider before the app is built
+configure_tracing("event-service")
 
 # Create FastAPI app instance
 app = FastAPI(
     title="Dodgygeezers Event",
-    on_startup=[celery_app.control.purge]  # Purge any existing tasks in the Celery queue on startup
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -25,9 +75,14 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(PrometheusMiddleware)
+if profiling_enabled():
+    app.add_middleware(ProfilingMiddleware)
+if tracing_enabled():
+    app.add_middleware(TracingMiddleware)
 
-# Ensure all database tables are created in Supabase
-Base.metadata.create_all(bind=engine)
+# Report the depth of the Celery queue alongside the API metrics
+register_scrape_collector(CeleryQueueCollector(settings.CELERY_BROKER, [celery_app.conf.task_default_queue]))
 
 # Include the API routes from the main router
 app.include_router(api_router)
@@ -44,3 +99,44 @@ def read_root():
         dict: A welcome message indicating the service is operational.
     """
     return {"message": "Welcome to the Dodgygeezers Event"}
+
+@app.get("/healthz")
+def read_liveness():
+    """
+    Liveness probe: the process is up and serving requests. Does not touch any dependency.
+
+    Returns:
+        dict: `{"status": "ok"}`.
+    """
+    return {"status": "ok"}
+
+@app.get("/readyz")
+async def read_readiness():
+    """
+    Readiness probe: checks PostgreSQL and Redis concurrently.
+
+    Returns:
+        JSONResponse: 200 if every dependency answers, otherwise 503, with the result of each check.
+    """
+    ready, checks = await readiness.check()
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={"status": "ready" if ready else "unavailable", "checks": checks},
+    )
+
+@app.get("/metrics", include_in_schema=False)
+def read_metrics():
+    """
+    Exposes Prometheus metrics: HTTP, database and auth-service client latency histograms and the Celery queue depth.
+    """
+    return metrics_response()
+
+@app.get("/cache/stats")
+def read_cache_stats():
+    """
+    Exposes counters for the auth-service user cache.
+
+    Returns:
+        dict: Size, hit, miss, eviction and Redis tier counters for this worker process.
+    """
+    return user_cache.stats()
@@ -4,16 +4,18 @@ from sqlalchemy import (
     String,
     Text,
     Boolean,
+    Computed,
     DateTime,
     ForeignKey,
+    Index,
     UniqueConstraint
 )
-from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR, UUID
 from uuid import UUID as N_UUID
 from uuid import uuid4
-from sqlalchemy.orm import relationship
-from pydantic import BaseModel, EmailStr
-from datetime import datetime
+from sqlalchemy.orm import deferred, relationship
+from pydantic import BaseModel, EmailStr, field_validator
+from datetime import datetime, timezone
 from typing import List, Optional
 from app.core.db import Base
 
@@ -21,6 +23,18 @@ from app.core.db import Base
 # Database Models
 # ---------------------------
 
+# Text search configuration of the event search vector; queries must use the same one
+SEARCH_CONFIG = "english"
+
+def as_naive_utc(value: datetime) -> datetime:
+    """
+    Converts a datetime to naive UTC, the convention of the `timestamp without time zone`
+    columns. Naive values are assumed to be UTC already.
+    """
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
 class Event(Base):
     """
     Represents an event entity in the database.
@@ -46,10 +60,28 @@ class Event(Base):
     is_online = Column(Boolean, default=True)
     organizer_email = Column(String, index=True, nullable=False)
 
+    # Kept up to date by PostgreSQL; title matches rank above location, location above description
+    search_vector = deferred(Column(
+        TSVECTOR,
+        Computed(
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(location, '')), 'B') || "
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'C')",
+            persisted=True,
+        ),
+    ))
+
     # Relationships
     reminders = relationship("Reminder", back_populates="event")
     members = relationship("EventMember", back_populates="event", cascade='all, delete')
 
+    # Listings are ordered and paginated by (date, id); search and tag filters match through GIN indexes
+    __table_args__ = (
+        Index("ix_events_date_id", "date", "id"),
+        Index("ix_events_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_events_tags", "tags", postgresql_using="gin"),
+    )
+
     def to_dict(self):
         return {
             "id": self.id,
@@ -76,13 +108,16 @@ class EventMember(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     event_id = Column(UUID(as_uuid=True), ForeignKey("events.id"), nullable=False, index=True)
-    user_email = Column(String, nullable=False, index=True)
+    user_email = Column(String, nullable=False)
 
     # Relationships
     event = relationship("Event", back_populates="members")
 
-    # Constraints
-    __table_args__ = (UniqueConstraint('event_id', 'user_email', name='unique_event_member'),)
+    # Constraints; a user's events are found through (user_email, event_id) without touching the table
+    __table_args__ = (
+        UniqueConstraint('event_id', 'user_email', name='unique_event_member'),
+        Index("ix_event_members_user_email_event_id", "user_email", "event_id"),
+    )
 
 
 class Reminder(Base):
@@ -105,6 +140,22 @@ class Reminder(Base):
     # Relationships
     event = relationship("Event", back_populates="reminders")
 
+class EventTagCount(Base):
+    """
+    Number of events carrying each tag, kept up to date by a trigger on `events`
+    (installed by app.bootstrap) so tag facets never scan the events table.
+
+    Attributes:
+        tag (str): The tag.
+        count (int): Number of events with the tag; tags no longer in use stay at 0.
+    """
+    __tablename__ = "event_tag_counts"
+
+    tag = Column(String, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (Index("ix_event_tag_counts_count", "count"),)
+
 # ---------------------------
 # Pydantic Schemas
 # ---------------------------
@@ -130,6 +181,12 @@ class EventBase(BaseModel):
     is_online: bool
     organizer_email: str
 
+    @field_validator("date")
+    @classmethod
+    def normalize_date(cls, value: datetime) -> datetime:
+        # Event dates are stored as naive UTC
+        return as_naive_utc(value)
+
 
 class EventCreate(EventBase):
     """
@@ -152,15 +209,42 @@ class EventOut(EventBase):
 
     Attributes:
         id (UUID): Unique identifier of the event.
+        is_member (Optional[bool]): Whether the requesting user is a member; only set by
+            listings that were given a user.
     """
     id: N_UUID
     username: str
+    is_member: Optional[bool] = None
 
     class Config:
         from_attributes = True
         arbitrary_types_allowed = True
 
 
+class EventPage(BaseModel):
+    """
+    Schema for a page of events, in (date, id) order.
+
+    Attributes:
+        items (List[EventOut]): The events on this page.
+        next_cursor (Optional[str]): Opaque cursor for the next page; None on the last page.
+    """
+    items: List[EventOut]
+    next_cursor: Optional[str] = None
+
+
+class TagCount(BaseModel):
+    """
+    Schema for a tag facet.
+
+    Attributes:
+        tag (str): The tag.
+        count (int): Number of events with the tag.
+    """
+    tag: str
+    count: int
+
+
 class EventMemberBase(BaseModel):
     """
     Base schema for event member operations.
@@ -204,6 +288,12 @@ class ReminderCreate(BaseModel):
     user_email: str
     reminder_time: datetime
 
+    @field_validator("reminder_time")
+    @classmethod
+    def normalize_reminder_time(cls, value: datetime) -> datetime:
+        # Reminder times are stored as naive UTC
+        return as_naive_utc(value)
+
 
 class ReminderOut(ReminderCreate):
     """
@@ -0,0 +1,278 @@
+import asyncio
+import itertools
+import os
+import threading
+import logging
+
+import grpc
+
+from app.api import auth_pb2, auth_pb2_grpc
+from app.core.config import settings
+from app.core.metrics import grpc_client_call
+from app.core.tracing import grpc_client_span
+
+# Set up logger
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# Process-wide channels and stubs, created lazily on first use
+_lock = threading.Lock()
+_channels: list[grpc.Channel] = []
+_stubs: list[auth_pb2_grpc.AuthServiceStub] = []
+_next_stub = itertools.count()
+_owner_pid: int | None = None
+
+# Asyncio channels and stubs, bound to the event loop that created them
+_aio_channels: list[grpc.aio.Channel] = []
+_aio_stubs: list[auth_pb2_grpc.AuthServiceStub] = []
+_aio_loop: asyncio.AbstractEventLoop | None = None
+# Close tasks for channels left behind by a previous loop, kept until they finish
+_aio_closing: set[asyncio.Future] = set()
+
+
+def _channel_options() -> list[tuple[str, int | str]]:
+    """
+    Builds the gRPC channel options used for the shared auth channels.
+
+    Keepalive pings keep the HTTP/2 connection warm between bursts of traffic
+    so that idle periods do not force a fresh TCP/HTTP2 handshake. The load
+    balancing policy spreads calls over every address the auth host resolves
+    to, and a local subchannel pool gives each channel its own connection so
+    that several channels land on different `SO_REUSEPORT` server processes.
+
+    Returns:
+        list[tuple[str, int | str]]: The channel options.
+    """
+    return [
+        ("grpc.keepalive_time_ms", settings.AUTH_GRPC_KEEPALIVE_TIME_MS),
+        ("grpc.keepalive_timeout_ms", settings.AUTH_GRPC_KEEPALIVE_TIMEOUT_MS),
+        ("grpc.keepalive_permit_without_calls", 1),
+        ("grpc.http2.max_pings_without_data", 0),
+        ("grpc.lb_policy_name", settings.AUTH_GRPC_LB_POLICY),
+        ("grpc.use_local_subchannel_pool", 1),
+    ]
+
+
+def _compression() -> grpc.Compression:
+    """
+    Returns the compression algorithm configured for auth calls.
+    """
+    if settings.AUTH_GRPC_COMPRESSION.lower() == "gzip":
+        return grpc.Compression.Gzip
+    return grpc.Compression.NoCompression
+
+
+def get_stub() -> auth_pb2_grpc.AuthServiceStub:
+    """
+    Returns one of the shared AuthService stubs, creating the channels on first use.
+
+    Successive calls rotate over `AUTH_GRPC_CHANNELS` channels so that load is
+    spread across auth server processes. The channels are re-created if the
+    current process is a fork of the process that created them (e.g. a Celery
+    prefork child), since gRPC channels must not be shared across a fork.
+
+    Returns:
+        AuthServiceStub: A stub bound to one of the process-wide channels.
+    """
+    global _channels, _stubs, _owner_pid
+
+    if not _stubs or _owner_pid != os.getpid():
+        with _lock:
+            if not _stubs or _owner_pid != os.getpid():
+                # dns:/// re-resolves the host and yields every address, which round_robin balances over
+                target = f"dns:///{settings.AUTH_SERVICE_HOST}:{settings.AUTH_SERVICE_PORT}"
+                _channels = [
+                    grpc.insecure_channel(target, options=_channel_options(), compression=_compression())
+                    for _ in range(max(1, settings.AUTH_GRPC_CHANNELS))
+                ]
+                _stubs = [auth_pb2_grpc.AuthServiceStub(channel) for channel in _channels]
+                _owner_pid = os.getpid()
+                logger.info(f"Opened {len(_channels)} gRPC channels to auth service at {target}")
+
+    stubs = _stubs
+    return stubs[next(_next_stub) % len(stubs)]
+
+
+def validate_user(email: str, timeout: float | None = None) -> auth_pb2.ValidateUserResponse:
+    """
+    Calls AuthService.ValidateUser over the shared channels.
+
+    Args:
+        email (str): The email address of the user to validate.
+        timeout (float | None): Per-call deadline in seconds. Defaults to `AUTH_GRPC_TIMEOUT`.
+
+    Returns:
+        ValidateUserResponse: The raw response from the auth service.
+
+    Raises:
+        grpc.RpcError: If the call fails or the deadline is exceeded.
+    """
+    request = auth_pb2.ValidateUserRequest(email=email)
+    with grpc_client_call("ValidateUser"), grpc_client_span("ValidateUser") as metadata:
+        return get_stub().ValidateUser(
+            request,
+            timeout=timeout if timeout is not None else settings.AUTH_GRPC_TIMEOUT,
+            metadata=metadata,
+        )
+
+
+def validate_users(emails: list[str], timeout: float | None = None) -> list[auth_pb2.UserValidation]:
+    """
+    Calls AuthService.ValidateUsers over the shared channels, resolving many emails in one round trip.
+
+    Batches larger than `AUTH_GRPC_STREAM_THRESHOLD` use the server-streaming
+    variant so a single response message never grows unbounded.
+
+    Args:
+        emails (list[str]): The email addresses to validate.
+        timeout (float | None): Per-call deadline in seconds. Defaults to `AUTH_GRPC_TIMEOUT`.
+
+    Returns:
+        list[UserValidation]: One entry per distinct email.
+
+    Raises:
+        grpc.RpcError: If the call fails or the deadline is exceeded.
+    """
+    if not emails:
+        return []
+
+    request = auth_pb2.ValidateUsersRequest(emails=emails)
+    timeout = timeout if timeout is not None else settings.AUTH_GRPC_TIMEOUT
+
+    if len(emails) > settings.AUTH_GRPC_STREAM_THRESHOLD:
+        with grpc_client_call("StreamValidateUsers"), grpc_client_span("StreamValidateUsers") as metadata:
+            return list(get_stub().StreamValidateUsers(request, timeout=timeout, metadata=metadata))
+    with grpc_client_call("ValidateUsers"), grpc_client_span("ValidateUsers") as metadata:
+        return list(get_stub().ValidateUsers(request, timeout=timeout, metadata=metadata).users)
+
+
+def close_channels():
+    """
+    Closes the shared channels, if they were opened by this process.
+
+    Safe to call multiple times; the next call to `get_stub` opens new channels.
+    """
+    global _channels, _stubs, _owner_pid
+
+    with _lock:
+        if _channels and _owner_pid == os.getpid():
+            for channel in _channels:
+                channel.close()
+            logger.info("Closed gRPC channels to auth service")
+        _channels = []
+        _stubs = []
+        _owner_pid = None
+
+
+def get_aio_stub() -> auth_pb2_grpc.AuthServiceStub:
+    """
+    Returns one of the asyncio AuthService stubs for the running event loop.
+
+    grpc.aio channels belong to the loop they were created on, so the channels are
+    opened lazily from the first coroutine that needs them and re-opened if called
+    from a different loop. Successive calls rotate over `AUTH_GRPC_CHANNELS` channels.
+
+    Returns:
+        AuthServiceStub: A stub whose methods return awaitables.
+    """
+    global _aio_channels, _aio_stubs, _aio_loop
+
+    loop = asyncio.get_running_loop()
+    if not _aio_stubs or _aio_loop is not loop:
+        _close_stale_aio_channels(_aio_channels, _aio_loop)
+        target = f"dns:///{settings.AUTH_SERVICE_HOST}:{settings.AUTH_SERVICE_PORT}"
+        _aio_channels = [
+            grpc.aio.insecure_channel(target, options=_channel_options(), compression=_compression())
+            for _ in range(max(1, settings.AUTH_GRPC_CHANNELS))
+        ]
+        _aio_stubs = [auth_pb2_grpc.AuthServiceStub(channel) for channel in _aio_channels]
+        _aio_loop = loop
+        logger.info(f"Opened {len(_aio_channels)} asyncio gRPC channels to auth service at {target}")
+
+    return _aio_stubs[next(_next_stub) % len(_aio_stubs)]
+
+
+def _close_stale_aio_channels(channels: list[grpc.aio.Channel], loop: asyncio.AbstractEventLoop | None):
+    """
+    Closes the channels of a previous event loop before they are replaced.
+
+    A loop that is still running (in another thread) closes its own channels, cancelling
+    any calls in flight there. Channels of a stopped loop have no calls left and are
+    closed from the running loop.
+    """
+    for channel in channels:
+        if loop is not None and loop.is_running():
+            future = asyncio.run_coroutine_threadsafe(channel.close(), loop)
+        else:
+            future = asyncio.ensure_future(channel.close())
+        _aio_closing.add(future)
+        future.add_done_callback(_aio_closing.discard)
+    if channels:
+        logger.info(f"Closing {len(channels)} asyncio gRPC channels opened on a previous event loop")
+
+
+async def validate_user_async(email: str, timeout: float | None = None) -> auth_pb2.ValidateUserResponse:
+    """
+    Calls AuthService.ValidateUser without blocking the event loop.
+
+    Args:
+        email (str): The email address of the user to validate.
+        timeout (float | None): Per-call deadline in seconds. Defaults to `AUTH_GRPC_TIMEOUT`.
+
+    Returns:
+        ValidateUserResponse: The raw response from the auth service.
+
+    Raises:
+        grpc.RpcError: If the call fails or the deadline is exceeded.
+    """
+    request = auth_pb2.ValidateUserRequest(email=email)
+    with grpc_client_call("ValidateUser"), grpc_client_span("ValidateUser") as metadata:
+        return await get_aio_stub().ValidateUser(
+            request,
+            timeout=timeout if timeout is not None else settings.AUTH_GRPC_TIMEOUT,
+            metadata=metadata,
+        )
+
+
+async def validate_users_async(emails: list[str], timeout: float | None = None) -> list[auth_pb2.UserValidation]:
+    """
+    Calls AuthService.ValidateUsers (or its streaming variant for large batches) without blocking the event loop.
+
+    Args:
+        emails (list[str]): The email addresses to validate.
+        timeout (float | None): Per-call deadline in seconds. Defaults to `AUTH_GRPC_TIMEOUT`.
+
+    Returns:
+        list[UserValidation]: One entry per distinct email.
+
+    Raises:
+        grpc.RpcError: If the call fails or the deadline is exceeded.
+    """
+    if not emails:
+        return []
+
+    request = auth_pb2.ValidateUsersRequest(emails=emails)
+    timeout = timeout if timeout is not None else settings.AUTH_GRPC_TIMEOUT
+
+    if len(emails) > settings.AUTH_GRPC_STREAM_THRESHOLD:
+        with grpc_client_call("StreamValidateUsers"), grpc_client_span("StreamValidateUsers") as metadata:
+            return [result async for result in get_aio_stub().StreamValidateUsers(request, timeout=timeout, metadata=metadata)]
+    with grpc_client_call("ValidateUsers"), grpc_client_span("ValidateUsers") as metadata:
+        return list((await get_aio_stub().ValidateUsers(request, timeout=timeout, metadata=metadata)).users)
+
+
+async def close_aio_channels():
+    """
+    Closes the asyncio channels, including any left behind by another event loop.
+    """
+    global _aio_channels, _aio_stubs, _aio_loop
+
+    if _aio_channels and _aio_loop is asyncio.get_running_loop():
+        for channel in _aio_channels:
+            await channel.close()
+        logger.info("Closed asyncio gRPC channels to auth service")
+    else:
+        _close_stale_aio_channels(_aio_channels, _aio_loop)
+    _aio_channels = []
+    _aio_stubs = []
+    _aio_loop = None
@@ -0,0 +1,242 @@
+import logging
+import os
+import smtplib
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from email.message import Message
+
+from app.core.config import settings
+from app.core.tracing import tracer
+
+# Set up logger
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# Errors after which a connection can no longer be trusted and must be replaced
+CONNECTION_ERRORS = (smtplib.SMTPServerDisconnected, smtplib.SMTPResponseException, OSError)
+
+def _is_transient(error: Exception) -> bool:
+    """
+    Whether a connection error is worth reconnecting for: network failures and 4xx replies
+    are, failed logins and permanent 5xx replies would only fail again (and retrying a
+    bad password risks locking the account).
+    """
+    if isinstance(error, smtplib.SMTPAuthenticationError):
+        return False
+    if isinstance(error, smtplib.SMTPResponseException):
+        return 400 <= error.smtp_code < 500
+    return True
+
+
+class _PooledConnection:
+    """
+    An authenticated SMTP session plus the bookkeeping the pool needs to retire it.
+    """
+
+    def __init__(self, smtp: smtplib.SMTP):
+        self.smtp = smtp
+        self.last_used = time.monotonic()
+        self.sent = 0
+
+    def close(self):
+        try:
+            self.smtp.quit()
+        except Exception:
+            self.smtp.close()
+
+
+class SMTPPool:
+    """
+    Process-local pool of authenticated SMTP connections.
+
+    Opening a connection costs a TCP handshake, STARTTLS and AUTH; the pool keeps up to
+    `max_size` sessions open so consecutive emails skip all three. A session is retired
+    after sitting idle for `idle_timeout` seconds (most relays drop idle clients after a
+    minute or two) or after `max_messages` messages, and is replaced transparently if the
+    server has dropped it in the meantime.
+
+    The pool must not be shared across `fork()`: call `close_all()` in each new Celery
+    child (see `app.core.celery_config`). Connections inherited from another PID are
+    discarded on first use as a safety net.
+    """
+
+    def __init__(self, max_size: int, idle_timeout: float, max_messages: int):
+        """
+        Initializes the pool.
+
+        Args:
+            max_size (int): Maximum number of open connections.
+            idle_timeout (float): Seconds after which an unused connection is closed instead of reused.
+            max_messages (int): Messages sent over one connection before it is replaced.
+        """
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.max_messages = max_messages
+
+        self._idle: deque[_PooledConnection] = deque()
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._owner_pid = os.getpid()
+
+        self.connects = 0
+        self.reuses = 0
+
+    def _connect(self) -> _PooledConnection:
+        smtp = smtplib.SMTP(settings.SMTP_SERVER, settings.SMTP_PORT, timeout=settings.SMTP_TIMEOUT)
+        try:
+            smtp.starttls()
+            smtp.login(settings.SMTP_USER, settings.SMTP_PASSWORD)
+        except Exception:
+            smtp.close()
+            raise
+        self.connects += 1
+        return _PooledConnection(smtp)
+
+    def _checkout(self) -> _PooledConnection:
+        with self._lock:
+            if self._owner_pid != os.getpid():
+                # Sockets inherited across fork belong to the parent; drop them without QUIT
+                self._idle.clear()
+                self._owner_pid = os.getpid()
+
+            while self._idle:
+                conn = self._idle.pop()  # most recently used first
+                if time.monotonic() - conn.last_used < self.idle_timeout:
+                    self.reuses += 1
+                    return conn
+                conn.close()
+        return self._connect()
+
+    def _checkin(self, conn: _PooledConnection):
+        if conn.sent >= self.max_messages:
+            conn.close()
+            return
+        conn.last_used = time.monotonic()
+        with self._lock:
+            self._idle.append(conn)
+
+    @contextmanager
+    def connection(self):
+        """
+        Borrows an authenticated connection, blocking while all `max_size` are in use.
+
+        The connection is returned to the pool when the block exits normally and
+        closed if the block raises one of `CONNECTION_ERRORS`.
+        """
+        with self._slots:
+            conn = self._checkout()
+            try:
+                yield conn
+            except CONNECTION_ERRORS:
+                conn.smtp.close()
+                raise
+            except Exception:
+                self._checkin(conn)
+                raise
+            self._checkin(conn)
+
+    def send(self, msg: Message):
+        """
+        Sends one message over a pooled connection.
+
+        If the server has dropped the connection since it was last used, the message is
+        retried once over a fresh connection.
+
+        Raises:
+            smtplib.SMTPException: If the message could not be delivered.
+        """
+        self.send_many([msg], raise_on_error=True)
+
+    def send_many(self, messages: list[Message], raise_on_error: bool = False) -> list[tuple[Message, Exception]]:
+        """
+        Sends a batch of messages over a single SMTP session.
+
+        A disconnect part-way through the batch reconnects once and resumes with the message
+        that failed; a message the server rejects outright is skipped. If that reconnect fails
+        too, or the server refuses the login or replies with a permanent error, the rest of
+        the batch fails at once instead of trying again for every message.
+
+        Args:
+            messages (list[Message]): The messages to send.
+            raise_on_error (bool): Raise the first failure instead of collecting it.
+
+        Returns:
+            list[tuple[Message, Exception]]: The messages that could not be sent and why.
+        """
+        with tracer.start_as_current_span(
+            "smtp send", attributes={"server.address": settings.SMTP_SERVER, "smtp.messages": len(messages)},
+        ) as span:
+            failures = self._send_many(messages, raise_on_error)
+            span.set_attribute("smtp.failures", len(failures))
+        return failures
+
+    def _send_many(self, messages: list[Message], raise_on_error: bool) -> list[tuple[Message, Exception]]:
+        failures = []
+        pending = deque(messages)
+        reconnecting = False  # The previous session failed before sending anything
+
+        while pending:
+            try:
+                with self.connection() as conn:
+                    while pending:
+                        msg = pending[0]
+                        try:
+                            conn.smtp.send_message(msg)
+                        except (smtplib.SMTPRecipientsRefused, smtplib.SMTPSenderRefused, smtplib.SMTPDataError) as e:
+                            # The session is still usable; only this message failed
+                            conn.smtp.rset()
+                            pending.popleft()
+                            if raise_on_error:
+                                raise smtplib.SMTPException(str(e)) from e
+                            failures.append((msg, e))
+                            continue
+                        pending.popleft()
+                        conn.sent += 1
+                        reconnecting = False
+                        if conn.sent >= self.max_messages:
+                            break  # checkin retires it; the next loop opens a fresh one
+            except CONNECTION_ERRORS as e:
+                if reconnecting or not _is_transient(e):
+                    if raise_on_error:
+                        raise
+                    logger.error(f"SMTP unavailable ({str(e)}); failing the remaining {len(pending)} messages")
+                    failures.extend((msg, e) for msg in pending)
+                    break
+                reconnecting = True
+                logger.warning(f"SMTP connection lost ({str(e)}); reconnecting")
+
+        return failures
+
+    def close_all(self):
+        """
+        Closes every idle connection. Connections currently checked out are closed when returned.
+        """
+        with self._lock:
+            inherited = self._owner_pid != os.getpid()
+            idle, self._idle = self._idle, deque()
+            self._owner_pid = os.getpid()
+        if inherited:
+            return  # The parent still owns these sockets
+        for conn in idle:
+            conn.close()
+
+    def stats(self) -> dict:
+        """
+        Returns connection counters for monitoring.
+        """
+        return {
+            "idle": len(self._idle),
+            "max_size": self.max_size,
+            "connects": self.connects,
+            "reuses": self.reuses,
+        }
+
+
+# Process-wide pool, used by app.utils.send_email and the Celery email tasks
+smtp_pool = SMTPPool(
+    max_size=settings.SMTP_POOL_SIZE,
+    idle_timeout=settings.SMTP_POOL_IDLE_TIMEOUT,
+    max_messages=settings.SMTP_MAX_MESSAGES_PER_CONNECTION,
+)
@@ -0,0 +1,284 @@
+import asyncio
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+import redis
+
+from app.core.config import settings
+
+# Set up logger
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# Sentinel returned by TTLCache.get when a key is absent or expired
+MISSING = object()
+
+
+class TTLCache:
+    """
+    Thread-safe in-process cache bounded by both size (LRU eviction) and age (TTL expiry).
+
+    Each entry carries its own expiry so that negative results can be kept for
+    a shorter time than positive ones.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        """
+        Initializes the cache.
+
+        Args:
+            max_size (int): Maximum number of entries before the least recently used is evicted.
+            ttl (float): Default time-to-live of an entry, in seconds.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._data: OrderedDict[str, tuple[float, object]] = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str):
+        """
+        Returns the cached value for `key`, or `MISSING` if absent or expired.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return MISSING
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                return MISSING
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value, ttl: float | None = None):
+        """
+        Stores `value` under `key`, evicting the least recently used entries if the cache is full.
+        """
+        expires_at = time.monotonic() + (ttl if ttl is not None else self.ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: str):
+        """
+        Removes `key` from the cache if present.
+        """
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        """
+        Removes every entry from the cache.
+        """
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class UserCache:
+    """
+    Two-tier cache of auth-service lookups keyed by email.
+
+    The first tier is a per-process `TTLCache`. The optional second tier is
+    Redis, shared by every API and Celery worker, so a user resolved by one
+    process is a hit for all the others. A cached value of `None` records that
+    the user was not found (negative caching).
+    """
+
+    def __init__(self):
+        self.local = TTLCache(settings.USER_CACHE_MAX_SIZE, settings.USER_CACHE_TTL)
+        self.negative_ttl = settings.USER_CACHE_NEGATIVE_TTL
+        self.key_prefix = "event:user:"
+
+        self.redis_hits = 0
+        self.redis_misses = 0
+        self.redis_errors = 0
+
+        self._redis = None
+        if settings.USER_CACHE_REDIS_ENABLED:
+            self._redis = redis.Redis(
+                host=settings.REDIS_HOST,
+                port=settings.REDIS_PORT,
+                db=settings.USER_CACHE_REDIS_DB,
+                socket_timeout=settings.USER_CACHE_REDIS_TIMEOUT,
+                socket_connect_timeout=settings.USER_CACHE_REDIS_TIMEOUT,
+            )
+
+    def get(self, email: str):
+        """
+        Looks up a user, checking the local tier first and then Redis.
+
+        Args:
+            email (str): The user's email.
+
+        Returns:
+            `MISSING` if the user is not cached, `None` if the user is cached as
+            not found, otherwise a dict of user details (e.g. username).
+        """
+        return self.get_many([email])[email]
+
+    async def get_async(self, email: str):
+        """
+        Async variant of `get` that keeps the Redis round trip off the event loop.
+        """
+        return (await self.get_many_async([email]))[email]
+
+    def get_many(self, emails: list[str]) -> dict:
+        """
+        Looks up a batch of users, checking the local tier first and fetching the
+        rest from Redis in a single MGET.
+
+        Args:
+            emails (list[str]): The users' emails; duplicates are looked up once.
+
+        Returns:
+            dict: The `get` result (`MISSING`, `None` or user details) keyed by email.
+        """
+        values, remaining = self._get_local(emails)
+        if remaining and self._redis is not None:
+            values.update(self._get_shared(remaining))
+        return values
+
+    async def get_many_async(self, emails: list[str]) -> dict:
+        """
+        Async variant of `get_many`. The Redis client is synchronous, so the MGET runs
+        in a worker thread instead of blocking the event loop for up to its timeout.
+        """
+        values, remaining = self._get_local(emails)
+        if remaining and self._redis is not None:
+            values.update(await asyncio.to_thread(self._get_shared, remaining))
+        return values
+
+    def set_user(self, email: str, username: str):
+        """
+        Caches a valid user.
+        """
+        self.set_many({email: {"username": username}})
+
+    def set_missing(self, email: str):
+        """
+        Caches a user as not found, for the (shorter) negative TTL.
+        """
+        self.set_many({email: None})
+
+    def set_many(self, entries: dict[str, dict | None]):
+        """
+        Caches a batch of users, writing them to Redis in a single pipeline.
+
+        Args:
+            entries (dict[str, dict | None]): User details keyed by email; `None` caches
+                the user as not found.
+        """
+        self._set_local(entries)
+        if self._redis is not None:
+            self._set_shared(entries)
+
+    async def set_many_async(self, entries: dict[str, dict | None]):
+        """
+        Async variant of `set_many` that runs the Redis pipeline in a worker thread.
+        """
+        self._set_local(entries)
+        if self._redis is not None:
+            await asyncio.to_thread(self._set_shared, entries)
+
+    def invalidate(self, email: str):
+        """
+        Evicts a user from both tiers.
+        """
+        self.local.delete(email)
+        if self._redis is not None:
+            try:
+                self._redis.delete(self.key_prefix + email)
+            except redis.RedisError as e:
+                self.redis_errors += 1
+                logger.warning(f"User cache Redis invalidation failed for {email}: {str(e)}")
+
+    def stats(self) -> dict:
+        """
+        Returns hit/miss/eviction counters for monitoring.
+        """
+        return {
+            "size": len(self.local),
+            "max_size": self.local.max_size,
+            "hits": self.local.hits,
+            "misses": self.local.misses,
+            "evictions": self.local.evictions,
+            "expirations": self.local.expirations,
+            "redis_enabled": self._redis is not None,
+            "redis_hits": self.redis_hits,
+            "redis_misses": self.redis_misses,
+            "redis_errors": self.redis_errors,
+        }
+
+    def _ttl(self, value: dict | None) -> float:
+        return settings.USER_CACHE_TTL if value is not None else self.negative_ttl
+
+    def _get_local(self, emails: list[str]) -> tuple[dict, list[str]]:
+        values = {}
+        remaining = []
+        for email in dict.fromkeys(emails):
+            values[email] = self.local.get(email)
+            if values[email] is MISSING:
+                remaining.append(email)
+        return values, remaining
+
+    def _get_shared(self, emails: list[str]) -> dict:
+        try:
+            raws = self._redis.mget([self.key_prefix + email for email in emails])
+        except redis.RedisError as e:
+            self.redis_errors += 1
+            logger.warning(f"User cache Redis lookup failed for {len(emails)} users: {str(e)}")
+            return dict.fromkeys(emails, MISSING)
+
+        values = {}
+        for email, raw in zip(emails, raws):
+            if raw is None:
+                self.redis_misses += 1
+                values[email] = MISSING
+                continue
+
+            self.redis_hits += 1
+            payload = json.loads(raw)
+            values[email] = None if payload.get("missing") else {"username": payload["username"]}
+
+            # Promote the shared entry into the local tier
+            self.local.set(email, values[email], ttl=self._ttl(values[email]))
+        return values
+
+    def _set_local(self, entries: dict[str, dict | None]):
+        for email, value in entries.items():
+            self.local.set(email, value, ttl=self._ttl(value))
+
+    def _set_shared(self, entries: dict[str, dict | None]):
+        pipeline = self._redis.pipeline(transaction=False)
+        for email, value in entries.items():
+            payload = {"missing": True} if value is None else value
+            pipeline.set(self.key_prefix + email, json.dumps(payload), ex=max(1, int(self._ttl(value))))
+        try:
+            pipeline.execute()
+        except redis.RedisError as e:
+            self.redis_errors += 1
+            logger.warning(f"User cache Redis write failed for {len(entries)} users: {str(e)}")
+
+
+# Process-wide cache instance
+user_cache = UserCache()
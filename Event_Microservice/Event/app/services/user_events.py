@@ -0,0 +1,99 @@
+import json
+import logging
+import threading
+
+import redis
+
+from app.core.config import settings
+from app.services.user_cache import user_cache
+
+# Set up logger
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+class UserEventSubscriber:
+    """
+    Listens for user-change events published by the authentication service and
+    evicts the affected entries from the user cache.
+
+    Runs in a daemon thread and reconnects with exponential backoff if Redis
+    goes away. Events published while disconnected are lost, so the local cache
+    is cleared on every reconnect.
+    """
+
+    def __init__(self):
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self):
+        """
+        Starts the subscriber thread if it is not already running in this process.
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="user-events", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Signals the subscriber thread to exit.
+        """
+        self._stop.set()
+
+    def handle(self, data: bytes | str):
+        """
+        Applies a single user-change event to the cache.
+
+        Args:
+            data (bytes | str): The JSON payload published by the authentication service.
+        """
+        try:
+            event = json.loads(data)
+            email = event["email"]
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring malformed user event: {str(e)}")
+            return
+
+        user_cache.invalidate(email)
+        logger.info(f"Evicted cached user {email} after {event.get('type')} event")
+
+    def _run(self):
+        backoff = 1
+        reconnecting = False
+
+        while not self._stop.is_set():
+            pubsub = None
+            try:
+                client = redis.Redis(host=settings.REDIS_HOST, port=settings.REDIS_PORT)
+                pubsub = client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(settings.USER_EVENTS_CHANNEL)
+
+                if reconnecting:
+                    # Anything published while we were away has been missed
+                    user_cache.local.clear()
+                    logger.info("Resubscribed to user events; cleared local user cache")
+                backoff = 1
+
+                while not self._stop.is_set():
+                    message = pubsub.get_message(timeout=1.0)
+                    if message and message["type"] == "message":
+                        self.handle(message["data"])
+
+            except redis.RedisError as e:
+                logger.warning(f"User event subscription lost: {str(e)}; retrying in {backoff}s")
+                reconnecting = True
+                self._stop.wait(backoff)
+                backoff = min(backoff * 2, 30)
+            finally:
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except redis.RedisError:
+                        pass
+
+
+# Process-wide subscriber instance
+user_event_subscriber = UserEventSubscriber()
@@ -1,9 +1,10 @@
 from app.core.celery_config import celery_app
 from app.models import Event, Reminder
-from app.utils import send_email
+from app.utils import build_email, send_email, send_email_batch
 from datetime import datetime, timezone, timedelta
 from app.core.db import SessionLocal
-from app.crud import delete_reminder_entry
+from app.crud import delete_reminder_entries
+from sqlalchemy.orm import joinedload
 
 import logging
 from uuid import UUID
@@ -214,12 +215,14 @@ def send_reminder():
             time_window_end = current_time + timedelta(minutes=5)
 
             # Fetch reminders where reminder_time is within the next 5 minutes
-            reminders = db.query(Reminder).filter(
+            reminders = db.query(Reminder).options(joinedload(Reminder.event)).filter(
                 Reminder.reminder_time >= time_window_start,
                 Reminder.reminder_time <= time_window_end
             ).all()
 
             if reminders:
+                # Build every reminder first, then send them over a single SMTP session
+                messages = {}
                 for reminder in reminders:
                     email = reminder.user_email.strip()
                     if email:
@@ -253,17 +256,19 @@ def send_reminder():
                         </html>
                         """
 
-                        # Send email with both HTML and plaintext content
-                        send_email(
+                        messages[reminder.id] = build_email(
                             subject=f"Reminder: Your Event '{reminder.event.title}' is Happening Soon!",
                             recipient=email,
                             body=body
                         )
-
-                        # After sending the email, delete the reminder entry
-                        delete_reminder_entry(db, reminder.id)
                     else:
                         logger.warning(f"Skipping reminder for event {reminder.event_id} due to invalid email: {email}")
+
+                failed = {id(msg) for msg in send_email_batch(list(messages.values()))}
+
+                # Delete the reminders that were sent; failed ones are retried on the next run
+                sent_ids = [reminder_id for reminder_id, msg in messages.items() if id(msg) not in failed]
+                delete_reminder_entries(db, sent_ids)
             else:
                 logger.info("No upcoming reminders to send.")
     except Exception as e:
@@ -341,18 +346,19 @@ def send_join_request(user_email: str, organiser_email: str, event_id: UUID):
                             </html>
                             """
 
-            # Send email to user that acces request sent succes fully
-            send_email(
-                subject=f"Your Request to Join the Event '{event.title}' Has Been Successfully Sent",
-                recipient=user_email,
-                body=user_body
-            )
-
-            # send email to orgniser to ad approve the request
-            send_email(
-                subject = f"New Access Request for Your Event '{event.title}' from {user_email}",
-                recipient=organiser_email,
-                body=organiser_body
-            ) 
+            # Send both emails over one SMTP session: the user's confirmation
+            # that the access request was sent, and the organiser's request to approve it
+            send_email_batch([
+                build_email(
+                    subject=f"Your Request to Join the Event '{event.title}' Has Been Successfully Sent",
+                    recipient=user_email,
+                    body=user_body
+                ),
+                build_email(
+                    subject = f"New Access Request for Your Event '{event.title}' from {user_email}",
+                    recipient=organiser_email,
+                    body=organiser_body
+                ),
+            ])
     except Exception as e:
         logger.error(f"Error in send_reminder task: {str(e)}")
@@ -1,5 +1,7 @@
 import grpc
-from app.api import auth_pb2, auth_pb2_grpc
+from app.services import auth_client
+from app.services.user_cache import user_cache, MISSING
+from app.services.smtp_pool import smtp_pool
 from fastapi import HTTPException
 import smtplib
 from email.mime.text import MIMEText
@@ -15,33 +17,40 @@ def validate_user(email: str):
     """
     Validates the user email by calling an external authentication service via gRPC.
 
+    Results (including "not found") are served from the user cache when present.
+
     Args:
         email (str): The email address of the user to validate.
 
     Raises:
         HTTPException: If the user is not found or if there is a gRPC communication issue.
     """
+    cached = user_cache.get(email)
+    if cached is not MISSING:
+        if cached is None:
+            raise HTTPException(status_code=404, detail="User not found")
+        return dict(cached)
+
     try:
-        # Set up the gRPC channel and client
-        channel = grpc.insecure_channel(f"{settings.AUTH_SERVICE_HOST}:{settings.AUTH_SERVICE_PORT}")
-        stub = auth_pb2_grpc.AuthServiceStub(channel)
-        request = auth_pb2.ValidateUserRequest(email=email)
-        
-        # Send request to validate user
-        response = stub.ValidateUser(request)
+        # Send request to validate user over the shared, long-lived channel
+        response = auth_client.validate_user(email)
         
         # Check if the response indicates a valid user
         if not response.is_valid:
             logger.warning(f"User {email} not found.")
+            user_cache.set_missing(email)
             raise HTTPException(status_code=404, detail="User not found")
         
         logger.info(f"User {email} validated successfully")
+        user_cache.set_user(email, response.username)
 
                 # Returning additional user details
         return {
             "username": response.username
         }
     
+    except HTTPException:
+        raise
     except grpc.RpcError as e:
         logger.error(f"gRPC error while validating user {email}: {e.details()}")
         raise HTTPException(status_code=503, detail=f"gRPC error: {e.details()}")
@@ -49,17 +58,146 @@ def validate_user(email: str):
         logger.error(f"Unexpected error during user validation: {str(e)}")
         raise HTTPException(status_code=500, detail="Unexpected error during user validation")
 
-def send_email(subject: str, recipient: str, body: str):
+def _split_cached(cached: dict) -> tuple[dict[str, dict], list[str]]:
+    """
+    Answers what it can from a batch of user cache lookups.
+
+    Args:
+        cached (dict): The result of `user_cache.get_many`.
+
+    Returns:
+        tuple[dict[str, dict], list[str]]: Cached valid users keyed by email, and the
+        distinct emails that still have to be sent to the authentication service.
+    """
+    users = {}
+    uncached = []
+    for email, value in cached.items():
+        if value is MISSING:
+            uncached.append(email)
+        elif value is not None:
+            users[email] = dict(value)
+    return users, uncached
+
+def _read_results(results, users: dict[str, dict]) -> dict[str, dict | None]:
+    """
+    Adds the valid users of a batch of UserValidation results to `users`.
+
+    Returns:
+        dict[str, dict | None]: User cache entries for every result, `None` for users not found.
+    """
+    entries = {}
+    for result in results:
+        entries[result.email] = {"username": result.username} if result.is_valid else None
+        if result.is_valid:
+            users[result.email] = {"username": result.username}
+    return entries
+
+def validate_users(emails: list[str]) -> dict[str, dict]:
+    """
+    Validates a batch of user emails with a single call to the authentication service.
+
+    Emails already in the user cache are answered locally; only the rest are sent.
+
+    Args:
+        emails (list[str]): The email addresses of the users to validate.
+
+    Returns:
+        dict[str, dict]: Details (e.g. username) keyed by email, for valid users only.
+
+    Raises:
+        HTTPException: If there is a gRPC communication issue.
+    """
+    users, uncached = _split_cached(user_cache.get_many(emails))
+    if not uncached:
+        return users
+
+    try:
+        user_cache.set_many(_read_results(auth_client.validate_users(uncached), users))
+        return users
+
+    except grpc.RpcError as e:
+        logger.error(f"gRPC error while validating {len(emails)} users: {e.details()}")
+        raise HTTPException(status_code=503, detail=f"gRPC error: {e.details()}")
+    except Exception as e:
+        logger.error(f"Unexpected error during batch user validation: {str(e)}")
+        raise HTTPException(status_code=500, detail="Unexpected error during user validation")
+
+async def validate_user_async(email: str):
+    """
+    Async variant of `validate_user` that awaits the gRPC call instead of blocking a thread.
+
+    Args:
+        email (str): The email address of the user to validate.
+
+    Raises:
+        HTTPException: If the user is not found or if there is a gRPC communication issue.
+    """
+    cached = await user_cache.get_async(email)
+    if cached is not MISSING:
+        if cached is None:
+            raise HTTPException(status_code=404, detail="User not found")
+        return dict(cached)
+
+    try:
+        response = await auth_client.validate_user_async(email)
+
+        if not response.is_valid:
+            logger.warning(f"User {email} not found.")
+            await user_cache.set_many_async({email: None})
+            raise HTTPException(status_code=404, detail="User not found")
+
+        logger.info(f"User {email} validated successfully")
+        await user_cache.set_many_async({email: {"username": response.username}})
+        return {"username": response.username}
+
+    except HTTPException:
+        raise
+    except grpc.RpcError as e:
+        logger.error(f"gRPC error while validating user {email}: {e.details()}")
+        raise HTTPException(status_code=503, detail=f"gRPC error: {e.details()}")
+    except Exception as e:
+        logger.error(f"Unexpected error during user validation: {str(e)}")
+        raise HTTPException(status_code=500, detail="Unexpected error during user validation")
+
+async def validate_users_async(emails: list[str]) -> dict[str, dict]:
+    """
+    Async variant of `validate_users` that awaits the gRPC call instead of blocking a thread.
+
+    Args:
+        emails (list[str]): The email addresses of the users to validate.
+
+    Returns:
+        dict[str, dict]: Details (e.g. username) keyed by email, for valid users only.
+
+    Raises:
+        HTTPException: If there is a gRPC communication issue.
+    """
+    users, uncached = _split_cached(await user_cache.get_many_async(emails))
+    if not uncached:
+        return users
+
+    try:
+        await user_cache.set_many_async(_read_results(await auth_client.validate_users_async(uncached), users))
+        return users
+
+    except grpc.RpcError as e:
+        logger.error(f"gRPC error while validating {len(emails)} users: {e.details()}")
+        raise HTTPException(status_code=503, detail=f"gRPC error: {e.details()}")
+    except Exception as e:
+        logger.error(f"Unexpected error during batch user validation: {str(e)}")
+        raise HTTPException(status_code=500, detail="Unexpected error during user validation")
+
+def build_email(subject: str, recipient: str, body: str) -> MIMEMultipart:
     """
-    Sends an email using SMTP.
+    Builds an HTML email from the configured sender.
 
     Args:
         subject (str): The subject of the email.
         recipient (str): The recipient's email address.
-        body (str): The body content of the email.
+        body (str): The HTML body of the email.
 
-    Raises:
-        Exception: If the email fails to send.
+    Returns:
+        MIMEMultipart: The message, ready to pass to `send_email_batch`.
     """
     msg = MIMEMultipart()
     msg['From'] = f"{settings.EMAIL_FROM_NAME} <{settings.EMAIL_FROM}>"
@@ -67,18 +205,46 @@ def send_email(subject: str, recipient: str, body: str):
     msg['Subject'] = subject
 
     msg.attach(MIMEText(body, "html"))
+    return msg
+
+def send_email(subject: str, recipient: str, body: str):
+    """
+    Sends an email over a pooled SMTP connection.
+
+    Args:
+        subject (str): The subject of the email.
+        recipient (str): The recipient's email address.
+        body (str): The body content of the email.
+
+    Raises:
+        Exception: If the email fails to send.
+    """
+    msg = build_email(subject, recipient, body)
 
     try:
-        # Set up the SMTP server and send email
-        with smtplib.SMTP(settings.SMTP_SERVER, settings.SMTP_PORT) as server:
-            server.starttls()
-            server.login(settings.SMTP_USER, settings.SMTP_PASSWORD)
-            server.send_message(msg)
-            logger.info(f"Email sent to {recipient} with subject '{subject}'")
-    
+        smtp_pool.send(msg)
+        logger.info(f"Email sent to {recipient} with subject '{subject}'")
     except smtplib.SMTPException as e:
         logger.error(f"Failed to send email to {recipient}: {str(e)}")
         raise Exception(f"Failed to send email: {str(e)}")
     except Exception as e:
         logger.error(f"Unexpected error while sending email: {str(e)}")
         raise Exception(f"Unexpected error while sending email: {str(e)}")
+
+def send_email_batch(messages: list[MIMEMultipart]) -> list[MIMEMultipart]:
+    """
+    Sends several emails over a single SMTP session.
+
+    Failures are logged per message rather than aborting the batch.
+
+    Args:
+        messages (list[MIMEMultipart]): Messages built with `build_email`.
+
+    Returns:
+        list[MIMEMultipart]: The messages that could not be sent.
+    """
+    failures = smtp_pool.send_many(messages)
+    for msg, e in failures:
+        logger.error(f"Failed to send email to {msg['To']}: {str(e)}")
+    logger.info(f"Sent {len(messages) - len(failures)} of {len(messages)} emails in one SMTP session")
+    return [msg for msg, _ in failures]
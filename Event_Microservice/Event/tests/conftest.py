@@ -0,0 +1,152 @@
+import asyncio
+import os
+import uuid
+from datetime import datetime
+
+import psycopg2
+import pytest
+from dotenv import load_dotenv
+from psycopg2 import sql
+
+# Same environment file as app.core.config
+load_dotenv(".env.development" if os.getenv("ENV") == "development" else ".env.production")
+
+# Every session runs against its own database, created on the PostgreSQL server in
+# DB_HOST/DB_PORT and dropped afterwards, so the tests never touch DB_NAME itself.
+# This has to happen before app.core.config reads DB_NAME.
+SERVER = {
+    "host": os.getenv("DB_HOST"),
+    "port": os.getenv("DB_PORT"),
+    "user": os.getenv("DB_USER"),
+    "password": os.getenv("DB_PASSWORD"),
+}
+TEST_DB_NAME = f"event_test_{uuid.uuid4().hex[:12]}"
+os.environ["DB_NAME"] = TEST_DB_NAME
+
+ORGANIZER = "organizer@example.com"
+MEMBER = "member@example.com"
+
+
+def _admin_connection():
+    connection = psycopg2.connect(dbname="postgres", connect_timeout=5, **SERVER)
+    connection.autocommit = True
+    return connection
+
+
+@pytest.fixture(scope="session")
+def database():
+    """
+    Creates the session's database and its schema (tables, indexes and the tag count trigger).
+    """
+    if not SERVER["host"]:
+        pytest.skip("DB_HOST is not set; these tests need a PostgreSQL server")
+    try:
+        admin = _admin_connection()
+    except psycopg2.OperationalError as e:
+        pytest.skip(f"PostgreSQL is not available: {e}")
+
+    with admin.cursor() as cursor:
+        cursor.execute(sql.SQL("CREATE DATABASE {}").format(sql.Identifier(TEST_DB_NAME)))
+
+    from app.bootstrap import bootstrap_schema
+    from app.core.db import engine, async_engine
+
+    bootstrap_schema()
+    yield engine
+
+    engine.dispose()
+    asyncio.run(async_engine.dispose())
+    with admin.cursor() as cursor:
+        cursor.execute(sql.SQL("DROP DATABASE {} WITH (FORCE)").format(sql.Identifier(TEST_DB_NAME)))
+    admin.close()
+
+
+@pytest.fixture
+def db(database):
+    """
+    A session on an empty database.
+    """
+    from sqlalchemy import text
+    from app.core.db import SessionLocal
+
+    with database.begin() as conn:
+        conn.execute(text("TRUNCATE reminders, event_members, events, event_tag_counts CASCADE"))
+    with SessionLocal() as session:
+        yield session
+
+
+class Api:
+    """
+    Calls the app in-process. All requests share one event loop, like a server
+    process, so the async engine's pooled connections stay usable between them.
+    """
+
+    def __init__(self, app):
+        import httpx
+
+        self.loop = asyncio.new_event_loop()
+        self.client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+    def get(self, url: str, **params):
+        return self.loop.run_until_complete(self.client.get(url, params=params))
+
+    def close(self):
+        self.loop.run_until_complete(self.client.aclose())
+        self.loop.close()
+
+
+@pytest.fixture(scope="session")
+def api(database):
+    """
+    Client for the app. The organizer and member are cached as valid users, so listings
+    resolve usernames without calling the auth service.
+    """
+    from app.main import app
+    from app.services.user_cache import user_cache
+
+    for email in (ORGANIZER, MEMBER):
+        user_cache.set_user(email, email.split("@")[0])
+
+    client = Api(app)
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def add_event(db):
+    """
+    Inserts an event organized by ORGANIZER, who is also its first member.
+    """
+    from app.models import Event, EventMember
+
+    def add(date: datetime = datetime(2030, 1, 1, 10), title: str = "Event", tags: list[str] | None = None,
+            description: str | None = None, members: tuple[str, ...] = (ORGANIZER,)) -> Event:
+        event = Event(title=title, date=date, description=description, tags=tags, is_online=True, organizer_email=ORGANIZER)
+        db.add(event)
+        db.flush()
+        db.add_all(EventMember(event_id=event.id, user_email=email) for email in members)
+        db.commit()
+        return event
+
+    return add
+
+
+@pytest.fixture
+def pages(api):
+    """
+    Follows `next_cursor` to the last page and returns the event ids in the order served.
+    """
+
+    def fetch(url: str, **params) -> list[str]:
+        ids = []
+        cursor = None
+        while True:
+            response = api.get(url, **params, **({"cursor": cursor} if cursor else {}))
+            assert response.status_code == 200, response.text
+            page = response.json()
+            ids += [item["id"] for item in page["items"]]
+            cursor = page["next_cursor"]
+            if cursor is None:
+                return ids
+
+    return fetch
@@ -0,0 +1,30 @@
+from datetime import datetime, timedelta
+
+START = datetime(2030, 1, 1, 10)
+
+
+def _in_page_order(events) -> list[str]:
+    return [str(event.id) for event in sorted(events, key=lambda event: (event.date, event.id))]
+
+
+def test_date_range_includes_from_and_excludes_to(api, add_event):
+    events = [add_event(START + timedelta(hours=hours)) for hours in range(4)]
+
+    # 12:00+02:00 is 10:00 UTC, the first event's time
+    page = api.get("/event/all", **{"from": "2030-01-01T12:00:00+02:00", "to": "2030-01-01T12:00:00Z"}).json()
+
+    assert [item["id"] for item in page["items"]] == _in_page_order(events[:2])
+
+
+def test_date_range_pages_within_the_range(add_event, pages):
+    events = [add_event(START + timedelta(days=day)) for day in range(3) for _ in range(3)]
+
+    served = pages("/event/all", limit=2, **{"from": "2030-01-02T00:00:00Z", "to": "2030-01-03T00:00:00Z"})
+
+    assert served == _in_page_order(events[3:6])
+
+
+def test_from_after_to_is_rejected(api, db):
+    response = api.get("/event/all", **{"from": "2030-01-02T00:00:00Z", "to": "2030-01-01T00:00:00Z"})
+
+    assert response.status_code == 400
@@ -0,0 +1,64 @@
+import uuid
+
+import pytest
+
+from app.tasks import send_join_request
+from conftest import MEMBER, ORGANIZER
+
+OUTSIDER = "outsider@example.com"
+
+
+@pytest.fixture
+def join_requests(monkeypatch):
+    # Record the join requests instead of handing them to the broker
+    sent = []
+    monkeypatch.setattr(send_join_request, "apply_async", lambda args: sent.append(args))
+    return sent
+
+
+def test_member_reads_the_event(api, add_event, join_requests):
+    event = add_event(title="Climbing meetup", tags=["climbing"], members=(ORGANIZER, MEMBER))
+
+    response = api.get(f"/event/{event.id}", user_email=MEMBER)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["id"], body["title"], body["tags"], body["username"]) == (str(event.id), "Climbing meetup", ["climbing"], "organizer")
+    assert join_requests == []
+
+
+def test_non_member_gets_an_empty_event_and_asks_to_join(api, add_event, join_requests):
+    event = add_event(title="Climbing meetup", members=(ORGANIZER, MEMBER))
+
+    response = api.get(f"/event/{event.id}", user_email=OUTSIDER)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["id"] != str(event.id)
+    assert (body["title"], body["description"], body["username"]) == ("", "", "")
+    assert join_requests == [[OUTSIDER, ORGANIZER, event.id]]
+
+
+def test_member_reads_the_members(api, add_event):
+    event = add_event(members=(ORGANIZER, MEMBER))
+
+    response = api.get(f"/event-members/{event.id}/members", user_email=MEMBER)
+
+    assert response.status_code == 200
+    assert sorted(member["user_email"] for member in response.json()) == sorted([ORGANIZER, MEMBER])
+
+
+def test_non_member_cannot_read_the_members(api, add_event):
+    event = add_event(members=(ORGANIZER, MEMBER))
+
+    response = api.get(f"/event-members/{event.id}/members", user_email=OUTSIDER)
+
+    assert response.status_code == 403
+    assert response.json()["detail"] == "You are not a member of this event"
+
+
+@pytest.mark.parametrize("path", ["/event/{id}", "/event-members/{id}/members"])
+def test_missing_event_is_not_found(api, db, path):
+    response = api.get(path.format(id=uuid.uuid4()), user_email=MEMBER)
+
+    assert response.status_code == 404
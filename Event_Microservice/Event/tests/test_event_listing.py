@@ -0,0 +1,54 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.crud import encode_cursor
+from conftest import MEMBER, ORGANIZER
+
+START = datetime(2030, 1, 1, 10)
+
+
+def _in_page_order(events) -> list[str]:
+    return [str(event.id) for event in sorted(events, key=lambda event: (event.date, event.id))]
+
+
+@pytest.mark.parametrize("url", ["/event/all", "/event/"])
+def test_pages_serve_equal_dates_once_each(api, add_event, pages, url):
+    # Most events share a date, so only the id tie-breaker keeps page boundaries stable
+    events = [add_event(START) for _ in range(7)]
+    events += [add_event(START - timedelta(hours=1)), add_event(START + timedelta(hours=1)), add_event(START + timedelta(hours=1))]
+
+    served = pages(url, user_email=ORGANIZER, limit=3)
+
+    assert served == _in_page_order(events)
+
+
+def test_member_listing_only_serves_the_users_events(add_event, pages):
+    joined = [add_event(START, members=(ORGANIZER, MEMBER)) for _ in range(3)]
+    add_event(START)
+
+    assert pages("/event/", user_email=MEMBER, limit=2) == _in_page_order(joined)
+
+
+def test_last_page_has_no_cursor(api, add_event):
+    add_event()
+    add_event()
+
+    page = api.get("/event/all", limit=2).json()
+
+    assert len(page["items"]) == 2
+    assert page["next_cursor"] is None
+
+
+@pytest.mark.parametrize("cursor", [
+    "not-a-cursor",
+    encode_cursor(["2030-01-01T10:00:00"]),
+    encode_cursor(["yesterday", "00000000-0000-0000-0000-000000000000"]),
+    encode_cursor(["2030-01-01T10:00:00", "not-a-uuid"]),
+    encode_cursor([1, 2]),
+])
+def test_invalid_cursor_is_rejected(api, db, cursor):
+    response = api.get("/event/all", cursor=cursor)
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
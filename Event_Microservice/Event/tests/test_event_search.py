@@ -0,0 +1,35 @@
+import pytest
+
+from app.crud import encode_cursor
+from conftest import MEMBER, ORGANIZER
+
+
+def test_pages_serve_equal_ranks_once_each(add_event, pages):
+    # Identical text ranks identically, so only the id tie-breaker keeps page boundaries stable
+    matches = [add_event(title="Climbing meetup") for _ in range(7)]
+    add_event(title="Board games")
+
+    served = pages("/event/search", user_email=ORGANIZER, q="climbing", limit=3)
+
+    assert served == sorted(str(event.id) for event in matches)
+
+
+def test_search_only_serves_the_users_events(add_event, pages):
+    joined = add_event(title="Climbing meetup", members=(ORGANIZER, MEMBER))
+    add_event(title="Climbing meetup")
+
+    assert pages("/event/search", user_email=MEMBER, q="climbing") == [str(joined.id)]
+
+
+@pytest.mark.parametrize("cursor", [
+    "not-a-cursor",
+    encode_cursor([0.1]),
+    encode_cursor(["high", "00000000-0000-0000-0000-000000000000"]),
+    encode_cursor([0.1, "not-a-uuid"]),
+    encode_cursor([None, None]),
+])
+def test_invalid_cursor_is_rejected(api, db, cursor):
+    response = api.get("/event/search", user_email=ORGANIZER, q="climbing", cursor=cursor)
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
@@ -0,0 +1,94 @@
+import smtplib
+import socket
+import threading
+
+import pytest
+
+from app.core.config import settings
+from app.services.smtp_pool import SMTPPool, _is_transient
+from app.utils import build_email
+
+
+class Relay:
+    """
+    A relay that greets every connection with `greeting` and hangs up, counting connections.
+    """
+
+    def __init__(self, greeting: bytes):
+        self.greeting = greeting
+        self.connections = 0
+        self.sock = socket.create_server(("127.0.0.1", 0))
+        self.port = self.sock.getsockname()[1]
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def _serve(self):
+        while True:
+            try:
+                client, _ = self.sock.accept()
+            except OSError:
+                return
+            self.connections += 1
+            with client:
+                client.sendall(self.greeting)
+
+
+@pytest.fixture
+def relay(monkeypatch):
+    """
+    Starts relays and points the SMTP settings at the latest one.
+    """
+    servers = []
+
+    def start(greeting: bytes) -> Relay:
+        server = Relay(greeting)
+        monkeypatch.setattr(settings, "SMTP_SERVER", "127.0.0.1")
+        monkeypatch.setattr(settings, "SMTP_PORT", server.port)
+        monkeypatch.setattr(settings, "SMTP_TIMEOUT", 5)
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.sock.close()
+
+
+def _batch(count: int):
+    return [build_email("Reminder", f"user{i}@example.com", "<p>Soon</p>") for i in range(count)]
+
+
+def test_unavailable_relay_fails_the_batch_after_one_reconnect(relay):
+    server = relay(b"421 Service not available\r\n")
+    messages = _batch(20)
+
+    failures = SMTPPool(max_size=1, idle_timeout=60, max_messages=100).send_many(messages)
+
+    assert [msg for msg, _ in failures] == messages
+    assert server.connections == 2
+
+
+def test_permanent_error_fails_the_batch_without_reconnecting(relay):
+    server = relay(b"554 No SMTP service here\r\n")
+
+    failures = SMTPPool(max_size=1, idle_timeout=60, max_messages=100).send_many(_batch(20))
+
+    assert len(failures) == 20
+    assert server.connections == 1
+
+
+def test_send_raises_when_the_relay_is_unavailable(relay):
+    relay(b"421 Service not available\r\n")
+
+    with pytest.raises(smtplib.SMTPConnectError):
+        SMTPPool(max_size=1, idle_timeout=60, max_messages=100).send(_batch(1)[0])
+
+
+@pytest.mark.parametrize("error, transient", [
+    (smtplib.SMTPServerDisconnected("gone"), True),
+    (ConnectionRefusedError(), True),
+    (smtplib.SMTPResponseException(421, b"Try again later"), True),
+    (smtplib.SMTPResponseException(554, b"Rejected"), False),
+    (smtplib.SMTPAuthenticationError(535, b"Bad credentials"), False),
+    (smtplib.SMTPAuthenticationError(454, b"Temporary authentication failure"), False),
+])
+def test_only_transient_errors_are_retried(error, transient):
+    assert _is_transient(error) is transient
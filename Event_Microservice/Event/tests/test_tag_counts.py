@@ -0,0 +1,69 @@
+from sqlalchemy import select, text
+
+from app.bootstrap import bootstrap_schema
+from app.models import EventTagCount
+
+
+def _counts(db) -> dict[str, int]:
+    db.expire_all()
+    return dict(db.execute(select(EventTagCount.tag, EventTagCount.count)).all())
+
+
+def test_insert_counts_each_tag_once_per_event(db, add_event):
+    add_event(tags=["a", "a", "b"])
+    assert _counts(db) == {"a": 1, "b": 1}
+
+    add_event(tags=["a"])
+    add_event(tags=None)
+    assert _counts(db) == {"a": 2, "b": 1}
+
+
+def test_update_moves_counts_to_the_new_tags(db, add_event):
+    event = add_event(tags=["a", "b"])
+    add_event(tags=["a"])
+
+    event.tags = ["b", "c", "c"]
+    db.commit()
+    assert _counts(db) == {"a": 1, "b": 1, "c": 1}
+
+    event.title = "Renamed"
+    db.commit()
+    assert _counts(db) == {"a": 1, "b": 1, "c": 1}
+
+    event.tags = None
+    db.commit()
+    assert _counts(db) == {"a": 1, "b": 0, "c": 0}
+
+
+def test_delete_drops_counts_to_zero(db, add_event):
+    event = add_event(tags=["a", "a", "b"])
+    add_event(tags=["b"])
+
+    db.delete(event)
+    db.commit()
+
+    assert _counts(db) == {"a": 0, "b": 1}
+
+
+def test_tags_endpoint_skips_unused_tags_and_orders_by_count(api, db, add_event):
+    add_event(tags=["b", "c"])
+    add_event(tags=["c"])
+    unused = add_event(tags=["a"])
+    db.delete(unused)
+    db.commit()
+
+    response = api.get("/event/tags")
+
+    assert response.status_code == 200
+    assert response.json() == [{"tag": "c", "count": 2}, {"tag": "b", "count": 1}]
+
+
+def test_bootstrap_backfills_an_empty_aggregate(database, db, add_event):
+    add_event(tags=["a", "a", "b"])
+    add_event(tags=["a"])
+    with database.begin() as conn:
+        conn.execute(text("TRUNCATE event_tag_counts"))
+
+    bootstrap_schema()
+
+    assert _counts(db) == {"a": 2, "b": 1}
@@ -0,0 +1,60 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from conftest import MEMBER, ORGANIZER
+
+START = datetime(2030, 1, 1, 10)
+
+
+@pytest.fixture
+def tagged(add_event):
+    """
+    Events tagged a, b, a+b and untagged, one hour apart.
+    """
+    return {
+        name: add_event(START + timedelta(hours=hour), tags=tags, members=(ORGANIZER, MEMBER))
+        for hour, (name, tags) in enumerate([("a", ["a"]), ("b", ["b"]), ("ab", ["a", "b"]), ("none", None)])
+    }
+
+
+def _ids(tagged, *names) -> list[str]:
+    return [str(tagged[name].id) for name in names]
+
+
+@pytest.mark.parametrize("url", ["/event/all", "/event/"])
+def test_match_any_serves_events_with_any_of_the_tags(api, tagged, url):
+    page = api.get(url, user_email=MEMBER, tags="a, b", match="any").json()
+
+    assert [item["id"] for item in page["items"]] == _ids(tagged, "a", "b", "ab")
+
+
+@pytest.mark.parametrize("url", ["/event/all", "/event/"])
+def test_match_all_serves_events_with_every_tag(api, tagged, url):
+    page = api.get(url, user_email=MEMBER, tags="a,b", match="all").json()
+
+    assert [item["id"] for item in page["items"]] == _ids(tagged, "ab")
+
+
+def test_match_defaults_to_any(api, tagged):
+    page = api.get("/event/all", tags="b").json()
+
+    assert [item["id"] for item in page["items"]] == _ids(tagged, "b", "ab")
+
+
+def test_tag_filter_pages_within_the_matches(tagged, pages):
+    assert pages("/event/all", tags="a", limit=1) == _ids(tagged, "a", "ab")
+
+
+def test_tag_filter_only_serves_the_users_events(api, add_event, tagged):
+    add_event(START, tags=["a"])
+
+    page = api.get("/event/", user_email=MEMBER, tags="a", match="all").json()
+
+    assert [item["id"] for item in page["items"]] == _ids(tagged, "a", "ab")
+
+
+def test_invalid_match_is_rejected(api, db):
+    response = api.get("/event/all", tags="a", match="some")
+
+    assert response.status_code == 422
@@ -1,76 +1,43 @@
-import React, { useState, useEffect, useContext } from "react";
+import React, { useState, useEffect, useContext, useCallback } from "react";
 import EventCard from "../components/EventCard";
 import { Button } from "@mui/material";
 import { PlusCircle } from "lucide-react";
 import { AuthContext } from "../context/AuthContext";
 import { useNavigate } from "react-router-dom";
 import { eventAxiosInstance } from "../axiosInstance";
-import Swal from "sweetalert2";
 
 const Home = () => {
   const { isAuthenticated, userId } = useContext(AuthContext);
   const navigate = useNavigate();
   const [allEvents, setAllEvents] = useState([]);
-  const [events, setEvents] = useState([]); 
+  const [nextCursor, setNextCursor] = useState(null);
 
-  // Fetch all events for unauthenticated users
-  const fetchAllEvents = () => {
+  // Fetch a page of all events; without a cursor the list starts over. Signed-in users get
+  // their membership of each event on the same page, so it never needs a separate lookup.
+  const fetchAllEvents = useCallback((cursor = null) => {
     eventAxiosInstance
-      .get("/event/all")
-      .then((response) => {
-        const newEvents = response.data.map((event) => ({
-          ...event,
-          isMember: false,
-        }));
-        setAllEvents(newEvents);
-        setEvents(newEvents);
-      })
-      .catch((error) => {
-        console.error("Error fetching all events:", error);
-      });
-  };
-
-  // Fetch user-specific events
-  const fetchUserEvents = () => {
-    eventAxiosInstance
-      .get("/event/", {
-        params: { user_email: userId },
+      .get("/event/all", {
+        params: { cursor, user_email: isAuthenticated ? userId : undefined },
       })
       .then((response) => {
-        const userEvents = response.data.map((userEvent) => ({
-          ...userEvent,
-          isMember: true,
-        }));
-
-        // Merge user events with all events
-        const mergedEvents = allEvents.map((event) => {
-          const matchedEvent = userEvents.find(
-            (userEvent) => userEvent.id === event.id
-          );
-          return matchedEvent || event;
-        });
-
-        setEvents(mergedEvents);
+        const newEvents = response.data.items;
+        setAllEvents((previous) => cursor ? [...previous, ...newEvents] : newEvents);
+        setNextCursor(response.data.next_cursor);
       })
       .catch((error) => {
-        Swal.fire({
-          icon: "error",
-          title: "Oops...",
-          text: "Something went wrong!",
-        });
+        console.error("Error fetching all events:", error);
       });
-  };
+  }, [isAuthenticated, userId]);
 
   useEffect(() => {
-    if (!isAuthenticated) {
-      fetchAllEvents();
-    } else {
-      if (allEvents.length === 0) {
-        fetchAllEvents();
-      }
-      fetchUserEvents();
-  }
-  });
+    fetchAllEvents();
+  }, [fetchAllEvents]);
+
+  // Mark the events the user is already a member of
+  const events = allEvents.map((event) => ({
+    ...event,
+    isMember: Boolean(event.is_member),
+  }));
 
   return (
     <div className="min-h-screen bg-gradient-to-b from-gray-50 to-gray-100">
@@ -99,6 +66,14 @@ const Home = () => {
           ))}
         </div>
 
+        {nextCursor && (
+          <div className="flex justify-center mt-8">
+            <Button variant="outlined" onClick={() => fetchAllEvents(nextCursor)}>
+              Load more
+            </Button>
+          </div>
+        )}
+
         {events.length === 0 && (
           <div className="text-center py-12">
             <p className="text-gray-500 text-lg">No upcoming events at the moment</p>
@@ -35,7 +35,10 @@ const UserDashboard = () => {
   //     })
   // }, []);
 
-  const fetchEvents = useCallback(() => {
+  const [nextCursor, setNextCursor] = useState(null);
+
+  // Fetch a page of the user's events; without a cursor the list starts over
+  const fetchEvents = useCallback((cursor = null) => {
 
     if(!userId)
     {
@@ -46,10 +49,12 @@ const UserDashboard = () => {
       .get("/event/", {
         params: {
           user_email: userId,
+          cursor,
         },
       })
       .then((response) => {
-        setEvents(response.data);
+        setEvents((previous) => cursor ? [...previous, ...response.data.items] : response.data.items);
+        setNextCursor(response.data.next_cursor);
       })
       .catch(() => {
         Swal.fire({
@@ -83,6 +88,14 @@ const UserDashboard = () => {
           ))}
         </div>
 
+        {nextCursor && (
+          <div className="flex justify-center mt-8">
+            <Button variant="outlined" onClick={() => fetchEvents(nextCursor)}>
+              Load more
+            </Button>
+          </div>
+        )}
+
         {events.length === 0 && (
           <div className="text-center py-12">
             <p className="text-gray-500 text-lg">No upcoming events at the moment</p>
@@ -0,0 +1,40 @@
+import asyncio
+import logging
+
+from app.core.db import client, collection
+from app.services.readiness import readiness
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+async def bootstrap_schema():
+    """
+    Creates the indexes the message queries rely on. Safe to run repeatedly:
+    `create_index` is a no-op when an identical index already exists.
+    """
+    # Every read and write looks a room up by room_id
+    await collection.create_index("room_id", name="ix_room_id")
+    logger.info("MongoDB indexes are up to date.")
+
+async def bootstrap():
+    """
+    Waits for MongoDB, creates missing indexes and closes the client.
+    """
+    try:
+        await readiness.wait_until_ready()
+        await bootstrap_schema()
+    finally:
+        await client.close()
+
+def main():
+    """
+    One-shot index bootstrap: `python -m app.bootstrap`.
+
+    Run it once per deploy (e.g. as a compose init service) instead of on every replica start.
+    """
+    asyncio.run(bootstrap())
+
+
+if __name__ == "__main__":
+    main()
@@ -25,6 +25,19 @@ class Settings(BaseSettings):
     MONGO_COLLECTION: str = os.getenv("MONGO_COLLECTION")
     ENCRYPTION_KEY: str =  os.getenv("ENCRYPTION_KEY")
 
+    # Opt-in request profiling (see app.core.profiling)
+    PROFILING_SECRET: str = os.getenv("PROFILING_SECRET", "")  # Signs X-Profile tokens; empty disables header-triggered profiles
+    PROFILING_SAMPLE_RATE: float = os.getenv("PROFILING_SAMPLE_RATE", 0)  # Fraction of all requests profiled without a token
+    PROFILING_INTERVAL: float = os.getenv("PROFILING_INTERVAL", 0.005)  # Seconds between stack samples
+    PROFILING_DIR: str = os.getenv("PROFILING_DIR", "profiles")
+    PROFILING_MAX_FILES: int = os.getenv("PROFILING_MAX_FILES", 100)  # Oldest profiles are deleted beyond this
+
+    # Startup and readiness probes
+    STARTUP_TIMEOUT: float = os.getenv("STARTUP_TIMEOUT", 60)  # Seconds to wait for dependencies before giving up
+    STARTUP_MAX_BACKOFF: float = os.getenv("STARTUP_MAX_BACKOFF", 5)  # Cap on the delay between dependency checks
+    READINESS_CHECK_TIMEOUT: float = os.getenv("READINESS_CHECK_TIMEOUT", 2)
+    SCHEMA_BOOTSTRAP_ON_STARTUP: bool = os.getenv("SCHEMA_BOOTSTRAP_ON_STARTUP", False)  # Local development only; deployments run `python -m app.bootstrap`
+
     @property
     def MONGODB_URL(self) -> str:
         """
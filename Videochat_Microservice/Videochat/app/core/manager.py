@@ -3,6 +3,7 @@ import logging
 import json
 import asyncio
 
+from app.core.metrics import WEBSOCKET_CONNECTIONS, WEBSOCKET_MESSAGES_RECEIVED, WEBSOCKET_MESSAGES_SENT, WEBSOCKET_ROOMS
 from app.crud import insert_message, get_messages
 from app.models import RoomMessagesResponse
 from datetime import datetime, timezone
@@ -10,6 +11,9 @@ from datetime import datetime, timezone
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Message types reported as-is in metrics; anything else is a chat message
+SIGNALLING_TYPES = {"new-user", "offer", "answer"}
+
 class ConnectionManager:
     """
     Manages WebSocket connections for rooms and users.
@@ -44,9 +48,11 @@ class ConnectionManager:
 
         if room_id not in self.rooms:
             self.rooms[room_id] = {}
+            WEBSOCKET_ROOMS.inc()
         if user_id not in self.rooms[room_id]:
             self.rooms[room_id][user_id] = []
         self.rooms[room_id][user_id].append(websocket)
+        WEBSOCKET_CONNECTIONS.inc()
 
 
     async def disconnect(self, room_id: str, user_id: str, websocket: WebSocket):
@@ -65,10 +71,12 @@ class ConnectionManager:
         if room_id in self.rooms and user_id in self.rooms[room_id]:
             if websocket in self.rooms[room_id][user_id]:
                 self.rooms[room_id][user_id].remove(websocket)
+                WEBSOCKET_CONNECTIONS.dec()
             if not self.rooms[room_id][user_id]:
                 del self.rooms[room_id][user_id]
             if not self.rooms[room_id]:
                 del self.rooms[room_id]
+                WEBSOCKET_ROOMS.dec()
         
         # Broadcast disconnect message to remaining users
         # Save this disconnect event to MongoDB as well
@@ -137,6 +145,8 @@ class ConnectionManager:
         try:
             message_data = json.loads(message)
             logger.info(f"Broadcasting message: {message_data}")
+            message_type = message_data.get("type")
+            WEBSOCKET_MESSAGES_RECEIVED.labels(message_type if message_type in SIGNALLING_TYPES else "chat").inc()
 
             # Handle different message types
             if message_data.get("type") == "new-user":
@@ -154,6 +164,7 @@ class ConnectionManager:
                         for connection in connections:
                             try:
                                 await connection.send_text(json.dumps(new_user_message))
+                                WEBSOCKET_MESSAGES_SENT.inc()
                                 logger.info(f"Sent new-user notification to {other_user_id}")
                             except Exception as e:
                                 logger.error(f"Error sending new-user message to {other_user_id}: {e}")
@@ -172,6 +183,7 @@ class ConnectionManager:
                                     "offer": message_data["offer"]
                                 }
                                 await connection.send_text(json.dumps(offer_message))
+                                WEBSOCKET_MESSAGES_SENT.inc()
                                 logger.info(f"Sent offer to user {target_user_id}")
                             except Exception as e:
                                 logger.error(f"Error sending offer to user {target_user_id}: {e}")
@@ -194,6 +206,7 @@ class ConnectionManager:
                                     "answer": message_data["answer"]
                                 }
                                 await connection.send_text(json.dumps(answer_message))
+                                WEBSOCKET_MESSAGES_SENT.inc()
                                 logger.info(f"Sent answer to user {target_user_id}")
                             except Exception as e:
                                 logger.error(f"Error sending answer to user {target_user_id}: {e}")
@@ -219,6 +232,7 @@ class ConnectionManager:
                                     "timestamp": datetime.now(timezone.utc).isoformat()
                                 }
                                 await connection.send_text(json.dumps(broadcast_message))
+                                WEBSOCKET_MESSAGES_SENT.inc()
                                 logger.info(f"Sent message to user {room_user_id}: {broadcast_message}")
                             except Exception as e:
                                 logger.error(f"Error sending message to user {room_user_id}: {e}")
@@ -286,6 +300,7 @@ class ConnectionManager:
                 for connection in connections:
                     try:
                         await connection.send_text(message)  # Send the disconnect message
+                        WEBSOCKET_MESSAGES_SENT.inc()
                     except Exception as e:
                         logger.error(f"Error sending disconnect message to user {user_id}: {e}")
                         self.disconnect(room_id, user_id, connection)
@@ -1,18 +1,52 @@
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Request
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from contextlib import asynccontextmanager
+from app.bootstrap import bootstrap_schema
+from app.core.config import settings
+from app.core.db import client
 from app.core.manager import ConnectionManager
-from app.services.wait_for_mongo import wait_for_mongo
+from app.core.metrics import PrometheusMiddleware, metrics_response
+from app.core.profiling import PROFILE_HEADER, ProfilingMiddleware, profile, profile_requested, profile_sampled, profiling_enabled
+from app.services.readiness import readiness
+from contextlib import nullcontext
+import asyncio
 import logging
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Wait for MongoDB to be ready before starting the app
-wait_for_mongo()
+async def wait_for_dependencies():
+    """
+    Waits for MongoDB in the background so the server accepts connections, and answers
+    `/healthz`, straight away. `/readyz` reports 503 until MongoDB answers.
+
+    Indexes are created by the one-shot `python -m app.bootstrap` command, or here when
+    `SCHEMA_BOOTSTRAP_ON_STARTUP` is set for local development.
+    """
+    try:
+        await readiness.wait_until_ready()
+    except TimeoutError as e:
+        logger.error(f"Dependencies are still unavailable: {str(e)}")
+        return
 
-app = FastAPI()
+    if settings.SCHEMA_BOOTSTRAP_ON_STARTUP:
+        await bootstrap_schema()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Starts waiting for MongoDB on startup and closes the MongoDB client on shutdown.
+    """
+    dependencies = asyncio.create_task(wait_for_dependencies())
+
+    yield
+
+    dependencies.cancel()
+    await client.close()
+
+app = FastAPI(lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -21,9 +55,43 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(PrometheusMiddleware)
+if profiling_enabled():
+    app.add_middleware(ProfilingMiddleware)
 
 manager = ConnectionManager()
 
+@app.get("/healthz")
+def read_liveness():
+    """
+    Liveness probe: the process is up and serving requests. Does not touch any dependency.
+
+    Returns:
+        dict: `{"status": "ok"}`.
+    """
+    return {"status": "ok"}
+
+@app.get("/readyz")
+async def read_readiness():
+    """
+    Readiness probe: checks MongoDB.
+
+    Returns:
+        JSONResponse: 200 if MongoDB answers, otherwise 503, with the result of the check.
+    """
+    ready, checks = await readiness.check()
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={"status": "ready" if ready else "unavailable", "checks": checks},
+    )
+
+@app.get("/metrics", include_in_schema=False)
+def read_metrics():
+    """
+    Exposes Prometheus metrics: HTTP latency, open rooms and connections, and signalling message counters.
+    """
+    return metrics_response()
+
 @app.websocket("/ws/{room_id}/{user_id}")
 async def signaling_endpoint(websocket: WebSocket, room_id: str, user_id: str):
     """
@@ -32,6 +100,10 @@ async def signaling_endpoint(websocket: WebSocket, room_id: str, user_id: str):
     This endpoint establishes a WebSocket connection, listens for messages, and broadcasts
     them to all other connected users in the same room.
 
+    Handling of each message is profiled if the connection was opened with a signed
+    profiling token (browsers cannot set headers on a WebSocket, so it may also be passed
+    as the `profile` query parameter), or for a `PROFILING_SAMPLE_RATE` fraction of messages.
+
     Args:
         websocket (WebSocket): The WebSocket connection object used to communicate with the client.
         room_id (str): The ID of the room the user is connecting to.
@@ -39,12 +111,14 @@ async def signaling_endpoint(websocket: WebSocket, room_id: str, user_id: str):
     """
     logger.info(f"New WebSocket connection - Room: {room_id}, User: {user_id}")
     await manager.connect(room_id, user_id, websocket)
+    profiled = profile_requested(websocket.headers.get(PROFILE_HEADER) or websocket.query_params.get("profile"))
 
     try:
         while True:
             # Receive messages from the WebSocket and broadcast them
             data = await websocket.receive_text()
-            await manager.broadcast(room_id, user_id, data, websocket)
+            with profile("WS /ws/{room_id}/{user_id}") if profiled or profile_sampled() else nullcontext():
+                await manager.broadcast(room_id, user_id, data, websocket)
     except WebSocketDisconnect:
         # Handle disconnection of the user
         logger.info(f"User {user_id} disconnected from Room {room_id}")
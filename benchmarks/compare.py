@@ -0,0 +1,87 @@
+import argparse
+import json
+import sys
+
+# Latency percentiles compared between runs
+PERCENTILES = ("p50", "p95", "p99")
+
+
+def _delta(base: float | None, head: float | None) -> float | None:
+    # Relative change in percent; None when either side has no samples
+    if not base or head is None:
+        return None
+    return (head - base) / base * 100
+
+
+def _format(value: float | None, delta: float | None) -> str:
+    if value is None:
+        return "-"
+    return f"{value:.1f}" if delta is None else f"{value:.1f} ({delta:+.0f}%)"
+
+
+def compare(base: dict, head: dict, threshold: float) -> tuple[list[list[str]], list[str]]:
+    """
+    Compares two reports from `benchmarks.run`.
+
+    Args:
+        base (dict): The baseline report.
+        head (dict): The report to check against it.
+        threshold (float): Percentage by which p95 latency may grow before it counts as a regression.
+
+    Returns:
+        tuple[list[list[str]], list[str]]: Table rows, and the operations that regressed.
+    """
+    rows, regressions = [], []
+    operations = sorted(set(base["results"]) | set(head["results"]))
+    for operation in operations:
+        old = base["results"].get(operation)
+        new = head["results"].get(operation)
+        if old is None or new is None:
+            rows.append([operation, "only in " + ("head" if old is None else "base")] + [""] * len(PERCENTILES) + [""])
+            continue
+
+        cells = [operation, f"{new['count']}/{new['errors']}"]
+        for name in PERCENTILES:
+            delta = _delta(old["latency_ms"][name], new["latency_ms"][name])
+            cells.append(_format(new["latency_ms"][name], delta))
+            if name == "p95" and delta is not None and delta > threshold:
+                regressions.append(operation)
+        cells.append(_format(new["throughput_rps"], _delta(old["throughput_rps"], new["throughput_rps"])))
+        rows.append(cells)
+    return rows, regressions
+
+
+def main(argv: list[str] | None = None):
+    """
+    Prints per-operation latency and throughput changes between two benchmark reports
+    and exits with status 1 if any p95 latency regressed by more than `--threshold`.
+
+    Args:
+        argv (list[str] | None): Command-line arguments; defaults to `sys.argv[1:]`.
+    """
+    parser = argparse.ArgumentParser(description="Compare two benchmark reports.")
+    parser.add_argument("base", help="baseline report (JSON)")
+    parser.add_argument("head", help="report to compare against the baseline (JSON)")
+    parser.add_argument("--threshold", type=float, default=10, help="allowed p95 regression in percent (default: 10)")
+    args = parser.parse_args(argv)
+
+    with open(args.base) as f:
+        base = json.load(f)
+    with open(args.head) as f:
+        head = json.load(f)
+
+    rows, regressions = compare(base, head, args.threshold)
+    header = ["operation", "ok/errors", *(f"{name} ms" for name in PERCENTILES), "req/s"]
+    widths = [max(len(str(row[i])) for row in [header, *rows]) for i in range(len(header))]
+    print(f"base {base['meta'].get('commit') or '?'} -> head {head['meta'].get('commit') or '?'}")
+    for row in [header, *rows]:
+        print("  ".join(str(cell).ljust(width) for cell, width in zip(row, widths)).rstrip())
+
+    if regressions:
+        print(f"\np95 regressed by more than {args.threshold:g}%: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    # Standalone entrypoint: python -m benchmarks.compare BASE HEAD [--threshold PERCENT]
+    main()
@@ -0,0 +1,43 @@
+import argparse
+import hashlib
+import hmac
+import os
+import time
+
+
+def sign_token(secret: str, ttl: float) -> str:
+    """
+    Creates a profiling token accepted by every service configured with the same `PROFILING_SECRET`.
+
+    Args:
+        secret (str): The services' `PROFILING_SECRET`.
+        ttl (float): Seconds until the token expires.
+
+    Returns:
+        str: The token, `<expiry>.<hmac-sha256 of expiry>`.
+    """
+    expires = str(int(time.time() + ttl))
+    signature = hmac.new(secret.encode(), expires.encode(), hashlib.sha256).hexdigest()
+    return f"{expires}.{signature}"
+
+
+def main(argv: list[str] | None = None):
+    """
+    Prints a signed token to send as the `X-Profile` header (or Videochat's `?profile=` parameter).
+
+    Args:
+        argv (list[str] | None): Command-line arguments; defaults to `sys.argv[1:]`.
+    """
+    parser = argparse.ArgumentParser(description="Create a signed X-Profile token.")
+    parser.add_argument("--secret", default=os.getenv("PROFILING_SECRET"), help="PROFILING_SECRET of the services (default: $PROFILING_SECRET)")
+    parser.add_argument("--ttl", type=float, default=600, help="seconds the token stays valid (default: 600)")
+    args = parser.parse_args(argv)
+
+    if not args.secret:
+        parser.error("PROFILING_SECRET is not set")
+    print(sign_token(args.secret, args.ttl))
+
+
+if __name__ == "__main__":
+    # Standalone entrypoint: python -m benchmarks.profile_token [--ttl SECONDS]
+    main()
@@ -0,0 +1,138 @@
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+
+from benchmarks import scenarios
+from benchmarks.scenarios import BenchmarkContext
+
+# Set up logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+logger = logging.getLogger(__name__)
+
+# Scenarios in the order they run; later ones use the accounts and events created by earlier ones
+SCENARIOS = {
+    "signup": scenarios.signup,
+    "login": scenarios.login,
+    "events": scenarios.events,
+    "members": scenarios.members,
+    "reminders": scenarios.reminders,
+    "websocket": scenarios.websocket_rooms,
+}
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run(ctx: BenchmarkContext, names: list[str]):
+    for name in names:
+        logger.info(f"Running scenario: {name}")
+        await SCENARIOS[name](ctx)
+    if "signup" in names and not ctx.accounts:
+        logger.warning("No account could be signed up and verified; dependent scenarios recorded errors only")
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Load-test the Auth, Event and Videochat services.")
+    parser.add_argument("--auth-url", default="http://localhost:8000")
+    parser.add_argument("--event-url", default="http://localhost:8001")
+    parser.add_argument("--video-url", default="ws://localhost:8002")
+    parser.add_argument(
+        "--auth-secret-key", default=os.getenv("SECRET_KEY"),
+        help="the auth service's SECRET_KEY, used to verify new accounts (default: $SECRET_KEY)",
+    )
+    parser.add_argument(
+        "--scenarios", default=",".join(SCENARIOS),
+        help=f"comma-separated scenarios to run (default: all of {', '.join(SCENARIOS)})",
+    )
+    parser.add_argument("--users", type=int, default=20, help="accounts to sign up (default: 20)")
+    parser.add_argument("--events-per-user", type=int, default=2, help="events each account organizes (default: 2)")
+    parser.add_argument("--members-per-event", type=int, default=3, help="members added to each event (default: 3)")
+    parser.add_argument("--requests", type=int, default=200, help="requests per read scenario (default: 200)")
+    parser.add_argument("--concurrency", type=int, default=10, help="requests in flight (default: 10)")
+    parser.add_argument("--rooms", type=int, default=5, help="WebSocket rooms (default: 5)")
+    parser.add_argument("--room-users", type=int, default=4, help="users per room (default: 4)")
+    parser.add_argument("--messages", type=int, default=10, help="chat messages per user (default: 10)")
+    parser.add_argument("--message-interval", type=float, default=0.05, help="seconds between a user's messages (default: 0.05)")
+    parser.add_argument("--timeout", type=float, default=30, help="request timeout in seconds (default: 30)")
+    parser.add_argument("--output", "-o", help="write the JSON report here instead of stdout")
+    args = parser.parse_args(argv)
+
+    args.scenarios = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = [name for name in args.scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)}")
+    # Keep the dependency order regardless of how the scenarios were listed
+    args.scenarios = [name for name in SCENARIOS if name in args.scenarios]
+    return args
+
+
+def main(argv: list[str] | None = None):
+    """
+    Runs the selected scenarios and writes a JSON report of per-operation latency
+    percentiles and throughput.
+
+    Args:
+        argv (list[str] | None): Command-line arguments; defaults to `sys.argv[1:]`.
+    """
+    args = parse_args(argv)
+    ctx = BenchmarkContext(
+        auth_url=args.auth_url,
+        event_url=args.event_url,
+        video_url=args.video_url,
+        secret_key=args.auth_secret_key,
+        users=args.users,
+        events_per_user=args.events_per_user,
+        members_per_event=args.members_per_event,
+        requests=args.requests,
+        concurrency=args.concurrency,
+        rooms=args.rooms,
+        room_users=args.room_users,
+        messages=args.messages,
+        message_interval=args.message_interval,
+        timeout=args.timeout,
+    )
+    asyncio.run(run(ctx, args.scenarios))
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "commit": git_commit(),
+            "run_id": ctx.run_id,
+            "python": platform.python_version(),
+            "targets": {"auth": args.auth_url, "event": args.event_url, "video": args.video_url},
+            "parameters": {
+                key: value for key, value in vars(args).items()
+                if key not in ("auth_url", "event_url", "video_url", "auth_secret_key", "output")
+            },
+        },
+        "results": ctx.recorder.summary(),
+    }
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+        logger.info(f"Wrote report to {args.output}")
+    else:
+        print(text)
+
+    # A run where everything failed is not a usable baseline
+    if not any(result["count"] for result in report["results"].values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    # Standalone entrypoint: python -m benchmarks.run [options]
+    main()
@@ -0,0 +1,315 @@
+import asyncio
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Iterable
+
+import httpx
+import websockets
+from itsdangerous import URLSafeTimedSerializer
+
+from benchmarks.stats import Recorder
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Meets the auth service's password rules (length, upper, lower, digit, special character)
+PASSWORD = "Bench_pass1"
+
+
+@dataclass
+class BenchUser:
+    username: str
+    email: str
+    phone_number: str
+
+
+@dataclass
+class BenchmarkContext:
+    """
+    Targets, load parameters and the state shared between phases of one run.
+    """
+    auth_url: str
+    event_url: str
+    video_url: str
+    secret_key: str | None
+    users: int
+    events_per_user: int
+    members_per_event: int
+    requests: int
+    concurrency: int
+    rooms: int
+    room_users: int
+    messages: int
+    message_interval: float
+    timeout: float
+    run_id: str = field(default_factory=lambda: str(int(time.time())))
+    recorder: Recorder = field(default_factory=Recorder)
+    accounts: list[BenchUser] = field(default_factory=list)
+    events: list[tuple[str, str]] = field(default_factory=list)  # (event id, organizer email)
+
+    def client(self, base_url: str) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            base_url=base_url,
+            timeout=self.timeout,
+            limits=httpx.Limits(max_connections=self.concurrency, max_keepalive_connections=self.concurrency),
+        )
+
+
+async def run_concurrently(items: Iterable, worker: Callable[..., Awaitable], concurrency: int):
+    """
+    Runs `worker(item)` for every item with at most `concurrency` in flight.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run_one(item):
+        async with semaphore:
+            await worker(item)
+
+    await asyncio.gather(*(run_one(item) for item in items))
+
+
+async def timed_request(
+    ctx: BenchmarkContext, client: httpx.AsyncClient, operation: str, method: str, url: str, **kwargs,
+) -> httpx.Response | None:
+    """
+    Sends a request and records its latency under `operation`.
+
+    Returns:
+        httpx.Response | None: The response, or None if the request failed or returned an error status.
+    """
+    start = time.perf_counter()
+    try:
+        response = await client.request(method, url, **kwargs)
+    except httpx.HTTPError as e:
+        ctx.recorder.record_error(operation, type(e).__name__)
+        return None
+    elapsed = time.perf_counter() - start
+
+    if response.status_code >= 400:
+        ctx.recorder.record_error(operation, f"HTTP {response.status_code}")
+        return None
+    ctx.recorder.record(operation, elapsed)
+    return response
+
+
+def _round_robin(items: list, count: int) -> list:
+    return [items[i % len(items)] for i in range(count)] if items else []
+
+
+async def signup(ctx: BenchmarkContext):
+    """
+    Signs up `users` new accounts and verifies them through the emailed verification link.
+
+    Verification needs the auth service's `SECRET_KEY` to sign the link; without it the
+    accounts stay unverified and every scenario that needs a valid user fails.
+    """
+    prefix = f"bench-{ctx.run_id}"
+    ctx.accounts = [
+        BenchUser(
+            username=f"{prefix}-{i}",
+            email=f"{prefix}-{i}@example.com",
+            phone_number=f"+44{int(ctx.run_id) % 10**6:06d}{i:06d}",
+        )
+        for i in range(ctx.users)
+    ]
+    signed_up = []
+
+    async with ctx.client(ctx.auth_url) as client:
+        async def sign_up(user: BenchUser):
+            payload = {"username": user.username, "email": user.email, "phone_number": user.phone_number, "password": PASSWORD}
+            if await timed_request(ctx, client, "auth.signup", "POST", "/auth/signup", json=payload):
+                signed_up.append(user)
+
+        with ctx.recorder.phase("auth.signup"):
+            await run_concurrently(ctx.accounts, sign_up, ctx.concurrency)
+
+        if not ctx.secret_key:
+            logger.warning("No auth SECRET_KEY given; new accounts cannot be verified")
+            ctx.accounts = signed_up
+            return
+
+        serializer = URLSafeTimedSerializer(ctx.secret_key)
+        verified = []
+
+        async def verify(user: BenchUser):
+            token = serializer.dumps(user.email, salt="email-verification")
+            if await timed_request(ctx, client, "auth.verify_email", "GET", "/auth/verify-email", params={"token": token}):
+                verified.append(user)
+
+        with ctx.recorder.phase("auth.verify_email"):
+            await run_concurrently(signed_up, verify, ctx.concurrency)
+        ctx.accounts = verified
+
+
+async def login(ctx: BenchmarkContext):
+    """
+    Logs in `requests` times, cycling through the verified accounts.
+    """
+    async with ctx.client(ctx.auth_url) as client:
+        async def log_in(user: BenchUser):
+            await timed_request(ctx, client, "auth.login", "POST", "/auth/login", json={"email": user.email, "password": PASSWORD})
+
+        with ctx.recorder.phase("auth.login"):
+            await run_concurrently(_round_robin(ctx.accounts, ctx.requests), log_in, ctx.concurrency)
+
+
+async def events(ctx: BenchmarkContext):
+    """
+    Creates `events_per_user` events per account, then lists them and reads them back
+    `requests` times each.
+    """
+    starts = datetime.now(timezone.utc) + timedelta(days=7)
+
+    async with ctx.client(ctx.event_url) as client:
+        async def create(item: tuple[int, BenchUser]):
+            i, user = item
+            payload = {
+                "title": f"Benchmark event {i}",
+                "date": (starts + timedelta(hours=i)).isoformat(),
+                "description": "Created by the benchmark suite",
+                "location": "Online",
+                "tags": ["benchmark"],
+                "is_online": True,
+                "organizer_email": user.email,
+            }
+            response = await timed_request(ctx, client, "event.create", "POST", "/event/", json=payload)
+            if response is not None:
+                ctx.events.append((response.json()["id"], user.email))
+
+        organizers = [(i, user) for i, user in enumerate(ctx.accounts * ctx.events_per_user)]
+        with ctx.recorder.phase("event.create"):
+            await run_concurrently(organizers, create, ctx.concurrency)
+
+        async def list_all(_):
+            await timed_request(ctx, client, "event.list_all", "GET", "/event/all")
+
+        async def list_mine(user: BenchUser):
+            await timed_request(ctx, client, "event.list", "GET", "/event/", params={"user_email": user.email})
+
+        async def list_upcoming(user: BenchUser):
+            await timed_request(ctx, client, "event.upcoming", "GET", "/event/upcoming", params={"user_email": user.email, "days": 30})
+
+        async def detail(event: tuple[str, str]):
+            event_id, organizer = event
+            await timed_request(ctx, client, "event.detail", "GET", f"/event/{event_id}", params={"user_email": organizer})
+
+        with ctx.recorder.phase("event.list_all"):
+            await run_concurrently(range(ctx.requests), list_all, ctx.concurrency)
+        with ctx.recorder.phase("event.list"):
+            await run_concurrently(_round_robin(ctx.accounts, ctx.requests), list_mine, ctx.concurrency)
+        with ctx.recorder.phase("event.upcoming"):
+            await run_concurrently(_round_robin(ctx.accounts, ctx.requests), list_upcoming, ctx.concurrency)
+        with ctx.recorder.phase("event.detail"):
+            await run_concurrently(_round_robin(ctx.events, ctx.requests), detail, ctx.concurrency)
+
+
+async def members(ctx: BenchmarkContext):
+    """
+    Adds the next `members_per_event` accounts to every event created by `events`.
+    """
+    additions = []
+    for n, (event_id, organizer) in enumerate(ctx.events):
+        candidates = [user for user in ctx.accounts if user.email != organizer]
+        for k in range(min(ctx.members_per_event, len(candidates))):
+            additions.append((event_id, organizer, candidates[(n + k) % len(candidates)].email))
+
+    async with ctx.client(ctx.event_url) as client:
+        async def add(addition: tuple[str, str, str]):
+            event_id, organizer, email = addition
+            await timed_request(
+                ctx, client, "event_members.add", "POST", "/event-members/",
+                params={"organizer_email": organizer}, json={"event_id": event_id, "user_email": email},
+            )
+
+        with ctx.recorder.phase("event_members.add"):
+            await run_concurrently(additions, add, ctx.concurrency)
+
+
+async def reminders(ctx: BenchmarkContext):
+    """
+    Creates a reminder for the organizer of every event created by `events`.
+    """
+    remind_at = (datetime.now(timezone.utc) + timedelta(days=1)).isoformat()
+
+    async with ctx.client(ctx.event_url) as client:
+        async def create(event: tuple[str, str]):
+            event_id, organizer = event
+            payload = {"event_id": event_id, "user_email": organizer, "reminder_time": remind_at}
+            await timed_request(ctx, client, "reminder.create", "POST", "/reminder/", json=payload)
+
+        with ctx.recorder.phase("reminder.create"):
+            await run_concurrently(ctx.events, create, ctx.concurrency)
+
+
+async def websocket_rooms(ctx: BenchmarkContext):
+    """
+    Opens `rooms` x `room_users` signalling connections; every user then sends `messages`
+    chat messages. Each message is delivered to every user in its room, and the time from
+    send to each delivery is recorded as `ws.deliver`.
+    """
+    base = ctx.video_url.replace("http://", "ws://", 1).replace("https://", "wss://", 1).rstrip("/")
+    marker = f"bench-{ctx.run_id}"
+    sent_at: dict[str, float] = {}
+    expected = ctx.rooms * ctx.room_users * ctx.messages * ctx.room_users
+    delivered = 0
+    all_delivered = asyncio.Event()
+    connections = {}
+
+    async def open_connection(key: tuple[int, int]):
+        room, user = key
+        start = time.perf_counter()
+        try:
+            connections[key] = await websockets.connect(f"{base}/ws/{marker}-room-{room}/user-{user}", open_timeout=ctx.timeout)
+        except (OSError, websockets.WebSocketException, asyncio.TimeoutError) as e:
+            ctx.recorder.record_error("ws.connect", type(e).__name__)
+            return
+        ctx.recorder.record("ws.connect", time.perf_counter() - start)
+
+    async def read(connection):
+        nonlocal delivered
+        try:
+            async for raw in connection:
+                text = json.loads(raw).get("message", "")
+                if isinstance(text, str) and text.startswith(marker) and text in sent_at:
+                    ctx.recorder.record("ws.deliver", time.perf_counter() - sent_at[text])
+                    delivered += 1
+                    if delivered >= expected:
+                        all_delivered.set()
+        except websockets.ConnectionClosed:
+            pass
+
+    async def chat(key: tuple[int, int]):
+        connection = connections[key]
+        for n in range(ctx.messages):
+            text = f"{marker}:{key[0]}:{key[1]}:{n}"
+            sent_at[text] = time.perf_counter()
+            try:
+                await connection.send(json.dumps({"message": text}))
+            except websockets.ConnectionClosed:
+                ctx.recorder.record_error("ws.deliver", "ConnectionClosed")
+                return
+            await asyncio.sleep(ctx.message_interval)
+
+    keys = [(room, user) for room in range(ctx.rooms) for user in range(ctx.room_users)]
+    with ctx.recorder.phase("ws.connect"):
+        await run_concurrently(keys, open_connection, ctx.concurrency)
+
+    readers = [asyncio.create_task(read(connection)) for connection in connections.values()]
+    try:
+        with ctx.recorder.phase("ws.deliver"):
+            await asyncio.gather(*(chat(key) for key in connections))
+            try:
+                await asyncio.wait_for(all_delivered.wait(), timeout=ctx.timeout)
+            except asyncio.TimeoutError:
+                pass
+        missing = expected - delivered
+        for _ in range(max(0, missing)):
+            ctx.recorder.record_error("ws.deliver", "not delivered")
+    finally:
+        await asyncio.gather(*(connection.close() for connection in connections.values()), return_exceptions=True)
+        for reader in readers:
+            reader.cancel()
+        await asyncio.gather(*readers, return_exceptions=True)
@@ -0,0 +1,86 @@
+import math
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """
+    Returns the q-th percentile of already sorted values, interpolating between closest ranks.
+
+    Args:
+        sorted_values (list[float]): The samples, in ascending order.
+        q (float): The percentile, between 0 and 100.
+
+    Returns:
+        float: The percentile, or NaN if there are no samples.
+    """
+    if not sorted_values:
+        return math.nan
+    rank = (len(sorted_values) - 1) * q / 100
+    low, high = math.floor(rank), math.ceil(rank)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (rank - low)
+
+
+class Recorder:
+    """
+    Collects the latency and outcome of every operation, grouped by operation name.
+
+    Each benchmark phase is timed as a whole as well, so throughput is the number of
+    successful operations divided by the wall-clock time of the phase that ran them.
+    """
+
+    def __init__(self):
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, Counter[str]] = defaultdict(Counter)
+        self.durations: dict[str, float] = defaultdict(float)
+
+    def record(self, operation: str, seconds: float):
+        self.latencies[operation].append(seconds)
+
+    def record_error(self, operation: str, reason: str):
+        self.errors[operation][reason] += 1
+
+    @contextmanager
+    def phase(self, *operations: str):
+        """
+        Times a phase and charges its wall-clock duration to each operation it runs.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            for operation in operations:
+                self.durations[operation] += elapsed
+
+    def summary(self) -> dict[str, dict]:
+        """
+        Returns, per operation, the number of successes and errors, throughput and
+        latency percentiles in milliseconds.
+        """
+        results = {}
+        for operation in sorted(set(self.latencies) | set(self.errors)):
+            samples = sorted(self.latencies.get(operation, []))
+            duration = self.durations.get(operation, 0.0)
+            results[operation] = {
+                "count": len(samples),
+                "errors": sum(self.errors[operation].values()),
+                "error_reasons": dict(self.errors[operation].most_common(5)),
+                "duration_s": round(duration, 3),
+                "throughput_rps": round(len(samples) / duration, 2) if duration else None,
+                "latency_ms": {
+                    "min": _ms(samples[0] if samples else math.nan),
+                    "p50": _ms(percentile(samples, 50)),
+                    "p95": _ms(percentile(samples, 95)),
+                    "p99": _ms(percentile(samples, 99)),
+                    "max": _ms(samples[-1] if samples else math.nan),
+                    "mean": _ms(sum(samples) / len(samples) if samples else math.nan),
+                },
+            }
+        return results
+
+
+def _ms(seconds: float) -> float | None:
+    # JSON has no NaN; operations without samples report null
+    return None if math.isnan(seconds) else round(seconds * 1000, 3)